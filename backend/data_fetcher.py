@@ -8,16 +8,27 @@ Fetches historical daily bars from Interactive Brokers for:
 - Real-time market data for scanning
 """
 
-from ib_insync import IB, Stock, MarketOrder, LimitOrder, util
+from ib_insync import IB, BarDataList, Contract, Stock, MarketOrder, LimitOrder, util
 from datetime import datetime, date, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Union
 import asyncio
+import concurrent.futures
+import functools
 import logging
+import math
 import os
+import threading
+import time
+from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
-import nest_asyncio
+import numpy as np
+
+try:
+    import uvloop   # installed with uvicorn[standard]
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
 
-nest_asyncio.apply()
 load_dotenv()
 
 logger = logging.getLogger(__name__)
@@ -29,32 +40,329 @@ logger = logging.getLogger(__name__)
 logging.getLogger('ib_insync.wrapper').setLevel(logging.ERROR)
 logging.getLogger('ib_insync.client').setLevel(logging.ERROR)
 
+ET = ZoneInfo("America/New_York")
+
+PRICE_WAIT_SINGLE = 2.0    # max seconds to wait for a single symbol's tick
+PRICE_WAIT_MULTI = 3.0     # max seconds to wait for a batch of ticks
+
+HIST_BATCH_CONCURRENCY = 5  # max in-flight reqHistoricalData calls per batch
+COMPANY_DETAILS_TTL = 24 * 3600  # seconds — name/industry never change intraday
+
+# Max live keepUpToDate historical subscriptions — IB caps simultaneous open
+# historical requests at 50, so leave headroom for one-shot requests
+HIST_STREAM_MAX = int(os.getenv('HIST_STREAM_MAX', '40'))
+
+# Client-side pacing for reqHistoricalData (IB rejects bursts with pacing
+# violations).  Raw API messages are already throttled by ib_insync's client.
+HIST_REQ_RATE = float(os.getenv('IB_HIST_REQ_RATE', '2'))    # sustained requests per second
+HIST_REQ_BURST = HIST_BATCH_CONCURRENCY                       # requests allowed back-to-back
+
+# Extra client connections opened by IBConnectionPool (IB paces historical
+# data per client, so sharding across connections multiplies throughput)
+IB_POOL_SIZE = int(os.getenv('IB_POOL_SIZE', '4'))
+
+# Opt-in on-disk cache of daily bars (one .npy per symbol); unset disables it
+HIST_CACHE_DIR = os.getenv('HIST_CACHE_DIR', '')
+HIST_CACHE_SLACK_DAYS = 7  # a '1 Y' window may start a few days in (weekends/holidays)
+
+QUALIFY_COALESCE_WINDOW = 0.01  # seconds to gather concurrent qualifications into one call
+QUALIFY_FAILURE_TTL = 60.0      # seconds before a symbol IB could not qualify is retried
+CONNECTION_CHECK_INTERVAL = 5.0  # seconds between authoritative isConnected() re-checks
+
+# Order statuses after which no fill will ever arrive
+TERMINAL_ORDER_STATUSES = ('Cancelled', 'ApiCancelled', 'Inactive', 'Error')
+
+
+def _ticker_price(ticker) -> Optional[float]:
+    """Return the last traded price (falling back to close), or None if not yet populated."""
+    for price in (ticker.last, ticker.close):
+        if price and not math.isnan(price):
+            return float(price)
+    return None
+
+
+# Column layout for bars held as a NumPy structured array (one contiguous
+# column per field, so indicators are plain slice + reduce operations)
+BAR_DTYPE = np.dtype([
+    ('date', 'datetime64[D]'),
+    ('open', 'f8'),
+    ('high', 'f8'),
+    ('low', 'f8'),
+    ('close', 'f8'),
+    ('volume', 'i8'),
+])
+
+
+def bars_to_array(bars) -> np.ndarray:
+    """
+    Return daily bars as a BAR_DTYPE structured array (most recent last).
+
+    Accepts a list of bar dicts (fetcher / DB layout) or an array that is
+    already structured, which is returned unchanged.
+    """
+    if isinstance(bars, np.ndarray):
+        return bars
+    return np.fromiter(
+        ((b['date'], b['open'], b['high'], b['low'], b['close'], b['volume']) for b in bars),
+        dtype=BAR_DTYPE,
+        count=len(bars),
+    )
+
+
+# Calendar days covered by one unit of an IB duration string
+_DURATION_DAYS = {'D': 1, 'W': 7, 'M': 31, 'Y': 366}
+
+
+def _duration_days(duration: str) -> Optional[int]:
+    """Return the calendar-day span of an IB duration string ('30 D', '1 Y'), or None."""
+    try:
+        count, unit = duration.split()
+        return int(count) * _DURATION_DAYS[unit.upper()]
+    except (ValueError, KeyError):
+        return None
+
+
+def _bar_day(value) -> date:
+    """Return the calendar date of a bar's date field (date or datetime)."""
+    return value.date() if isinstance(value, datetime) else value
+
+
+@functools.lru_cache(maxsize=4)
+def last_completed_bar_date_on(today: date) -> date:
+    """
+    Date of the most recent completed daily bar as of the ET date `today`
+    (memoized — it's pure per day): yesterday on a weekday, Friday on a
+    weekend.  Today's bar is partial until the session closes.
+    """
+    weekday = today.weekday()  # 0=Mon … 6=Sun
+    if weekday == 5:           # Saturday → last completed bar was Friday
+        return today - timedelta(days=1)
+    if weekday == 6:           # Sunday → last completed bar was Friday
+        return today - timedelta(days=2)
+    # Weekday: last completed bar is yesterday
+    return today - timedelta(days=1)
+
+
+def _empty_bars() -> np.ndarray:
+    """Return a zero-length BAR_DTYPE array (the 'no data' result)."""
+    return np.empty(0, dtype=BAR_DTYPE)
+
+
+def _trim_to_span(bars: np.ndarray, span: int) -> np.ndarray:
+    """Return the tail of a date-sorted bar array covering the last `span` calendar days."""
+    cutoff = np.datetime64(date.today() - timedelta(days=span), 'D')
+    return bars[np.searchsorted(bars['date'], cutoff):]
+
+
+def _load_bars(path: str) -> np.ndarray:
+    """Load a cached bar array, or return an empty one if missing/unreadable."""
+    try:
+        bars = np.load(path, allow_pickle=False)
+    except (OSError, ValueError):
+        return _empty_bars()
+    return bars if bars.dtype == BAR_DTYPE else _empty_bars()
+
+
+def _save_bars(path: str, bars: np.ndarray) -> None:
+    """Write a bar array to `path` atomically (temp file + os.replace)."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        np.save(f, bars)
+    os.replace(tmp, path)
+
+
+def _ib_bars_to_array(bars) -> np.ndarray:
+    """Convert ib_insync BarData objects to a BAR_DTYPE structured array."""
+    # One reqHistoricalData result is homogeneous — all datetime (intraday bars)
+    # or all date (daily bars) — so decide the date conversion once, not per bar
+    if len(bars) and isinstance(bars[0].date, datetime):
+        rows = ((b.date.date(), b.open, b.high, b.low, b.close, b.volume) for b in bars)
+    else:
+        rows = ((b.date, b.open, b.high, b.low, b.close, b.volume) for b in bars)
+    return np.fromiter(rows, dtype=BAR_DTYPE, count=len(bars))
+
+
+class RateLimiter:
+    """
+    Async token bucket: `rate` tokens per second, holding at most `burst`.
+
+    acquire() reserves its tokens immediately (the balance may go negative)
+    and sleeps until the reservation is covered, so concurrent callers are
+    admitted in arrival order at the configured rate without a refill task.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+
+    async def acquire(self, cost: float = 1.0) -> None:
+        """Wait until `cost` tokens are available, then consume them."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= cost
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+class Coalescer:
+    """
+    Micro-batcher: keys submitted within `window` seconds of each other are
+    handed to `batch_fn` in a single call.
+
+    A key already waiting or in flight shares that batch's future, so
+    concurrent callers never duplicate work.  Must be used from one event loop.
+    """
+
+    def __init__(self, batch_fn, window: float):
+        self._batch_fn = batch_fn        # async fn(keys: List[str]) -> None
+        self.window = window
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set = set()
+
+    async def submit(self, keys: List[str]) -> None:
+        """Wait until every key in `keys` has been through a batch_fn call."""
+        loop = asyncio.get_running_loop()
+        futures = []
+        for key in keys:
+            fut = self._pending.get(key) or self._inflight.get(key)
+            if fut is None:
+                fut = loop.create_future()
+                self._pending[key] = fut
+            futures.append(fut)
+        if self._pending and self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        await asyncio.gather(*futures)
+
+    def _flush(self):
+        self._timer = None
+        batch, self._pending = self._pending, {}
+        self._inflight.update(batch)
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: Dict[str, asyncio.Future]):
+        try:
+            await self._batch_fn(list(batch))
+        except Exception as e:
+            for fut in batch.values():
+                if not fut.done():
+                    fut.set_exception(e)
+        else:
+            for fut in batch.values():
+                if not fut.done():
+                    fut.set_result(None)
+        finally:
+            for key in batch:
+                self._inflight.pop(key, None)
+
 
 class DataFetcher:
     """Fetches historical and real-time data from Interactive Brokers."""
 
     def __init__(self):
-        self.ib = IB()
         self._connected = False  # internal flag; use .connected property to read
+        self._last_check = 0.0   # monotonic time of the last verify_connection()
+
+        # ib_insync runs on one dedicated event loop thread. Sync methods submit
+        # their coroutine to it and block on the result; AsyncDataFetcher awaits
+        # the same futures — no loop re-entry, so nest_asyncio is not needed.
+        self._loop = _new_event_loop()   # uvloop when available
+        self._thread = threading.Thread(target=self._run_loop, name='ib-loop', daemon=True)
+        self._thread.start()
+        self.ib = self._new_ib()
 
         self.host = os.getenv('IB_HOST', '127.0.0.1')
         self.port = int(os.getenv('IB_PORT', '7497'))
         self.client_id = int(os.getenv('IB_CLIENT_ID', '1'))
 
+        # One Stock object per symbol for the life of the fetcher; qualification
+        # fills it in place, so the same instance is reused by every call site
+        self._stock_pool: Dict[str, Stock] = {}
+
+        # Per-session lookup caches — both are cleared on disconnect()
+        # symbol -> qualified Contract, or the monotonic time until which a
+        # symbol IB could not qualify is reported missing without asking again
+        self._contract_cache: Dict[str, Union[Contract, float]] = {}
+        self._details_cache: Dict[str, Tuple[float, Dict]] = {}      # symbol -> (fetched_at, details)
+
+        # Live keepUpToDate bar subscriptions — IB appends/updates bars in place,
+        # so repeat requests are served locally. Cancelled on disconnect().
+        self._hist_cache: Dict[Tuple[str, str], Tuple[int, BarDataList]] = {}  # (symbol, bar_size) -> (span_days, bars)
+
+        # Shared pacing budget for every historical request on this connection
+        self._hist_limiter = RateLimiter(HIST_REQ_RATE, HIST_REQ_BURST)
+
+        # Qualifications requested within QUALIFY_COALESCE_WINDOW share one IB call
+        self._qualifier = Coalescer(self._qualify_batch_async, QUALIFY_COALESCE_WINDOW)
+
+    def _run_loop(self):
+        """Body of the ib-loop thread."""
+        # ib_insync's util.getLoop() asks the policy for the *current* loop, not
+        # the running one, and off the main thread there is none unless it is
+        # set here (nest_asyncio used to paper over this)
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def submit(self, coro) -> concurrent.futures.Future:
+        """Schedule `coro` on the IB loop thread and return its concurrent Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def _run(self, coro):
+        """Run `coro` on the IB loop thread and block until it returns."""
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("DataFetcher sync method called from the IB loop thread — await the *_async variant")
+        return self.submit(coro).result()
+
+    def _new_ib(self) -> IB:
+        """Create an IB client whose connect/disconnect events keep _connected in sync."""
+        ib = IB()
+        ib.connectedEvent += self._on_connected
+        ib.disconnectedEvent += self._on_disconnected
+        return ib
+
+    def _on_connected(self):
+        self._connected = True
+
+    def _on_disconnected(self):
+        if self._connected:
+            logger.warning("⚠️ IB connection lost (disconnectedEvent) — resetting state")
+        self._connected = False
+
     @property
     def connected(self) -> bool:
         """
-        True only when the ib_insync socket is actually connected.
+        True while the ib_insync socket is connected.
+
+        Reads the cached flag, which ib.connectedEvent / ib.disconnectedEvent
+        keep current — a silent drop (network hiccup, IB Gateway restart) fires
+        disconnectedEvent, so no socket probe is needed on every call.  As a
+        backstop, a "connected" flag is re-verified against ib.isConnected()
+        at most once every CONNECTION_CHECK_INTERVAL seconds.
+        """
+        if self._connected and time.monotonic() - self._last_check >= CONNECTION_CHECK_INTERVAL:
+            return self.verify_connection()
+        return self._connected
 
-        Uses ib.isConnected() as the authoritative source so that a silent
-        drop (network hiccup, IB Gateway restart, data-farm blip) is detected
-        immediately — even if our code never called disconnect().
+    def verify_connection(self) -> bool:
         """
+        Authoritative connection check against ib.isConnected().
+
+        Called periodically (status heartbeat) to catch a drop the event
+        might have missed; resyncs the cached flag and returns the real state.
+        """
+        self._last_check = time.monotonic()
         real = self.ib.isConnected()
         if self._connected and not real:
-            # Socket dropped underneath us — sync our flag
             logger.warning("⚠️ IB connection lost (detected via isConnected check) — resetting state")
-            self._connected = False
+        self._connected = real
         return real
 
     @connected.setter
@@ -64,14 +372,20 @@ class DataFetcher:
 
     def connect(self) -> bool:
         """Connect to Interactive Brokers."""
+        return self._run(self.connect_async())
+
+    async def connect_async(self) -> bool:
+        """Coroutine behind connect."""
         try:
-            if self.connected:          # already live — nothing to do
+            if self.ib.isConnected():   # already live — nothing to do
+                self._connected = True
                 return True
             # Re-create the IB object if the previous socket is in a broken state
-            if self._connected and not self.ib.isConnected():
+            if self._connected:
                 logger.info("🔄 Re-creating IB socket after silent disconnect…")
-                self.ib = IB()
-            self.ib.connect(self.host, self.port, clientId=self.client_id)
+                self.ib = self._new_ib()
+            self._hist_cache.clear()    # subscriptions never survive a new session
+            await self.ib.connectAsync(self.host, self.port, clientId=self.client_id)
             self.ib.reqMarketDataType(3)  # Delayed market data (free)
             self._connected = True
             logger.info(f"✅ Connected to IB at {self.host}:{self.port}")
@@ -82,14 +396,82 @@ class DataFetcher:
             return False
 
     def disconnect(self):
-        """Disconnect from Interactive Brokers."""
+        """
+        Disconnect from Interactive Brokers.
+
+        Returns immediately: .connected reads False at once, and the socket
+        teardown is queued on the IB loop thread instead of waited on.
+        """
+        self._connected = False     # cleared first so disconnectedEvent isn't reported as a drop
+        self._loop.call_soon_threadsafe(self._teardown)
+
+    async def disconnect_async(self):
+        """Coroutine behind disconnect."""
+        self._connected = False
+        self._teardown()
+
+    def _teardown(self):
+        """Drop session caches and close the socket (runs on the IB loop thread)."""
+        # keepUpToDate subscriptions end with the socket — no per-subscription cancel
+        self._hist_cache.clear()
+        self._contract_cache.clear()
+        self._details_cache.clear()
         if self.ib.isConnected():
             self.ib.disconnect()
-        self._connected = False
         logger.info("Disconnected from IB")
+
+    async def _ensure_connected_async(self) -> bool:
+        """Return True if connected, connecting first when needed."""
+        return self.connected or await self.connect_async()
+
+    def _get_contract(self, symbol: str) -> Stock:
+        """Return the pooled (possibly not yet qualified) Stock for `symbol`."""
+        contract = self._stock_pool.get(symbol)
+        if contract is None:
+            contract = Stock(symbol, 'SMART', 'USD')
+            self._stock_pool[symbol] = contract
+        return contract
+
+    async def _qualify_async(self, symbol: str):
+        """Return the qualified Contract for `symbol`, or None if IB cannot qualify it."""
+        qualified = await self._qualify_many_async([symbol])
+        return qualified[0] if qualified else None
+
+    async def _qualify_many_async(self, symbols: List[str]) -> list:
+        """
+        Return qualified Contracts for `symbols` (unqualifiable symbols are omitted).
+
+        Qualified contracts are cached per symbol for the life of the connection,
+        and failures for QUALIFY_FAILURE_TTL seconds, so only symbols seen for
+        the first time cost an IB round-trip — and those go through the
+        coalescer, which merges every qualification requested by concurrent
+        callers within a few milliseconds into one qualifyContracts call.
+        """
+        now = time.monotonic()
+        missing = []
+        for symbol in symbols:
+            entry = self._contract_cache.get(symbol)
+            if entry is None or (isinstance(entry, float) and entry <= now):
+                missing.append(symbol)
+        if missing:
+            await self._qualifier.submit(missing)
+        cached = [self._contract_cache.get(s) for s in symbols]
+        return [contract for contract in cached if isinstance(contract, Contract)]
+
+    async def _qualify_batch_async(self, symbols: List[str]) -> None:
+        """Qualify `symbols` in one IB call, caching the contracts and the failures."""
+        qualified = await self.ib.qualifyContractsAsync(
+            *[self._get_contract(s) for s in symbols])
+        for contract in qualified:
+            self._contract_cache[contract.symbol] = contract
+        # Only a definitive "not found" is cached — a raised error is not
+        retry_at = time.monotonic() + QUALIFY_FAILURE_TTL
+        for symbol in symbols:
+            if not isinstance(self._contract_cache.get(symbol), Contract):
+                self._contract_cache[symbol] = retry_at
     
     def fetch_historical_bars(self, symbol: str, duration: str = '1 Y', 
-                             bar_size: str = '1 day') -> List[Dict]:
+                             bar_size: str = '1 day') -> np.ndarray:
         """
         Fetch historical bars for a symbol.
         
@@ -99,83 +481,226 @@ class DataFetcher:
             bar_size: Bar size (e.g., '1 day', '1 hour')
             
         Returns:
-            List of bars with date, open, high, low, close, volume
+            BAR_DTYPE structured array (date, open, high, low, close, volume),
+            oldest first; empty on failure
         """
-        if not self.connected:
-            if not self.connect():
-                return []
-        
+        return self._run(self.fetch_historical_bars_async(symbol, duration, bar_size))
+
+    async def fetch_historical_bars_async(self, symbol: str, duration: str = '1 Y',
+                                          bar_size: str = '1 day') -> np.ndarray:
+        """Coroutine behind fetch_historical_bars."""
+        if not await self._ensure_connected_async():
+            return _empty_bars()
+
         try:
-            # Qualify the contract
-            contract = Stock(symbol, 'SMART', 'USD')
-            qualified = self.ib.qualifyContracts(contract)
-            
-            if not qualified:
+            # Qualify the contract (cached after first use)
+            contract = await self._qualify_async(symbol)
+
+            if contract is None:
                 logger.warning(f"⚠️ Could not qualify contract for {symbol}")
-                return []
-            
-            contract = qualified[0]
-            
-            # Request historical data
-            bars = self.ib.reqHistoricalData(
-                contract,
-                endDateTime='',
-                durationStr=duration,
-                barSizeSetting=bar_size,
-                whatToShow='TRADES',
-                useRTH=True,  # Regular trading hours only
-                formatDate=1
-            )
+                return _empty_bars()
+
+            # Request historical data as a columnar structured array
+            result = await self._fetch_bars_array_async(contract, duration, bar_size)
             
-            if not bars:
+            if not len(result):
                 logger.warning(f"⚠️ No historical data for {symbol}")
-                return []
-            
-            # Convert to dict format
-            result = []
-            for bar in bars:
-                result.append({
-                    'date': bar.date.date() if hasattr(bar.date, 'date') else bar.date,
-                    'open': float(bar.open),
-                    'high': float(bar.high),
-                    'low': float(bar.low),
-                    'close': float(bar.close),
-                    'volume': int(bar.volume)
-                })
+                return result
             
             logger.info(f"✅ Fetched {len(result)} bars for {symbol}")
             return result
             
         except Exception as e:
             logger.error(f"❌ Error fetching data for {symbol}: {e}")
-            return []
+            return _empty_bars()
     
+    def fetch_historical_bars_batch(self, symbols: List[str], duration: str = '1 Y',
+                                    bar_size: str = '1 day',
+                                    concurrency: int = HIST_BATCH_CONCURRENCY) -> Dict[str, np.ndarray]:
+        """
+        Fetch historical bars for many symbols in one pipelined pass.
+
+        Uncached contracts are qualified in a single qualifyContracts round-trip, then
+        up to `concurrency` reqHistoricalData requests are kept in flight at once
+        instead of paying qualify + history RTTs serially per symbol.
+
+        Returns:
+            Dict mapping symbol -> BAR_DTYPE array (same layout as fetch_historical_bars).
+            Symbols that could not be qualified or returned no data map to an empty array.
+        """
+        return self._run(
+            self.fetch_historical_bars_batch_async(symbols, duration, bar_size, concurrency)
+        )
+
+    async def fetch_historical_bars_batch_async(self, symbols: List[str], duration: str = '1 Y',
+                                                bar_size: str = '1 day',
+                                                concurrency: int = HIST_BATCH_CONCURRENCY) -> Dict[str, np.ndarray]:
+        """Coroutine behind fetch_historical_bars_batch."""
+        if not await self._ensure_connected_async():
+            return {}
+
+        try:
+            qualified = await self._qualify_many_async(symbols)
+        except Exception as e:
+            logger.error(f"❌ Error fetching batch historical data: {e}")
+            return {}
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch_one(contract):
+            async with semaphore:
+                try:
+                    bars = await self._fetch_bars_array_async(contract, duration, bar_size)
+                except Exception as e:
+                    logger.error(f"❌ Error fetching data for {contract.symbol}: {e}")
+                    return contract.symbol, _empty_bars()
+            if not len(bars):
+                logger.warning(f"⚠️ No historical data for {contract.symbol}")
+            return contract.symbol, bars
+
+        results: Dict[str, np.ndarray] = {symbol: _empty_bars() for symbol in symbols}
+        results.update(await asyncio.gather(*(fetch_one(c) for c in qualified)))
+
+        fetched = sum(1 for bars in results.values() if len(bars))
+        logger.info(f"✅ Fetched bars for {fetched}/{len(symbols)} symbols ({duration})")
+        return results
+    
+    async def _fetch_bars_array_async(self, contract: Contract, duration: str,
+                                      bar_size: str) -> np.ndarray:
+        """
+        Return historical bars for a qualified contract as a BAR_DTYPE array.
+
+        With HIST_CACHE_DIR set, daily bars are also kept on disk.  When no live
+        subscription covers the request, a warm file is served directly if it
+        ends on the last completed session, or topped up with a small delta request from its last bar
+        (re-fetched, as it may have been partial) — so a restart does not
+        re-download the full window for every symbol.
+        """
+        path = self._disk_cache_path(contract.symbol, bar_size)
+        span = _duration_days(duration)
+        live = self._hist_cache.get((contract.symbol, bar_size))
+        if path is None or span is None or (live is not None and live[0] >= span):
+            return _ib_bars_to_array(await self._req_bars_async(contract, duration, bar_size))
+
+        cached = _load_bars(path)
+        today = datetime.now(ET).date()
+        cutoff = np.datetime64(today - timedelta(days=span - HIST_CACHE_SLACK_DAYS), 'D')
+
+        if len(cached) and cached['date'][0] <= cutoff:
+            last = cached['date'][-1].item()
+            # Only a file ending on the last completed session is final; one
+            # ending on today holds a partial bar and goes through the delta
+            if last == last_completed_bar_date_on(today):
+                return _trim_to_span(cached, span)
+            delta = _ib_bars_to_array(await self._req_bars_async(
+                contract, f'{(today - last).days + 1} D', bar_size, stream=False))
+            if not len(delta):
+                return _trim_to_span(cached, span)
+            keep = cached[:np.searchsorted(cached['date'], delta['date'][0])]
+            bars = np.concatenate([keep, delta])
+        else:
+            bars = _ib_bars_to_array(await self._req_bars_async(contract, duration, bar_size))
+
+        if len(bars):
+            try:
+                _save_bars(path, bars)
+            except OSError as e:
+                logger.warning(f"⚠️ Could not write bar cache for {contract.symbol}: {e}")
+        return _trim_to_span(bars, span)
+
+    def _disk_cache_path(self, symbol: str, bar_size: str) -> Optional[str]:
+        """Return the on-disk cache file for daily bars of `symbol`, or None when disabled."""
+        if not HIST_CACHE_DIR or bar_size != '1 day':
+            return None
+        return os.path.join(HIST_CACHE_DIR, f"{symbol}_1d.npy")
+
+    async def _req_bars_async(self, contract: Contract, duration: str, bar_size: str,
+                              stream: bool = True) -> list:
+        """
+        Return historical bars for a qualified contract.
+
+        The first request per (symbol, bar_size) opens a keepUpToDate subscription
+        and keeps the BarDataList; IB then updates the latest bar in place, so any
+        later request whose span fits inside it is answered locally with no RTT.
+        A longer span re-subscribes.  Once HIST_STREAM_MAX subscriptions are live,
+        further symbols fall back to plain one-shot requests, as do requests made
+        with stream=False.
+        """
+        key = (contract.symbol, bar_size)
+        span = _duration_days(duration)
+        cached = self._hist_cache.get(key)
+
+        if cached is not None and span is not None and span <= cached[0]:
+            cached_span, bars = cached
+            if span == cached_span:
+                return bars
+            cutoff = date.today() - timedelta(days=span)
+            return [b for b in bars if _bar_day(b.date) >= cutoff]
+
+        if stream and cached is not None:
+            # Requested span is longer than the live subscription — replace it
+            self.ib.cancelHistoricalData(cached[1])
+            del self._hist_cache[key]
+
+        stream = stream and span is not None and len(self._hist_cache) < HIST_STREAM_MAX
+        await self._hist_limiter.acquire()
+        bars = await self.ib.reqHistoricalDataAsync(
+            contract,
+            endDateTime='',
+            durationStr=duration,
+            barSizeSetting=bar_size,
+            whatToShow='TRADES',
+            useRTH=True,  # Regular trading hours only
+            formatDate=1,
+            keepUpToDate=stream
+        )
+        if stream:
+            if bars:
+                self._hist_cache[key] = (span, bars)
+            else:
+                self.ib.cancelHistoricalData(bars)
+        return bars
+
+    def fetch_latest_bar(self, symbol: str, bar_size: str = '1 day') -> Optional[Dict]:
+        """
+        Return the most recent bar for `symbol` from its live subscription, or None.
+
+        Costs no IB round-trip; returns None until fetch_historical_bars() has
+        opened a subscription for the symbol in this session.
+        """
+        cached = self._hist_cache.get((symbol, bar_size))
+        if cached is None or not cached[1]:
+            return None
+        bar = cached[1][-1]
+        return {
+            'date': _bar_day(bar.date),
+            'open': float(bar.open),
+            'high': float(bar.high),
+            'low': float(bar.low),
+            'close': float(bar.close),
+            'volume': int(bar.volume)
+        }
+
     def fetch_current_price(self, symbol: str) -> Optional[float]:
         """Get current market price for a symbol."""
-        if not self.connected:
-            if not self.connect():
-                return None
-        
+        return self._run(self.fetch_current_price_async(symbol))
+
+    async def fetch_current_price_async(self, symbol: str) -> Optional[float]:
+        """Coroutine behind fetch_current_price."""
+        if not await self._ensure_connected_async():
+            return None
+
         try:
-            contract = Stock(symbol, 'SMART', 'USD')
-            qualified = self.ib.qualifyContracts(contract)
-            
-            if not qualified:
+            contract = await self._qualify_async(symbol)
+
+            if contract is None:
                 return None
-            
-            contract = qualified[0]
-            
-            # Request market data
-            ticker = self.ib.reqMktData(contract, '', False, False)
-            self.ib.sleep(2)  # Wait for data
-            
-            # Try to get the last traded price
-            price = ticker.last if ticker.last else ticker.close
-            
-            # Cancel market data subscription
-            self.ib.cancelMktData(contract)
-            
-            return float(price) if price else None
+
+            # One-shot snapshot: IB completes it server-side, so it holds no
+            # streaming line and needs no cancelMktData afterwards
+            ticker = self.ib.reqMktData(contract, '', snapshot=True, regulatorySnapshot=False)
+            await self._wait_for_prices([ticker], PRICE_WAIT_SINGLE)
+            return _ticker_price(ticker)
             
         except Exception as e:
             logger.error(f"❌ Error fetching price for {symbol}: {e}")
@@ -191,70 +716,106 @@ class DataFetcher:
         Returns:
             Dictionary mapping symbol to current price
         """
-        if not self.connected:
-            if not self.connect():
-                return {}
-        
-        prices = {}
-        
+        return self._run(self.fetch_multiple_prices_async(symbols))
+
+    async def fetch_multiple_prices_async(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        Coroutine behind fetch_multiple_prices.
+
+        Uses reqTickersAsync, which requests one-shot snapshots for every contract
+        concurrently and needs no cancel afterwards — no streaming market-data
+        lines are held and no fixed sleep is paid. PRICE_WAIT_MULTI bounds the
+        wait; symbols whose snapshot has not arrived by then are simply omitted.
+        """
+        if not await self._ensure_connected_async():
+            return {}
+
         try:
-            # Qualify all contracts
-            contracts = [Stock(symbol, 'SMART', 'USD') for symbol in symbols]
-            qualified = self.ib.qualifyContracts(*contracts)
-            
+            # Qualify all contracts (only symbols not already cached hit IB)
+            qualified = await self._qualify_many_async(symbols)
+
             if not qualified:
                 logger.warning("⚠️ No contracts qualified")
                 return {}
-            
-            # Request market data for all
-            tickers = []
-            for contract in qualified:
-                ticker = self.ib.reqMktData(contract, '', False, False)
-                tickers.append((contract.symbol, ticker))
-            
-            # Wait for data to populate
-            self.ib.sleep(3)
-            
-            # Extract prices
-            for symbol, ticker in tickers:
-                price = ticker.last if ticker.last else ticker.close
-                if price:
-                    prices[symbol] = float(price)
-                
-                # Cancel subscription
-                self.ib.cancelMktData(ticker.contract)
-            
-            logger.info(f"✅ Fetched prices for {len(prices)}/{len(symbols)} symbols")
-            return prices
-            
+
+            try:
+                tickers = await asyncio.wait_for(
+                    self.ib.reqTickersAsync(*qualified), PRICE_WAIT_MULTI
+                )
+            except asyncio.TimeoutError:
+                # Keep whatever snapshots arrived before the deadline
+                tickers = [t for t in (self.ib.ticker(c) for c in qualified) if t is not None]
         except Exception as e:
             logger.error(f"❌ Error fetching multiple prices: {e}")
-            return prices
+            return {}
+
+        prices = {}
+        for ticker in tickers:
+            price = _ticker_price(ticker)
+            if price is not None:
+                prices[ticker.contract.symbol] = price
+        
+        logger.info(f"✅ Fetched prices for {len(prices)}/{len(symbols)} symbols")
+        return prices
+    
+    async def _wait_for_prices(self, tickers: list, timeout: float) -> None:
+        """
+        Wait until every ticker has been updated with a usable price since this
+        call, or until `timeout` seconds pass.
+
+        Listens on each ticker's updateEvent, so the call returns as soon as IB
+        has delivered the ticks we need.  ib_insync reuses one Ticker per
+        contract, so a price left over from an earlier request does not count.
+        """
+        pending = {id(t) for t in tickers}
+        done = asyncio.Event()
+
+        def on_update(ticker, *_args):
+            if _ticker_price(ticker) is not None:
+                pending.discard(id(ticker))
+                if not pending:
+                    done.set()
+
+        for ticker in tickers:
+            ticker.updateEvent += on_update
+        try:
+            await asyncio.wait_for(done.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            for ticker in tickers:
+                ticker.updateEvent -= on_update
     
     def fetch_company_details(self, symbol: str) -> Dict:
-        """Fetch company name and sector."""
-        if not self.connected:
-            if not self.connect():
-                return {'name': symbol, 'sector': ''}
-        
+        """Fetch company name and sector (cached for COMPANY_DETAILS_TTL seconds)."""
+        return self._run(self.fetch_company_details_async(symbol))
+
+    async def fetch_company_details_async(self, symbol: str) -> Dict:
+        """Coroutine behind fetch_company_details."""
+        cached = self._details_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[0] < COMPANY_DETAILS_TTL:
+            return dict(cached[1])
+
+        if not await self._ensure_connected_async():
+            return {'name': symbol, 'sector': ''}
+
         try:
-            contract = Stock(symbol, 'SMART', 'USD')
-            qualified = self.ib.qualifyContracts(contract)
-            
-            if not qualified:
+            contract = await self._qualify_async(symbol)
+
+            if contract is None:
                 return {'name': symbol, 'sector': ''}
-            
-            contract = qualified[0]
-            
+
             # Request contract details
-            details = self.ib.reqContractDetails(contract)
+            details = await self.ib.reqContractDetailsAsync(contract)
             
             if details:
                 detail = details[0]
-                return {
+                result = {
                     'name': detail.longName if hasattr(detail, 'longName') else symbol,
                     'sector': detail.industry if hasattr(detail, 'industry') else ''
                 }
+                self._details_cache[symbol] = (time.monotonic(), result)
+                return dict(result)
             
             return {'name': symbol, 'sector': ''}
             
@@ -262,36 +823,34 @@ class DataFetcher:
             logger.error(f"❌ Error fetching details for {symbol}: {e}")
             return {'name': symbol, 'sector': ''}
     
-    def get_52_week_range(self, bars: List[Dict]) -> tuple:
+    def get_52_week_range(self, bars) -> tuple:
         """
         Calculate 52-week high and low from bars.
         
         Args:
-            bars: List of daily bars (at least 252 trading days for 1 year)
+            bars: Daily bars as a list of dicts or a BAR_DTYPE array
+                  (at least 252 trading days for 1 year)
             
         Returns:
             Tuple of (52_week_high, 52_week_low)
         """
-        if not bars or len(bars) < 252:
+        if len(bars) < 252:
             logger.warning(f"⚠️ Insufficient data for 52-week range (need 252, got {len(bars)})")
             # Use what we have
-            if not bars:
+            if len(bars) == 0:
                 return (0, 0)
         
         # Get last 252 bars (1 year)
-        recent_bars = bars[-252:] if len(bars) >= 252 else bars
-        
-        highs = [bar['high'] for bar in recent_bars]
-        lows = [bar['low'] for bar in recent_bars]
+        recent = bars_to_array(bars)[-252:]
         
-        return (max(highs), min(lows))
+        return (float(recent['high'].max()), float(recent['low'].min()))
     
-    def calculate_moving_average(self, bars: List[Dict], period: int) -> Optional[float]:
+    def calculate_moving_average(self, bars, period: int) -> Optional[float]:
         """
         Calculate simple moving average from bars.
         
         Args:
-            bars: List of daily bars (most recent last)
+            bars: Daily bars as a list of dicts or a BAR_DTYPE array (most recent last)
             period: MA period (e.g., 50, 150, 200)
             
         Returns:
@@ -300,27 +859,24 @@ class DataFetcher:
         if len(bars) < period:
             return None
         
-        # Get last 'period' closes
-        closes = [bar['close'] for bar in bars[-period:]]
-        
-        return sum(closes) / len(closes)
+        # Mean of the last 'period' closes
+        return float(bars_to_array(bars)['close'][-period:].mean())
     
-    def calculate_average_volume(self, bars: List[Dict], period: int = 50) -> Optional[int]:
+    def calculate_average_volume(self, bars, period: int = 50) -> Optional[int]:
         """Calculate average volume over period."""
         if len(bars) < period:
             return None
 
-        volumes = [bar['volume'] for bar in bars[-period:]]
-        return int(sum(volumes) / len(volumes))
+        return int(bars_to_array(bars)['volume'][-period:].mean())
 
-    def _wait_for_fill(self, trade, symbol: str, timeout_seconds: int = 60) -> float:
+    async def _wait_for_fill_async(self, trade, symbol: str, timeout_seconds: int = 60) -> float:
         """
-        Poll the IB trade object until the order is filled or timeout is reached.
+        Wait on the IB trade object until the order is filled or timeout is reached.
 
         IB's avgFillPrice is 0.0 immediately after placeOrder() because the fill
-        confirmation arrives asynchronously.  This helper pumps the IB event loop
-        in short bursts until the order status transitions to 'Filled' or the
-        timeout expires.
+        confirmation arrives asynchronously.  Rather than polling, this helper
+        subscribes to the trade's status/fill/cancel events and wakes the moment
+        the order reaches 'Filled' (with a fill price) or a terminal status.
 
         Args:
             trade:           ib_insync Trade object returned by placeOrder()
@@ -333,38 +889,54 @@ class DataFetcher:
             avgFillPrice if the order was filled, else 0.0 (caller falls back to
             submitted / limit price).
         """
-        POLL_INTERVAL = 1  # seconds between each IB event-loop pump
-        elapsed = 0
-
-        while elapsed < timeout_seconds:
-            self.ib.sleep(POLL_INTERVAL)
-            elapsed += POLL_INTERVAL
-
+        def finished() -> bool:
             status = trade.orderStatus.status
             avg_fill = trade.orderStatus.avgFillPrice
+            return (status == 'Filled' and bool(avg_fill) and avg_fill > 0) \
+                or status in TERMINAL_ORDER_STATUSES
 
-            logger.debug(
-                f"  [{symbol}] fill poll {elapsed}s: status={status} avgFillPrice={avg_fill}"
-            )
+        done = asyncio.Event()
 
-            if status == 'Filled' and avg_fill and avg_fill > 0:
-                logger.info(
-                    f"✅ [{symbol}] Order filled after {elapsed}s "
-                    f"@ avg fill ${avg_fill:.4f}"
-                )
-                return float(avg_fill)
+        def on_trade_update(*_args):
+            if finished():
+                done.set()
 
-            # IB may also report 'Cancelled', 'Inactive', etc. — stop polling early
-            if status in ('Cancelled', 'ApiCancelled', 'Inactive', 'Error'):
-                logger.warning(
-                    f"⚠️ [{symbol}] Order ended with status={status} after {elapsed}s "
-                    f"— no fill price available"
-                )
-                return 0.0
+        trade.statusEvent += on_trade_update
+        trade.filledEvent += on_trade_update
+        trade.cancelledEvent += on_trade_update
+        started = time.monotonic()
+        try:
+            if not finished():
+                await asyncio.wait_for(done.wait(), timeout_seconds)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            trade.statusEvent -= on_trade_update
+            trade.filledEvent -= on_trade_update
+            trade.cancelledEvent -= on_trade_update
+
+        elapsed = time.monotonic() - started
+        status = trade.orderStatus.status
+        avg_fill = trade.orderStatus.avgFillPrice
+
+        if status == 'Filled' and avg_fill and avg_fill > 0:
+            logger.info(
+                "✅ [%s] Order filled after %.1fs @ avg fill $%.4f",
+                symbol, elapsed, avg_fill
+            )
+            return float(avg_fill)
+
+        # IB may also report 'Cancelled', 'Inactive', etc. — nothing to wait for
+        if status in TERMINAL_ORDER_STATUSES:
+            logger.warning(
+                "⚠️ [%s] Order ended with status=%s after %.1fs — no fill price available",
+                symbol, status, elapsed
+            )
+            return 0.0
 
         logger.warning(
-            f"⚠️ [{symbol}] Fill not confirmed within {timeout_seconds}s "
-            f"(status={trade.orderStatus.status}) — returning 0.0"
+            "⚠️ [%s] Fill not confirmed within %ss (status=%s) — returning 0.0",
+            symbol, timeout_seconds, status
         )
         return 0.0
 
@@ -384,36 +956,42 @@ class DataFetcher:
             or None on failure.  avg_fill_price is 0.0 if the order was not
             filled within fill_timeout seconds.
         """
-        if not self.connected:
-            if not self.connect():
-                return None
+        return self._run(self.place_market_order_async(symbol, quantity, action, fill_timeout))
+
+    async def place_market_order_async(self, symbol: str, quantity: int, action: str,
+                                       fill_timeout: int = 60) -> Optional[Dict]:
+        """Coroutine behind place_market_order."""
+        if not await self._ensure_connected_async():
+            return None
 
         try:
-            contract = Stock(symbol, 'SMART', 'USD')
-            qualified = self.ib.qualifyContracts(contract)
-            if not qualified:
-                logger.warning(f"⚠️ Could not qualify contract for {symbol}")
+            contract = await self._qualify_async(symbol)
+            if contract is None:
+                logger.warning("⚠️ Could not qualify contract for %s", symbol)
                 return None
 
-            contract = qualified[0]
             order = MarketOrder(action.upper(), quantity)
             trade = self.ib.placeOrder(contract, order)
 
-            # Allow IB a moment to acknowledge the order before polling
-            self.ib.sleep(1)
+            # Give IB a moment to acknowledge the order (returns on the first update)
+            try:
+                await asyncio.wait_for(self.ib.updateEvent.wait(), 1)
+            except asyncio.TimeoutError:
+                pass
 
             logger.info(
-                f"📤 Market {action} order placed: {symbol} x{quantity} "
-                f"| order_id={trade.order.orderId} status={trade.orderStatus.status} "
-                f"— waiting for fill (timeout={fill_timeout}s)…"
+                "📤 Market %s order placed: %s x%s | order_id=%s status=%s "
+                "— waiting for fill (timeout=%ss)…",
+                action, symbol, quantity, trade.order.orderId, trade.orderStatus.status,
+                fill_timeout
             )
 
-            avg_fill_price = self._wait_for_fill(trade, symbol, fill_timeout)
+            avg_fill_price = await self._wait_for_fill_async(trade, symbol, fill_timeout)
 
             logger.info(
-                f"✅ Market {action} complete: {symbol} x{quantity} "
-                f"| order_id={trade.order.orderId} status={trade.orderStatus.status} "
-                f"avg_fill=${avg_fill_price:.4f}"
+                "✅ Market %s complete: %s x%s | order_id=%s status=%s avg_fill=$%.4f",
+                action, symbol, quantity, trade.order.orderId, trade.orderStatus.status,
+                avg_fill_price
             )
             return {
                 'order_id': trade.order.orderId,
@@ -423,7 +1001,7 @@ class DataFetcher:
             }
 
         except Exception as e:
-            logger.error(f"❌ Error placing market {action} order for {symbol}: {e}")
+            logger.error("❌ Error placing market %s order for %s: %s", action, symbol, e)
             return None
 
     def cancel_order(self, order_id: int) -> bool:
@@ -441,6 +1019,10 @@ class DataFetcher:
             True if cancel request was sent to IB.
             False if order not found (may have already filled or been cancelled).
         """
+        return self._run(self.cancel_order_async(order_id))
+
+    async def cancel_order_async(self, order_id: int) -> bool:
+        """Coroutine behind cancel_order."""
         if not self.connected:
             logger.warning(f"⚠️ cancel_order({order_id}): IB not connected — cannot cancel")
             return False
@@ -457,7 +1039,11 @@ class DataFetcher:
                 )
                 return False
             self.ib.cancelOrder(target.order)
-            self.ib.sleep(2)  # pump the event loop so IB can acknowledge the cancel
+            # Give IB up to 2 s to acknowledge the cancel (returns as soon as it does)
+            try:
+                await asyncio.wait_for(target.cancelledEvent.wait(), 2)
+            except asyncio.TimeoutError:
+                pass
             logger.info(
                 f"✅ cancel_order({order_id}): cancel request sent "
                 f"| status={target.orderStatus.status}"
@@ -486,36 +1072,43 @@ class DataFetcher:
             Dict with order_id, status, filled details, avg_fill_price, and
             limit_price, or None on failure.
         """
-        if not self.connected:
-            if not self.connect():
-                return None
+        return self._run(self.place_limit_order_async(symbol, quantity, action, limit_price, fill_timeout))
+
+    async def place_limit_order_async(self, symbol: str, quantity: int, action: str,
+                                      limit_price: float, fill_timeout: int = 60) -> Optional[Dict]:
+        """Coroutine behind place_limit_order."""
+        if not await self._ensure_connected_async():
+            return None
 
         try:
-            contract = Stock(symbol, 'SMART', 'USD')
-            qualified = self.ib.qualifyContracts(contract)
-            if not qualified:
-                logger.warning(f"⚠️ Could not qualify contract for {symbol}")
+            contract = await self._qualify_async(symbol)
+            if contract is None:
+                logger.warning("⚠️ Could not qualify contract for %s", symbol)
                 return None
 
-            contract = qualified[0]
             order = LimitOrder(action.upper(), quantity, round(limit_price, 2))
             trade = self.ib.placeOrder(contract, order)
 
-            # Allow IB a moment to acknowledge the order before polling
-            self.ib.sleep(1)
+            # Give IB a moment to acknowledge the order (returns on the first update)
+            try:
+                await asyncio.wait_for(self.ib.updateEvent.wait(), 1)
+            except asyncio.TimeoutError:
+                pass
 
             logger.info(
-                f"📤 Limit {action} order placed: {symbol} x{quantity} @ ${limit_price:.2f} "
-                f"| order_id={trade.order.orderId} status={trade.orderStatus.status} "
-                f"— waiting for fill (timeout={fill_timeout}s)…"
+                "📤 Limit %s order placed: %s x%s @ $%.2f | order_id=%s status=%s "
+                "— waiting for fill (timeout=%ss)…",
+                action, symbol, quantity, limit_price, trade.order.orderId,
+                trade.orderStatus.status, fill_timeout
             )
 
-            avg_fill_price = self._wait_for_fill(trade, symbol, fill_timeout)
+            avg_fill_price = await self._wait_for_fill_async(trade, symbol, fill_timeout)
 
             logger.info(
-                f"✅ Limit {action} complete: {symbol} x{quantity} @ limit=${limit_price:.2f} "
-                f"| order_id={trade.order.orderId} status={trade.orderStatus.status} "
-                f"avg_fill=${avg_fill_price:.4f}"
+                "✅ Limit %s complete: %s x%s @ limit=$%.2f | order_id=%s status=%s "
+                "avg_fill=$%.4f",
+                action, symbol, quantity, limit_price, trade.order.orderId,
+                trade.orderStatus.status, avg_fill_price
             )
             return {
                 'order_id': trade.order.orderId,
@@ -526,7 +1119,7 @@ class DataFetcher:
             }
 
         except Exception as e:
-            logger.error(f"❌ Error placing limit {action} order for {symbol}: {e}")
+            logger.error("❌ Error placing limit %s order for %s: %s", action, symbol, e)
             return None
 
     def fetch_account_info(self) -> dict:
@@ -542,6 +1135,10 @@ class DataFetcher:
           Tags that IB did not send (e.g. paper-account limitations) are
           simply absent from the returned dict.
         """
+        return self._run(self.fetch_account_info_async())
+
+    async def fetch_account_info_async(self) -> dict:
+        """Coroutine behind fetch_account_info."""
         if not self.connected:
             return {"error": "Not connected to IB"}
 
@@ -599,6 +1196,69 @@ class DataFetcher:
             return {"error": str(e)}
 
 
+# ============================================================================
+# CONNECTION POOL FOR SHARDED HISTORICAL FETCHES
+# ============================================================================
+
+class IBConnectionPool:
+    """
+    Several DataFetcher connections with consecutive client IDs.
+
+    IB paces historical-data requests per client connection, so sharding a
+    symbol list across `size` connections multiplies bootstrap throughput.
+    Client IDs start at `base_client_id` (default IB_CLIENT_ID + 1, so the
+    pool never collides with the main app's connection).
+    """
+
+    def __init__(self, size: int = IB_POOL_SIZE, base_client_id: Optional[int] = None):
+        if base_client_id is None:
+            base_client_id = int(os.getenv('IB_CLIENT_ID', '1')) + 1
+        self.fetchers: List[DataFetcher] = []
+        for i in range(max(1, size)):
+            fetcher = DataFetcher()
+            fetcher.client_id = base_client_id + i
+            self.fetchers.append(fetcher)
+
+    @property
+    def connected_fetchers(self) -> List[DataFetcher]:
+        return [f for f in self.fetchers if f.connected]
+
+    def connect(self) -> bool:
+        """Connect every client concurrently; True if at least one connected."""
+        futures = [f.submit(f.connect_async()) for f in self.fetchers]
+        connected = sum(1 for fut in futures if fut.result())
+        logger.info(f"✅ IB connection pool: {connected}/{len(self.fetchers)} clients connected")
+        return connected > 0
+
+    def disconnect(self):
+        """Disconnect every client."""
+        for fetcher in self.fetchers:
+            fetcher.disconnect()
+
+    def fetch_historical_bars_sharded(self, symbols: List[str], duration: str = '1 Y',
+                                      bar_size: str = '1 day') -> Dict[str, np.ndarray]:
+        """
+        Fetch historical bars for `symbols`, sharded round-robin across the
+        connected clients; each shard runs as one pipelined batch on its own
+        connection and IB loop thread.
+
+        Returns the same mapping as DataFetcher.fetch_historical_bars_batch.
+        """
+        fetchers = self.connected_fetchers
+        if not fetchers:
+            logger.error("❌ IB connection pool has no connected clients")
+            return {}
+
+        futures = [
+            f.submit(f.fetch_historical_bars_batch_async(symbols[i::len(fetchers)], duration, bar_size))
+            for i, f in enumerate(fetchers)
+        ]
+        results: Dict[str, np.ndarray] = {}
+        for fut in futures:
+            results.update(fut.result())
+        return results
+
+
 # ============================================================================
 # ASYNC WRAPPER FOR USE IN FASTAPI
 # ============================================================================
@@ -609,57 +1269,55 @@ class AsyncDataFetcher:
     Pass an existing DataFetcher instance so that the sync scanner/monitor
     and the async API layer share the same connection state.
     If no instance is provided a new one is created (backwards compatible).
+
+    Each call runs the fetcher's coroutine on the IB loop thread and awaits
+    it from the caller's loop via asyncio.wrap_future.
     """
 
     def __init__(self, fetcher: DataFetcher = None):
         self.fetcher = fetcher if fetcher is not None else DataFetcher()
+
+    async def _call(self, coro):
+        """Await `coro` running on the fetcher's IB loop thread."""
+        return await asyncio.wrap_future(self.fetcher.submit(coro))
     
     async def connect(self) -> bool:
         """Async connect."""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self.fetcher.connect
-        )
+        return await self._call(self.fetcher.connect_async())
     
     async def disconnect(self):
-        """Async disconnect."""
-        await asyncio.get_event_loop().run_in_executor(
-            None, self.fetcher.disconnect
-        )
+        """Async disconnect (teardown is queued on the IB loop, not awaited)."""
+        self.fetcher.disconnect()
     
-    async def fetch_historical_bars(self, symbol: str, duration: str = '1 Y') -> List[Dict]:
+    async def fetch_historical_bars(self, symbol: str, duration: str = '1 Y') -> np.ndarray:
         """Async fetch historical bars."""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self.fetcher.fetch_historical_bars, symbol, duration
-        )
+        return await self._call(self.fetcher.fetch_historical_bars_async(symbol, duration))
+    
+    async def fetch_historical_bars_batch(self, symbols: List[str],
+                                          duration: str = '1 Y') -> Dict[str, np.ndarray]:
+        """Async fetch historical bars for a batch of symbols."""
+        return await self._call(self.fetcher.fetch_historical_bars_batch_async(symbols, duration))
     
     async def fetch_current_price(self, symbol: str) -> Optional[float]:
         """Async fetch current price."""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self.fetcher.fetch_current_price, symbol
-        )
+        return await self._call(self.fetcher.fetch_current_price_async(symbol))
     
     async def fetch_multiple_prices(self, symbols: List[str]) -> Dict[str, float]:
         """Async fetch multiple prices."""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self.fetcher.fetch_multiple_prices, symbols
-        )
+        return await self._call(self.fetcher.fetch_multiple_prices_async(symbols))
 
     async def place_market_order(self, symbol: str, quantity: int,
                                  action: str) -> Optional[Dict]:
         """Async place market order."""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self.fetcher.place_market_order, symbol, quantity, action
-        )
+        return await self._call(self.fetcher.place_market_order_async(symbol, quantity, action))
 
     async def place_limit_order(self, symbol: str, quantity: int, action: str,
                                 limit_price: float) -> Optional[Dict]:
         """Async place limit order."""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self.fetcher.place_limit_order, symbol, quantity, action, limit_price
+        return await self._call(
+            self.fetcher.place_limit_order_async(symbol, quantity, action, limit_price)
         )
 
     async def fetch_account_info(self) -> dict:
-        """Async fetch IB account summary."""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self.fetcher.fetch_account_info
-        )
+        """Async fetch IB account summary (served from ib_insync's local cache)."""
+        return await self._call(self.fetcher.fetch_account_info_async())
@@ -5,22 +5,31 @@ Data Auto-Updater for Minervini Trading Bot
 Handles scheduled and on-demand fetching of fresh OHLCV bars from IB Gateway.
 
 Key design points:
-- Pure asyncio scheduling — no external scheduler dependency
+- Pure asyncio scheduling — no external scheduler dependency; one Scheduler
+  task drives the data update, SOD and EOD jobs from a heap of fire times
 - Dynamic gap detection: checks each ticker's latest bar date and fetches
   exactly the missing days (+ 5-day buffer for weekends/holidays, capped 1 Y)
-- Trigger time is read from DB each loop iteration so UI changes take effect
+- Trigger time is read from DB each cycle so UI changes take effect
   without a restart
-- DB-backed concurrency guard prevents overlapping runs
+- In-process lock prevents overlapping runs (the DB status is kept for the UI)
 - Progress broadcast over WebSocket every 10 tickers
 """
 
 import asyncio
-import json
+import functools
+import heapq
+import itertools
 import logging
-from datetime import datetime, timedelta, date
+import os
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone, date
 from zoneinfo import ZoneInfo
 from typing import TYPE_CHECKING, Optional
 
+from ws_broadcast import broadcast
+from data_fetcher import last_completed_bar_date_on
+
 if TYPE_CHECKING:
     pass  # BotState imported at runtime inside functions to avoid circular import
 
@@ -30,60 +39,117 @@ from order_executor import run_order_execution, run_eod_execution
 logger = logging.getLogger(__name__)
 
 ET = ZoneInfo("America/New_York")
-RATE_LIMIT_SLEEP = 0.5   # seconds between IB requests
+IB_MAX_INFLIGHT = int(os.getenv('IB_MAX_INFLIGHT', '4'))  # concurrent ticker fetches
 MAX_FETCH_DAYS = 365     # cap for very stale / never-fetched tickers
 PROGRESS_EVERY = 10      # broadcast progress every N tickers
+PROGRESS_FLUSH_DELAY = 0.1   # seconds to gather progress events into one frame
+PROGRESS_BUFFER_MAX = 140    # force a flush once this many events are queued
+SAVE_BATCH_SIZE = 25     # symbols per bulk bar insert
+NOW_ET_TTL = 0.2         # seconds a cached _now_et() reading may be reused
+
+# IB duration strings for every day count compute_fetch_duration can return,
+# built once so each call is a tuple lookup instead of a fresh f-string
+_DURATION_STRINGS = tuple(f'{days} D' for days in range(MAX_FETCH_DAYS + 1))
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def seconds_until_next_trigger(update_time_str: str, grace_minutes: int = 0) -> float:
+@functools.lru_cache(maxsize=1)
+def _now_et_in_bucket(bucket: int) -> datetime:
+    return datetime.now(ET)
+
+
+def _now_et() -> datetime:
     """
-    Return the number of seconds until the next weekday trigger at
-    `update_time_str` (HH:MM, 24-hour, Eastern Time).
+    datetime.now(ET), reused for up to NOW_ET_TTL seconds (bucketed on
+    time.monotonic()). For date lookups and coarse waits only — the scheduler's
+    fire-time comparisons read the clock directly.
+    """
+    return _now_et_in_bucket(int(time.monotonic() / NOW_ET_TTL))
 
-    Handles DST transitions automatically via ZoneInfo.
-    Skips Saturday and Sunday; if today is a weekday and the trigger has
-    not yet passed, targets today; otherwise targets the next Mon–Fri.
 
-    grace_minutes: if > 0, a trigger that passed within this many minutes ago
-    on a weekday is treated as "just now" and returns 1 second (fire immediately).
-    Use this for the order execution scheduler so a restart within the grace window
-    still fires rather than skipping to tomorrow.
+@functools.lru_cache(maxsize=16)
+def parse_trigger_time(update_time_str: str) -> tuple:
+    """
+    Parse 'HH:MM' into (hour, minute); memoized since the config value rarely
+    changes. The Settings API calls it on write, so bad values are rejected
+    there and the schedulers only ever hit the cache.
     """
     try:
         hour, minute = (int(x) for x in update_time_str.split(':'))
+        if not (0 <= hour < 24 and 0 <= minute < 60):
+            raise ValueError
     except Exception:
         raise ValueError(
             f"Invalid time string '{update_time_str}' — expected HH:MM (e.g. '09:30'). "
             f"Fix the value in Settings and restart."
         )
+    return hour, minute
+
+
+def next_trigger_at(update_time_str: str, grace_minutes: int = 0,
+                    after: Optional[datetime] = None) -> datetime:
+    """
+    Return the next weekday trigger at `update_time_str` (HH:MM, 24-hour,
+    Eastern Time) as an aware ET datetime.
+
+    DST-safe: the wall-clock arithmetic below happens in ET, then the result
+    is normalised through UTC, so a trigger inside the spring-forward gap
+    (e.g. 02:30) becomes the real instant it maps to (03:30 EDT) instead of a
+    non-existent wall time.
+
+    Skips Saturday and Sunday; if today is a weekday and the trigger has
+    not yet passed, targets today; otherwise targets the next Mon–Fri.
+
+    grace_minutes: if > 0, a trigger that passed within this many minutes ago
+    on a weekday is returned as-is (i.e. fire immediately).
+    Use this for the order execution scheduler so a restart within the grace window
+    still fires rather than skipping to tomorrow.
+
+    after: the trigger that last fired, if any. The result is always strictly
+    later, so a scheduler that passes it back in can never fire the same
+    trigger twice, however the clocks jitter.
+    """
+    hour, minute = parse_trigger_time(update_time_str)
 
     now_et = datetime.now(ET)
+    floor = now_et if after is None else max(now_et, after)
     candidate = now_et.replace(hour=hour, minute=minute, second=0, microsecond=0)
 
     # Grace window: if the trigger passed recently today on a weekday, fire now
-    if grace_minutes > 0 and candidate.weekday() < 5:
-        seconds_since = (now_et - candidate).total_seconds()
+    if grace_minutes > 0 and candidate.weekday() < 5 and (after is None or candidate > after):
+        seconds_since = now_et.timestamp() - candidate.timestamp()
         if 0 < seconds_since <= grace_minutes * 60:
             logger.info(
-                f"Trigger time {update_time_str} passed {seconds_since:.0f}s ago "
-                f"(within {grace_minutes}m grace window) — firing immediately"
+                "Trigger time %s passed %.0fs ago (within %dm grace window) — firing immediately",
+                update_time_str, seconds_since, grace_minutes
             )
-            return 1.0
+            return candidate
 
-    # Step forward until we land on a future weekday trigger
-    while True:
-        # weekday() 0=Mon … 6=Sun
-        if candidate.weekday() < 5 and candidate > now_et:
-            break
+    # First trigger strictly after `floor`: that day's if still ahead, else the
+    # next day's, then roll a Saturday/Sunday forward to Monday. Aware-datetime
+    # arithmetic keeps the wall-clock HH:MM, so DST shifts are still honoured.
+    candidate = floor.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if candidate <= floor:
         candidate += timedelta(days=1)
-        candidate = candidate.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    weekday = candidate.weekday()   # 0=Mon … 6=Sun
+    if weekday >= 5:
+        candidate += timedelta(days=7 - weekday)
 
-    delta = (candidate - now_et).total_seconds()
-    return max(delta, 1.0)   # never negative
+    return candidate.astimezone(timezone.utc).astimezone(ET)
+
+
+def seconds_until(fire_at: datetime) -> float:
+    """
+    Seconds from now until `fire_at` (at least 1 — never negative).
+
+    Uses POSIX timestamps: subtracting two datetimes that share the ET tzinfo
+    is plain wall-clock arithmetic in Python, which is an hour off whenever a
+    DST change falls in between (e.g. Friday evening → Monday morning).
+    """
+    return max(fire_at.timestamp() - time.time(), 1.0)
 
 
 def _last_completed_bar_date() -> date:
@@ -97,29 +163,27 @@ def _last_completed_bar_date() -> date:
     This prevents re-fetching the same partial/incomplete bar every time the
     user clicks "Update Now" during market hours.
     """
-    today = datetime.now(ET).date()   # always use ET date, not machine local
-    weekday = today.weekday()  # 0=Mon … 6=Sun
-    if weekday == 5:           # Saturday → last completed bar was Friday
-        return today - timedelta(days=1)
-    if weekday == 6:           # Sunday → last completed bar was Friday
-        return today - timedelta(days=2)
-    # Weekday: last completed bar is yesterday
-    return today - timedelta(days=1)
+    return last_completed_bar_date_on(_now_et().date())   # always use ET date, not machine local
 
 
-def compute_fetch_duration(symbol: str, db) -> Optional[str]:
+def compute_fetch_duration(latest: Optional[date],
+                           last_completed: Optional[date] = None) -> Optional[str]:
     """
-    Return the IB duration string that covers the gap since the last stored
-    bar for `symbol`, or None if the symbol is already up to date.
+    Return the IB duration string that covers the gap since `latest` (the
+    date of the last stored bar for a symbol, or None if it has none), or
+    None if the symbol is already up to date.
+
+    `last_completed` defaults to _last_completed_bar_date(); batch callers
+    compute it once and pass it in.
 
     Examples: '15 D', '60 D', '1 Y'
     """
-    latest: Optional[date] = db.get_latest_bar_date(symbol)
-
     if latest is None:
         return '1 Y'   # never fetched — bootstrap the full history
 
-    last_completed = _last_completed_bar_date()
+    if last_completed is None:
+        last_completed = _last_completed_bar_date()
+
     gap_days = (last_completed - latest).days
 
     if gap_days <= 0:
@@ -129,20 +193,67 @@ def compute_fetch_duration(symbol: str, db) -> Optional[str]:
     fetch_days = min(gap_days + 5, MAX_FETCH_DAYS)
     if fetch_days >= MAX_FETCH_DAYS:
         return '1 Y'
-    return f'{fetch_days} D'
+    return _DURATION_STRINGS[fetch_days]
 
 
 async def _broadcast_update(bot_state, message: dict) -> None:
-    """Send a JSON message to all connected WebSocket clients."""
-    payload = json.dumps(message)
-    dead: list = []
-    for ws in list(getattr(bot_state, 'websocket_clients', set())):
-        try:
-            await ws.send_text(payload)
-        except Exception:
-            dead.append(ws)
-    for ws in dead:
-        bot_state.websocket_clients.discard(ws)
+    """Send a JSON message to all connected WebSocket clients (concurrently)."""
+    clients = getattr(bot_state, 'websocket_clients', None)
+    if not clients:
+        return
+    await broadcast(clients, message)
+
+
+def _queue_progress(bot_state, done: int, total: int, current_symbol: str) -> None:
+    """
+    Buffer a progress event; buffered events go out together as one
+    'data_update_progress' frame whose data is a list (oldest first).
+
+    The frame is flushed PROGRESS_FLUSH_DELAY seconds after the first event
+    is queued, or immediately once PROGRESS_BUFFER_MAX events are waiting.
+    While no client is connected the event dict is never even built.
+    """
+    if not getattr(bot_state, 'websocket_clients', None):
+        return
+    bot_state.progress_buffer.append(
+        {'done': done, 'total': total, 'current_symbol': current_symbol}
+    )
+    if len(bot_state.progress_buffer) >= PROGRESS_BUFFER_MAX:
+        _start_flush(bot_state)
+    elif bot_state.progress_flush_handle is None:
+        bot_state.progress_flush_handle = asyncio.get_running_loop().call_later(
+            PROGRESS_FLUSH_DELAY, _start_flush, bot_state
+        )
+
+
+def _start_flush(bot_state) -> None:
+    """
+    Run _flush_progress as a task held on bot_state (the loop only keeps weak
+    references to tasks). While one is in flight, newer events stay buffered
+    for the next flush.
+    """
+    if bot_state.progress_flush_task is not None:
+        return
+    task = asyncio.ensure_future(_flush_progress(bot_state))
+    bot_state.progress_flush_task = task
+    task.add_done_callback(functools.partial(_flush_done, bot_state))
+
+
+def _flush_done(bot_state, task: asyncio.Task) -> None:
+    """Drop the finished flush task and log its failure, if any."""
+    bot_state.progress_flush_task = None
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"❌ Progress broadcast failed: {task.exception()}")
+
+
+async def _flush_progress(bot_state) -> None:
+    """Broadcast all buffered progress events as a single frame."""
+    if bot_state.progress_flush_handle is not None:
+        bot_state.progress_flush_handle.cancel()
+        bot_state.progress_flush_handle = None
+    events, bot_state.progress_buffer = bot_state.progress_buffer, []
+    if events:
+        await _broadcast_update(bot_state, {'type': 'data_update_progress', 'data': events})
 
 
 # ---------------------------------------------------------------------------
@@ -153,23 +264,29 @@ async def run_data_update(bot_state) -> None:
     """
     Fetch missing OHLCV bars for all active tickers.
 
-    Designed to be safe to call concurrently (the DB 'running' guard prevents
-    overlap). Fire-and-forget via asyncio.create_task is the expected usage.
+    Designed to be safe to call concurrently (bot_state.data_update_lock
+    prevents overlap). Fire-and-forget via asyncio.create_task is the expected
+    usage.
     """
-    db = bot_state.db
-    fetcher = bot_state.fetcher
-
     # --- guard: prevent overlapping runs ---
-    current_status = db.get_data_update_status()
-    if current_status.get('data_update_status') == 'running':
+    if bot_state.data_update_lock.locked():
         logger.info("Data update already in progress — skipping")
         return
 
+    async with bot_state.data_update_lock:
+        await _run_data_update(bot_state)
+
+
+async def _run_data_update(bot_state) -> None:
+    """Body of run_data_update(); the caller holds bot_state.data_update_lock."""
+    db = bot_state.db
+    fetcher = bot_state.fetcher
+    loop = asyncio.get_running_loop()
+
     # --- guard: IB connectivity ---
     if not bot_state.ib_connected:
         logger.warning("IB not connected; attempting reconnect before data update")
         try:
-            loop = asyncio.get_event_loop()
             await loop.run_in_executor(None, fetcher.connect)
             bot_state.ib_connected = True
         except Exception as e:
@@ -181,7 +298,8 @@ async def run_data_update(bot_state) -> None:
             })
             return
 
-    tickers = db.get_active_tickers()
+    # DB reads run on the executor so the loop keeps serving WebSocket traffic
+    tickers = await loop.run_in_executor(bot_state.ib_executor, db.get_active_tickers)
     if not tickers:
         logger.info("No active tickers — skipping data update")
         return
@@ -195,47 +313,98 @@ async def run_data_update(bot_state) -> None:
         'data': {'total': total}
     })
 
-    done = 0
-    skipped = 0
     errors = 0
 
-    try:
-        for symbol in tickers:
-            duration = compute_fetch_duration(symbol, db)
-
-            if duration is None:
-                skipped += 1
-                done += 1
-                # Broadcast progress at the normal cadence even for skipped ones
-                if done % PROGRESS_EVERY == 0:
-                    await _broadcast_update(bot_state, {
-                        'type': 'data_update_progress',
-                        'data': {'done': done, 'total': total, 'current_symbol': symbol}
-                    })
-                continue
+    # Up to IB_MAX_INFLIGHT tickers are fetched at once, so the next request is
+    # already dispatched while another one is blocked waiting on IB
+    inflight = asyncio.Semaphore(IB_MAX_INFLIGHT)
 
+    last_completed = _last_completed_bar_date()
+
+    # Tickers already confirmed current for this trading day (by an earlier run)
+    # skip the DB; the cache goes stale by itself once last_completed rolls over
+    current_as_of = bot_state.fetch_decision_cache
+    unknown = [s for s in tickers if current_as_of.get(s) != last_completed]
+
+    # Latest stored bar date for the remaining tickers in one grouped query
+    latest_dates = {}
+    if unknown:
+        latest_dates = await loop.run_in_executor(
+            bot_state.ib_executor, db.get_latest_bar_dates, unknown
+        )
+
+    # Work out every ticker's fetch window once, up front; tickers that are
+    # already current never become tasks
+    durations = {}
+    for symbol in unknown:
+        duration = compute_fetch_duration(latest_dates.get(symbol), last_completed)
+        if duration is None:
+            current_as_of[symbol] = last_completed
+        else:
+            durations[symbol] = duration
+    skipped = total - len(durations)
+    done = skipped
+
+    # Fetched bars wait here until SAVE_BATCH_SIZE symbols are ready, then go
+    # to the DB in one bulk insert on the executor (never on the event loop)
+    pending_bars = {}
+
+    async def save_pending() -> None:
+        nonlocal pending_bars, errors
+        if not pending_bars:
+            return
+        batch, pending_bars = pending_bars, {}
+        if not await loop.run_in_executor(bot_state.ib_executor, db.save_daily_bars_bulk, batch):
+            # The bulk insert is one transaction — every symbol in it is lost
+            errors += len(batch)
+            logger.error("Failed to save bars for %s", ', '.join(batch))
+            return
+        for symbol, bars in batch.items():
+            if bars['date'][-1].item() >= last_completed:
+                current_as_of[symbol] = last_completed
+
+    reported = 0   # `done` at the last queued progress event
+
+    async def update_one(symbol: str, duration: str) -> None:
+        nonlocal done, errors, reported
+        async with inflight:
             try:
-                loop = asyncio.get_event_loop()
+                # Pacing happens inside the fetcher (its historical-request limiter),
+                # only when a real IB request is issued — cache hits never wait.
+                # Positional args (symbol, duration) — no partial/lambda per ticker
                 bars = await loop.run_in_executor(
-                    None,
-                    lambda s=symbol, d=duration: fetcher.fetch_historical_bars(s, duration=d)
+                    bot_state.fetcher_pool, fetcher.fetch_historical_bars, symbol, duration
                 )
-                if bars:
-                    db.save_daily_bars(symbol, bars)
+                if len(bars):
+                    pending_bars[symbol] = bars
             except Exception as e:
                 errors += 1
-                logger.error(f"Error fetching bars for {symbol}: {e}")
+                # Lazy %-args: formatted only if a handler takes the record
+                logger.error("Error fetching bars for %s: %s", symbol, e)
 
-            done += 1
+        if len(pending_bars) >= SAVE_BATCH_SIZE:
+            await save_pending()
 
-            if done % PROGRESS_EVERY == 0:
-                await _broadcast_update(bot_state, {
-                    'type': 'data_update_progress',
-                    'data': {'done': done, 'total': total, 'current_symbol': symbol}
-                })
+        done += 1
 
-            await asyncio.sleep(RATE_LIMIT_SLEEP)
+        # Broadcast progress every PROGRESS_EVERY tickers (skipped ones are
+        # counted in `done` from the start; an all-current run only sends the
+        # final data_update_complete)
+        if done - reported >= PROGRESS_EVERY:
+            reported = done
+            _queue_progress(bot_state, done, total, symbol)
 
+    try:
+        results = await asyncio.gather(
+            *(update_one(symbol, duration) for symbol, duration in durations.items()),
+            return_exceptions=True
+        )
+        failures = [r for r in results if isinstance(r, Exception)]
+        if failures:
+            raise failures[0]
+
+        await save_pending()
+        await _flush_progress(bot_state)
         db.set_data_update_status('success')
         logger.info(
             f"Data update complete — {total} tickers processed "
@@ -253,6 +422,7 @@ async def run_data_update(bot_state) -> None:
 
     except Exception as e:
         logger.error(f"Data update failed: {e}")
+        await _flush_progress(bot_state)
         db.set_data_update_status('failed', error=str(e))
         await _broadcast_update(bot_state, {
             'type': 'data_update_complete',
@@ -261,185 +431,316 @@ async def run_data_update(bot_state) -> None:
 
 
 # ---------------------------------------------------------------------------
-# Scheduler loop
+# Scheduler
 # ---------------------------------------------------------------------------
 
-async def data_update_scheduler_loop(bot_state) -> None:
+SCHEDULE_RETRY_SECONDS = 60   # re-check interval while a job is unconfigured / disabled
+
+
+class _ConfigCache:
+    """
+    bot_config snapshot shared by the scheduler jobs; get_config() is only
+    re-run after Database.config_version moves (i.e. after a config write).
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self._version: Optional[int] = None
+        self._config: dict = {}
+
+    def get(self) -> dict:
+        version = self.db.config_version   # read first so a write mid-fetch forces a reload
+        if version != self._version:
+            self._config = self.db.get_config()
+            self._version = version
+        return self._config
+
+
+class Scheduler:
+    """
+    One long-running task that drives every timed job.
+
+    Jobs sit in a heap keyed by their next fire time and the task sleeps
+    exactly until the head is due. Each job provides `name`,
+    `async next_fire() -> datetime` and `async run()`. next_fire() reads its
+    config from the DB; when `config_changed` is set (by the Settings API)
+    every waiting job is rescheduled at once, so a new time applies
+    immediately rather than after the next firing.
+    Runs happen in their own tasks, so a long data update never delays
+    order execution. A job is rescheduled once its run finishes.
     """
-    Long-running asyncio task. Sleeps until the configured weekday trigger
-    time (ET), runs the data update, then repeats.
 
-    Reads `data_update_time` from the DB at the top of each iteration so
-    that changes made in the Settings UI take effect on the next cycle
-    without requiring a restart.
+    def __init__(self, config_changed: Optional[asyncio.Event] = None):
+        self._heap: list = []                 # (fire_at timestamp, seq, job)
+        self._seq = itertools.count()         # tie-breaker so jobs never get compared
+        self._changed = asyncio.Event()       # set whenever the heap changes
+        self._config_changed = config_changed or asyncio.Event()
+        self._running: set = set()
+
+    async def add(self, job) -> None:
+        """Schedule `job` at its next fire time."""
+        try:
+            fire_at = await job.next_fire()
+        except Exception as e:
+            logger.error(f"Could not schedule {job.name}: {e}")
+            fire_at = _now_et() + timedelta(seconds=SCHEDULE_RETRY_SECONDS)
+        heapq.heappush(self._heap, (fire_at.timestamp(), next(self._seq), job))
+        self._changed.set()
+
+    async def run(self) -> None:
+        """Fire jobs as they come due until cancelled."""
+        try:
+            while True:
+                self._changed.clear()
+                if self._config_changed.is_set():
+                    self._config_changed.clear()
+                    await self._reschedule_waiting()
+                    continue
+
+                if not self._heap:
+                    await self._wait(None)
+                    continue
+
+                fire_ts, _, job = self._heap[0]
+                delay = fire_ts - time.time()   # real seconds, even across a DST change
+                if delay > 0:
+                    # Wake early if a job is (re)scheduled — it may be due sooner
+                    await self._wait(delay)
+                    continue
+
+                heapq.heappop(self._heap)
+                task = asyncio.create_task(self._fire(job))
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+        finally:
+            for task in list(self._running):
+                task.cancel()
+
+    async def _wait(self, timeout: Optional[float]) -> None:
+        """Sleep up to `timeout` seconds, or until the heap or the config changes."""
+        waiters = [
+            asyncio.ensure_future(self._changed.wait()),
+            asyncio.ensure_future(self._config_changed.wait()),
+        ]
+        try:
+            await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+    async def _reschedule_waiting(self) -> None:
+        """Recompute the fire time of every job that is not currently running."""
+        waiting = [job for _, _, job in self._heap]
+        self._heap.clear()
+        for job in waiting:
+            await self.add(job)
+
+    async def _fire(self, job) -> None:
+        try:
+            await job.run()
+        except Exception as e:
+            logger.error(f"Scheduled {job.name} raised an unexpected error: {e}")
+        await self.add(job)
+
+
+class DataUpdateJob:
     """
-    logger.info("Data update scheduler started")
+    Runs the data update at the configured weekday `data_update_time` (ET).
+    """
+
+    name = "data update"
 
-    while True:
-        config = bot_state.db.get_config()
+    def __init__(self, bot_state, config: _ConfigCache):
+        self.bot_state = bot_state
+        self.config = config
+        self.fire_at: Optional[datetime] = None      # None = nothing to run at the scheduled time
+        self.last_fired: Optional[datetime] = None   # trigger that most recently fired
+
+    async def next_fire(self) -> datetime:
+        bot_state = self.bot_state
+        config = self.config.get()
         update_time = config.get('data_update_time') or ''
         if not update_time:
             logger.error("❌ data_update_time is not set in config — cannot schedule data update. Set it in Settings.")
-            await asyncio.sleep(60)
-            continue
-        wait = seconds_until_next_trigger(update_time)
-        logger.info(
-            f"Next data update scheduled in {wait / 3600:.1f}h "
-            f"(at {update_time} ET on next weekday)"
-        )
-
-        await asyncio.sleep(wait)
+            self.fire_at = None
+            return _now_et() + timedelta(seconds=SCHEDULE_RETRY_SECONDS)
+
+        self.fire_at = next_trigger_at(update_time, after=self.last_fired)
+        if self.fire_at != bot_state.next_data_update_at:
+            # Only announce a changed schedule; the UI reads it from the push
+            bot_state.next_data_update_at = self.fire_at
+            logger.debug("Next data update scheduled at %s ET", self.fire_at)
+            await _broadcast_update(bot_state, {
+                'type': 'next_trigger',
+                'data': {'job': 'data_update', 'at': self.fire_at.isoformat()}
+            })
+        return self.fire_at
 
+    async def run(self) -> None:
+        if self.fire_at is None:
+            return
         try:
-            await run_data_update(bot_state)
+            await run_data_update(self.bot_state)
         except Exception as e:
             logger.error(f"Scheduled data update raised an unexpected error: {e}")
-            bot_state.db.set_data_update_status('failed', error=str(e))
-
-        # Brief buffer so a clock jitter can't re-trigger within the same minute
-        await asyncio.sleep(120)
+            self.bot_state.db.set_data_update_status('failed', error=str(e))
 
+        # The next trigger is computed strictly after this one, so no
+        # post-run buffer sleep is needed to avoid a double fire
+        self.last_fired = self.fire_at
 
-# ---------------------------------------------------------------------------
-# Market-open order execution scheduler
-# ---------------------------------------------------------------------------
 
-async def market_open_scheduler_loop(bot_state) -> None:
+class _ExecutionJob(ABC):
     """
-    Long-running asyncio task. Sleeps until the configured order_execution_time
-    (set in Settings UI, weekdays only), then runs buy + exit order execution.
+    Shared scheduling for the SOD and EOD order execution jobs.
 
-    Reads `order_execution_time` from the DB at the top of each iteration so
-    that changes made in the Settings UI take effect on the next cycle without
-    requiring a restart.
+    The last execution date and the configured time it fired at are persisted
+    in the DB, so a restart within the grace window won't re-fire a run that
+    already happened today, yet a changed time is not locked out.
     """
-    logger.info("Market-open order execution scheduler started")
 
-    # Load from DB so a restart within the grace window won't re-fire if SOD already ran today.
-    # last_exec_time_config is the configured time that was active when SOD *actually fired* —
-    # stored in DB so we survive restarts correctly without locking out a changed time.
-    last_execution_date = bot_state.db.get_last_sod_execution_date()
-    last_exec_time_config = bot_state.db.get_last_sod_exec_time()
-    # Grace window is only enabled when the configured time actively changed mid-day.
-    # On a fresh start or after a manual reset (last_exec_time_config=NULL, last_execution_date=NULL)
-    # we do NOT want the grace window — just wait for the next scheduled occurrence.
-    _sod_allow_grace = False
-
-    while True:
-        config = bot_state.db.get_config()
-        exec_time = config.get("order_execution_time") or ''
+    name = ""
+    time_key = ""            # config key holding HH:MM
+    default_time = ""        # fallback when the key is empty ('' = required)
+
+    def __init__(self, bot_state, config: _ConfigCache, last_execution_date, last_exec_time_config):
+        self.bot_state = bot_state
+        self.config = config
+        self.last_execution_date = last_execution_date
+        # last_exec_time_config is the configured time that was active when the job *actually fired*
+        self.last_exec_time_config = last_exec_time_config
+        # Grace window is only enabled when the configured time actively changed mid-day.
+        # On a fresh start or after a manual reset (last_exec_time_config=NULL, last_execution_date=NULL)
+        # we do NOT want the grace window — just wait for the next scheduled occurrence.
+        self.allow_grace = False
+        self.exec_time: Optional[str] = None         # None = nothing to run at the scheduled time
+        self.fire_at: Optional[datetime] = None
+        self.last_fired: Optional[datetime] = None   # trigger that most recently fired
+
+    def enabled(self, config: dict) -> bool:
+        return True
+
+    async def next_fire(self) -> datetime:
+        config = self.config.get()
+        self.exec_time = None
+        if not self.enabled(config):
+            return _now_et() + timedelta(seconds=SCHEDULE_RETRY_SECONDS)
+
+        exec_time = config.get(self.time_key) or self.default_time
         if not exec_time:
-            logger.error("❌ order_execution_time is not set in config — cannot schedule order execution. Set it in Settings.")
-            await asyncio.sleep(60)
-            continue
-        today = datetime.now(ET).date()
+            logger.error(f"❌ {self.time_key} is not set in config — cannot schedule order execution. Set it in Settings.")
+            return _now_et() + timedelta(seconds=SCHEDULE_RETRY_SECONDS)
+        today = _now_et().date()
 
         # If the configured time changed since last run, reset the same-day guard so
         # the new time can fire today (e.g. user moves SOD from 09:35 → 11:35 mid-day).
-        if last_exec_time_config != exec_time:
-            logger.info(f"SOD exec time changed ({last_exec_time_config} → {exec_time}) — resetting same-day guard")
-            last_execution_date = None
+        if self.last_exec_time_config != exec_time:
+            logger.info(f"{self.name} time changed ({self.last_exec_time_config} → {exec_time}) — resetting same-day guard")
+            self.last_execution_date = None
             # Only allow grace window when there was a previous known run time
             # (i.e. user changed the time mid-day). Not on a fresh/reset start.
-            _sod_allow_grace = last_exec_time_config is not None
+            self.allow_grace = self.last_exec_time_config is not None
 
-        if last_execution_date == today:
+        if self.last_execution_date == today:
             # Already ran today at this time — skip grace window, wait for tomorrow's trigger
-            wait = seconds_until_next_trigger(exec_time, grace_minutes=0)
+            grace = 0
         else:
-            grace = 10 if _sod_allow_grace else 0
-            wait = seconds_until_next_trigger(exec_time, grace_minutes=grace)
+            grace = 10 if self.allow_grace else 0
+        fire_at = next_trigger_at(exec_time, grace_minutes=grace, after=self.last_fired)
 
+        wait = seconds_until(fire_at)
         if wait > 2:
             logger.info(
-                f"Next order execution scheduled in {wait / 3600:.1f}h "
+                f"Next {self.name} scheduled in {wait / 3600:.1f}h "
                 f"(at {exec_time} ET on next weekday)"
             )
+        self.exec_time = exec_time
+        self.fire_at = fire_at
+        return fire_at
+
+    @abstractmethod
+    async def execute(self) -> None:
+        """Place this job's orders."""
 
-        await asyncio.sleep(wait)
+    @abstractmethod
+    def persist(self, execution_date: date, exec_time: str) -> None:
+        """Record the execution date/time so a restart knows this run fired."""
 
+    async def run(self) -> None:
+        exec_time = self.exec_time
+        if exec_time is None:
+            return
         try:
-            await run_order_execution(bot_state)
-            last_execution_date = datetime.now(ET).date()
-            last_exec_time_config = exec_time  # remember which time we just ran at
-            _sod_allow_grace = True             # future time changes should allow grace window
-            bot_state.db.set_last_sod_execution_date(last_execution_date)
-            bot_state.db.set_last_sod_exec_time(exec_time)  # persist so restart knows which time fired
+            await self.execute()
+            self.last_execution_date = datetime.now(ET).date()
+            self.last_exec_time_config = exec_time  # remember which time we just ran at
+            self.allow_grace = True                 # future time changes should allow grace window
+            self.persist(self.last_execution_date, exec_time)  # so a restart knows which time fired
         except Exception as e:
-            logger.error(f"Market-open order execution raised an unexpected error: {e}")
+            logger.error(f"Scheduled {self.name} raised an unexpected error: {e}")
 
-        # Buffer to prevent double-fire from clock jitter
-        await asyncio.sleep(120)
+        # Next trigger must be strictly after this one — prevents double-fire
+        self.last_fired = self.fire_at
 
 
-async def eod_scheduler_loop(bot_state) -> None:
+class MarketOpenJob(_ExecutionJob):
+    """
+    Runs buy + exit order execution at the configured `order_execution_time`
+    (set in Settings UI, weekdays only).
     """
-    EOD buy execution scheduler for Group A (A/B test).
 
-    Sleeps until the configured eod_order_execution_time (default 15:50 ET),
-    then runs run_eod_execution() to buy all Group A candidates flagged during
-    that day's scanner run.
+    name = "order execution"
+    time_key = "order_execution_time"
 
-    Only fires on weekdays. No-ops silently when ab_test_enabled = false.
-    Reads eod_order_execution_time from DB on each iteration so UI changes
-    take effect without a restart.
-    """
-    logger.info("EOD order execution scheduler started")
+    def __init__(self, bot_state, config: _ConfigCache):
+        db = bot_state.db
+        super().__init__(bot_state, config, db.get_last_sod_execution_date(), db.get_last_sod_exec_time())
 
-    # Load from DB so a restart within the grace window won't re-fire if EOD already ran today.
-    # last_exec_time_config is the configured time that was active when EOD *actually fired* —
-    # stored in DB so we survive restarts correctly without locking out a changed time.
-    last_execution_date = bot_state.db.get_last_eod_execution_date()
-    last_exec_time_config = bot_state.db.get_last_eod_exec_time()
-    # Grace window is only enabled when the configured time actively changed mid-day.
-    # On a fresh start or after a manual reset (last_exec_time_config=NULL, last_execution_date=NULL)
-    # we do NOT want the grace window — just wait for the next scheduled occurrence.
-    _eod_allow_grace = False
+    async def execute(self) -> None:
+        await run_order_execution(self.bot_state)
 
-    while True:
-        config = bot_state.db.get_config()
+    def persist(self, execution_date: date, exec_time: str) -> None:
+        self.bot_state.db.set_last_sod_execution_date(execution_date)
+        self.bot_state.db.set_last_sod_exec_time(exec_time)
 
-        # Sleep quietly when A/B test is disabled — check every 60s for toggle
-        if not config.get("ab_test_enabled"):
-            await asyncio.sleep(60)
-            continue
 
-        exec_time = config.get("eod_order_execution_time") or "15:50"
-        today = datetime.now(ET).date()
+class EodJob(_ExecutionJob):
+    """
+    EOD buy execution for Group A (A/B test).
 
-        # If the configured time changed since last run, reset the same-day guard so
-        # the new time can fire today (e.g. user moves EOD from 15:50 → 11:43 mid-day).
-        if last_exec_time_config != exec_time:
-            logger.info(f"EOD exec time changed ({last_exec_time_config} → {exec_time}) — resetting same-day guard")
-            last_execution_date = None
-            # Only allow grace window when there was a previous known run time
-            # (i.e. user changed the time mid-day). Not on a fresh/reset start.
-            _eod_allow_grace = last_exec_time_config is not None
+    Fires at the configured eod_order_execution_time (default 15:50 ET) and
+    runs run_eod_execution() to buy all Group A candidates flagged during
+    that day's scanner run. Idles (re-checking every minute) while
+    ab_test_enabled = false.
+    """
 
-        # last_execution_date is persisted in DB so restarts respect same-day guard.
-        if last_execution_date == today:
-            wait = seconds_until_next_trigger(exec_time, grace_minutes=0)
-        else:
-            grace = 10 if _eod_allow_grace else 0
-            wait = seconds_until_next_trigger(exec_time, grace_minutes=grace)
+    name = "EOD buy execution"
+    time_key = "eod_order_execution_time"
+    default_time = "15:50"
 
-        if wait > 2:
-            logger.info(
-                f"Next EOD buy execution scheduled in {wait / 3600:.1f}h "
-                f"(at {exec_time} ET on next weekday)"
-            )
+    def __init__(self, bot_state, config: _ConfigCache):
+        db = bot_state.db
+        super().__init__(bot_state, config, db.get_last_eod_execution_date(), db.get_last_eod_exec_time())
 
-        await asyncio.sleep(wait)
+    def enabled(self, config: dict) -> bool:
+        return bool(config.get("ab_test_enabled"))
 
-        try:
-            await run_eod_execution(bot_state)
-            last_execution_date = datetime.now(ET).date()
-            last_exec_time_config = exec_time  # remember which time we just ran at
-            _eod_allow_grace = True             # future time changes should allow grace window
-            bot_state.db.set_last_eod_execution_date(last_execution_date)
-            bot_state.db.set_last_eod_exec_time(exec_time)  # persist so restart knows which time fired
-        except Exception as e:
-            logger.error(f"EOD buy execution raised an unexpected error: {e}")
+    async def execute(self) -> None:
+        await run_eod_execution(self.bot_state)
+
+    def persist(self, execution_date: date, exec_time: str) -> None:
+        self.bot_state.db.set_last_eod_execution_date(execution_date)
+        self.bot_state.db.set_last_eod_exec_time(exec_time)
 
-        # Buffer to prevent double-fire from clock jitter
-        await asyncio.sleep(120)
+
+async def scheduler_loop(bot_state) -> None:
+    """
+    Long-running asyncio task driving the data update, SOD order execution
+    and EOD buy execution jobs from a single Scheduler.
+    """
+    logger.info("Scheduler started (data update, order execution, EOD buy execution)")
+    scheduler = Scheduler(bot_state.config_changed)
+    config = _ConfigCache(bot_state.db)
+    for job in (DataUpdateJob(bot_state, config), MarketOpenJob(bot_state, config), EodJob(bot_state, config)):
+        await scheduler.add(job)
+    await scheduler.run()
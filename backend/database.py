@@ -10,14 +10,20 @@ Handles all PostgreSQL database operations including:
 """
 
 import psycopg2
-from psycopg2 import sql, extras
+from psycopg2 import sql, extras, extensions, pool
 from psycopg2.extras import RealDictCursor
 from datetime import datetime, date
-from typing import List, Dict, Optional, Tuple
+from itertools import repeat
+from typing import Iterator, List, Dict, Optional, Tuple
 from zoneinfo import ZoneInfo
+import numpy as np
+import csv
+import io
 import json
 import logging
 import os
+import threading
+import time
 from dotenv import load_dotenv
 
 ET = ZoneInfo("America/New_York")  # all date logic uses ET, not machine local
@@ -26,6 +32,477 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+DB_POOL_MIN = int(os.getenv('DB_POOL_MIN', '2'))
+DB_POOL_MAX = int(os.getenv('DB_POOL_MAX', str((os.cpu_count() or 1) * 2 + 1)))
+
+DB_READ_CACHE_TTL = float(os.getenv('DB_READ_CACHE_TTL', '15'))   # seconds; 0 disables
+
+# Per-session limits so a stuck statement or lock wait fails fast instead of
+# stalling a pooled connection (milliseconds; 0 disables). create_tables()
+# lifts the statement limit for its one-off migrations.
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv('DB_STATEMENT_TIMEOUT_MS', '30000'))
+DB_LOCK_TIMEOUT_MS = int(os.getenv('DB_LOCK_TIMEOUT_MS', '5000'))
+
+COPY_MIN_ROWS = 1000   # bar upserts at least this big go through COPY instead of execute_values
+TRADES_FETCH_CHUNK = 500   # rows per round trip when streaming closed trades
+
+_DAILY_BAR_UPSERT = """
+    ON CONFLICT (symbol, date)
+    DO UPDATE SET
+        open = EXCLUDED.open,
+        high = EXCLUDED.high,
+        low = EXCLUDED.low,
+        close = EXCLUDED.close,
+        volume = EXCLUDED.volume
+"""
+
+
+# Column order of the recent_daily_bars statement below
+_BAR_COLUMNS = ('date', 'open', 'high', 'low', 'close', 'volume')
+
+# Hot statements (per-symbol lookups, UI-driven reads and writes), PREPAREd once
+# per pooled connection (see _execute_prepared) so repeat calls skip parse/plan
+# on the server
+_PREPARED_STATEMENTS = {
+    'latest_bar_date': """
+        PREPARE latest_bar_date(text) AS
+        SELECT MAX(date) FROM daily_bars WHERE symbol = $1
+    """,
+    'recent_daily_bars': """
+        PREPARE recent_daily_bars(text, integer) AS
+        SELECT date, open, high, low, close, volume
+        FROM daily_bars
+        WHERE symbol = $1
+        ORDER BY date DESC
+        LIMIT $2
+    """,
+    'upsert_ticker': """
+        PREPARE upsert_ticker(text, text, text) AS
+        INSERT INTO tickers (symbol, name, sector, active)
+        VALUES ($1, $2, $3, true)
+        ON CONFLICT (symbol) DO UPDATE
+        SET active = true, name = EXCLUDED.name, sector = EXCLUDED.sector
+    """,
+    'update_scan_override': """
+        PREPARE update_scan_override(boolean, text, date) AS
+        UPDATE scan_results
+        SET override = $1
+        WHERE symbol = $2 AND scan_date = $3
+    """,
+    'update_scan_entry_method': """
+        PREPARE update_scan_entry_method(text, text, date) AS
+        UPDATE scan_results
+        SET entry_method = $1
+        WHERE symbol = $2 AND scan_date = $3
+    """,
+    'save_position': """
+        PREPARE save_position(text, date, numeric, numeric, integer, numeric, numeric,
+                              numeric, numeric, text, integer, text, text) AS
+        INSERT INTO positions (
+            symbol, entry_date, entry_price, submitted_price, quantity, stop_loss,
+            cost_basis, max_price, max_gain_pct, status, trade_id, notes, ab_group
+        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13)
+        ON CONFLICT (symbol) DO UPDATE SET
+            entry_price = EXCLUDED.entry_price,
+            submitted_price = EXCLUDED.submitted_price,
+            quantity = EXCLUDED.quantity,
+            stop_loss = EXCLUDED.stop_loss,
+            cost_basis = EXCLUDED.cost_basis,
+            max_price = EXCLUDED.max_price,
+            max_gain_pct = EXCLUDED.max_gain_pct,
+            status = EXCLUDED.status,
+            trade_id = EXCLUDED.trade_id,
+            notes = EXCLUDED.notes,
+            ab_group = EXCLUDED.ab_group,
+            last_updated = CURRENT_TIMESTAMP
+    """,
+    # Dashboard reads polled by the UI; both select p.* / sr.*, which is safe
+    # because create_tables() finishes its column migrations before any
+    # connection prepares them
+    'latest_scan_results': """
+        PREPARE latest_scan_results AS
+        SELECT
+            sr.*,
+            sr.criteria_1_within_5pct_52w_high   AS criteria_1,
+            sr.criteria_2_above_50ma              AS criteria_2,
+            sr.criteria_3_50ma_above_150ma        AS criteria_3,
+            sr.criteria_4_150ma_above_200ma       AS criteria_4,
+            sr.criteria_5_200ma_trending_up       AS criteria_5,
+            sr.criteria_6_above_30pct_52w_low     AS criteria_6,
+            sr.criteria_7_breakout_volume         AS criteria_7,
+            sr.criteria_8_spy_above_50ma          AS criteria_8,
+            COALESCE(sr.entry_method, bc.default_entry_method, 'prev_close') as effective_entry_method,
+            bc.default_entry_method,
+            -- Always derive in_portfolio live from positions table so the flag
+            -- is accurate even across restarts / edge cases
+            (EXISTS (
+                SELECT 1 FROM positions p
+                WHERE p.symbol = sr.symbol AND p.status = 'OPEN'
+            )) AS in_portfolio
+        FROM scan_results sr
+        CROSS JOIN bot_config bc
+        WHERE sr.scan_date = (SELECT MAX(scan_date) FROM scan_results)
+        ORDER BY sr.qualified DESC, sr.symbol
+    """,
+    'open_positions': """
+        PREPARE open_positions AS
+        SELECT
+            p.*,
+            sr.price                        AS last_price,
+            sr.ma_50                        AS ma_50,
+            sr.scan_date                    AS price_scan_date,
+            sr.created_at                   AS price_scan_time,
+            CASE WHEN sr.price IS NOT NULL
+                 THEN ROUND(sr.price * p.quantity, 2) END  AS current_value,
+            CASE WHEN sr.price IS NOT NULL
+                 THEN ROUND(sr.price * p.quantity - p.cost_basis, 2) END AS pnl,
+            CASE WHEN sr.price IS NOT NULL AND p.cost_basis > 0
+                 THEN ROUND(
+                     (sr.price * p.quantity - p.cost_basis) / p.cost_basis * 100,
+                     4
+                 ) END AS pnl_pct
+        FROM positions p
+        -- One top-1 probe of idx_scan_results_symbol_latest per open position
+        -- (index-only: the index carries price and ma_50). price is cast back to
+        -- NUMERIC so the money math and ROUND() match the DECIMAL position columns.
+        LEFT JOIN LATERAL (
+            SELECT price::numeric AS price, ma_50, scan_date, created_at
+            FROM scan_results
+            WHERE symbol = p.symbol
+            ORDER BY scan_date DESC, created_at DESC
+            LIMIT 1
+        ) sr ON true
+        WHERE p.status = 'OPEN'
+        ORDER BY p.entry_date
+    """,
+}
+
+
+class _PooledConnection(extensions.connection):
+    """psycopg2 connection that remembers which statements it has PREPAREd."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = set()
+
+
+def _execute_prepared(cursor, name: str, params: Tuple = ()) -> None:
+    """EXECUTE a _PREPARED_STATEMENTS entry, preparing it on first use per connection."""
+    conn = cursor.connection
+    if name not in conn.prepared:
+        cursor.execute(_PREPARED_STATEMENTS[name])
+        conn.prepared.add(name)
+    if params:
+        cursor.execute(f"EXECUTE {name}({', '.join(['%s'] * len(params))})", params)
+    else:
+        cursor.execute(f"EXECUTE {name}")
+
+
+def _fetch_dicts(cursor) -> List[Dict]:
+    """
+    Fetch all rows as dicts. Zips each plain tuple with one column-name tuple
+    instead of building a RealDictRow per row and then copying it into a dict.
+    """
+    columns = tuple(d.name for d in cursor.description)
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+class _ReadCache:
+    """
+    Short-lived cache for identical reads repeated within seconds (UI polling
+    plus the scanner tick). Entries expire after `ttl` seconds, and a table's
+    entries are dropped as soon as this process writes to that table. A read
+    that races a write is not stored, so it can't resurrect stale data.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[Tuple, Tuple[float, object]] = {}   # (table, key) -> (expires_at, value)
+        self._generation: Dict[str, int] = {}                   # table -> write count
+        self._lock = threading.Lock()
+
+    def get(self, table: str, key, load):
+        """Return the cached value for (table, key), calling `load()` on a miss."""
+        if self.ttl <= 0:
+            return load()
+        now = time.monotonic()
+        entry = self._entries.get((table, key))
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        generation = self._generation.get(table, 0)
+        value = load()
+        with self._lock:
+            if self._generation.get(table, 0) == generation:
+                self._entries[(table, key)] = (now + self.ttl, value)
+        return value
+
+    def invalidate(self, table: str) -> None:
+        """Forget every cached read of `table` (call after committing a write)."""
+        with self._lock:
+            self._generation[table] = self._generation.get(table, 0) + 1
+            for cache_key in [k for k in self._entries if k[0] == table]:
+                del self._entries[cache_key]
+
+
+# Binary COPY layout of one get_all_daily_bars_batch() row: field count, then
+# (byte length, big-endian value) per column — fixed width since none is NULL
+_PGCOPY_BAR_ROW = np.dtype([
+    ('nfields', '>i2'),
+    ('ord_len', '>i4'), ('ord', '>i4'),
+    ('date_len', '>i4'), ('date', '>i4'),           # days since 2000-01-01
+    ('open_len', '>i4'), ('open', '>f8'),
+    ('high_len', '>i4'), ('high', '>f8'),
+    ('low_len', '>i4'), ('low', '>f8'),
+    ('close_len', '>i4'), ('close', '>f8'),
+    ('volume_len', '>i4'), ('volume', '>i8'),
+])
+_PGCOPY_HEADER_SIZE = 19    # 11-byte signature + flags + header-extension length
+_PGCOPY_TRAILER_SIZE = 2    # int16 -1
+_PG_EPOCH = np.datetime64('2000-01-01', 'D')
+
+# Screening columns stored as DOUBLE PRECISION (money columns in positions /
+# trades stay DECIMAL); create_tables() converts older DECIMAL versions
+_FLOAT_COLUMNS = {
+    'daily_bars': ('open', 'high', 'low', 'close'),
+    'scan_results': ('price', 'week_52_high', 'week_52_low',
+                     'ma_50', 'ma_150', 'ma_200', 'ma_200_1m_ago'),
+}
+
+# Columns added after the first release, as (table, column, definition).
+# create_tables() adds whichever are missing from an existing database.
+_COLUMN_MIGRATIONS = [
+    ('scan_results', 'override', 'BOOLEAN DEFAULT false'),
+    ('scan_results', 'entry_method', 'VARCHAR(50) DEFAULT NULL'),
+    ('scan_results', 'in_portfolio', 'BOOLEAN DEFAULT false'),
+    ('bot_config', 'default_entry_method', "VARCHAR(50) DEFAULT 'prev_close'"),
+    # data update tracking
+    ('bot_config', 'last_data_update', 'TIMESTAMP DEFAULT NULL'),
+    ('bot_config', 'data_update_status', "VARCHAR(20) DEFAULT 'idle'"),
+    ('bot_config', 'data_update_error', 'TEXT DEFAULT NULL'),
+    ('bot_config', 'data_update_time', "VARCHAR(5) DEFAULT '17:00'"),
+    ('bot_config', 'order_execution_time', "VARCHAR(5) DEFAULT '09:30'"),
+    # scanner criteria / exit settings
+    ('bot_config', 'near_52wh_pct', 'DECIMAL(5, 2) DEFAULT 5.0'),
+    ('bot_config', 'above_52wl_pct', 'DECIMAL(5, 2) DEFAULT 30.0'),
+    ('bot_config', 'volume_multiplier', 'DECIMAL(5, 2) DEFAULT 1.5'),
+    ('bot_config', 'spy_filter_enabled', 'BOOLEAN DEFAULT true'),
+    ('bot_config', 'trend_break_exit_enabled', 'BOOLEAN DEFAULT true'),
+    ('bot_config', 'limit_order_premium_pct', 'DECIMAL(5, 2) DEFAULT 1.0'),
+    ('bot_config', 'scanner_interval_seconds', 'INTEGER DEFAULT 30'),
+    ('positions', 'pending_exit', 'BOOLEAN DEFAULT false'),
+    ('positions', 'exit_reason', 'VARCHAR(100) DEFAULT NULL'),
+    # submitted_price = the limit/prev_close price we sent to IB
+    # entry_price     = the actual average fill price returned by IB
+    ('positions', 'submitted_price', 'DECIMAL(12, 4) DEFAULT NULL'),
+    ('trades', 'submitted_price', 'DECIMAL(12, 4) DEFAULT NULL'),
+    # original stop at entry time
+    ('trades', 'stop_loss', 'DECIMAL(12, 4) DEFAULT NULL'),
+    # ── A/B test ──
+    ('bot_config', 'eod_order_execution_time', "VARCHAR(5) DEFAULT '15:50'"),
+    ('bot_config', 'ab_test_enabled', 'BOOLEAN DEFAULT false'),
+    ('bot_config', 'ab_counter', 'INTEGER DEFAULT 0'),   # global round-robin counter for A/B assignment
+    # last SOD/EOD execution date and the configured time it fired at, persisted
+    # so a restart neither re-fires in the grace window nor misses a time change
+    ('bot_config', 'last_sod_execution_date', 'DATE DEFAULT NULL'),
+    ('bot_config', 'last_sod_exec_time', 'VARCHAR(5) DEFAULT NULL'),
+    ('bot_config', 'last_eod_execution_date', 'DATE DEFAULT NULL'),
+    ('bot_config', 'last_eod_exec_time', 'VARCHAR(5) DEFAULT NULL'),
+    ('scan_results', 'ab_group', 'VARCHAR(1) DEFAULT NULL'),
+    ('scan_results', 'eod_buy_pending', 'BOOLEAN DEFAULT false'),      # Group A candidates
+    ('scan_results', 'sod_skip_reason', 'VARCHAR(100) DEFAULT NULL'),  # why Group B was skipped at SOD
+    ('positions', 'ab_group', 'VARCHAR(1) DEFAULT NULL'),
+    ('trades', 'ab_group', 'VARCHAR(1) DEFAULT NULL'),
+]
+
+
+def _daily_bar_rows(symbol: str, bars) -> List[Tuple]:
+    """
+    Build (symbol, date, open, high, low, close, volume) rows for daily_bars.
+
+    Accepts a list of bar dicts or a BAR_DTYPE structured array as returned
+    by DataFetcher.fetch_historical_bars().  Arrays are converted column by
+    column, so no per-bar Python lookups happen before the insert.
+    """
+    symbol = symbol.upper()
+    if hasattr(bars, 'dtype'):
+        columns = [bars[name].tolist() for name in _BAR_COLUMNS]
+        return list(zip(repeat(symbol, len(bars)), *columns))
+    return [
+        (symbol, bar['date'], bar['open'], bar['high'], bar['low'], bar['close'], bar['volume'])
+        for bar in bars
+    ]
+
+
+def _upsert_daily_bar_rows(cursor, rows: List[Tuple]) -> None:
+    """
+    Upsert (symbol, date, open, high, low, close, volume) rows into daily_bars.
+
+    Small batches use one multi-row INSERT per page (execute_values). From
+    COPY_MIN_ROWS rows on, the rows are streamed as CSV into a temp table with
+    COPY and merged with a single INSERT ... SELECT, which skips per-row
+    parsing on the server. Temp tables are never WAL-logged, so the staging
+    load costs no WAL; it is also private to the session, so concurrent saves
+    can't see or truncate each other's rows. The caller owns the transaction.
+    """
+    if len(rows) < COPY_MIN_ROWS:
+        extras.execute_values(cursor, """
+            INSERT INTO daily_bars (symbol, date, open, high, low, close, volume)
+            VALUES %s
+        """ + _DAILY_BAR_UPSERT, rows, page_size=1000)
+        return
+
+    buf = io.StringIO()
+    csv.writer(buf).writerows(rows)   # None -> empty field -> NULL
+    buf.seek(0)
+
+    # volume is NUMERIC here so float volumes from bar dicts still load;
+    # the INSERT below casts it to BIGINT
+    cursor.execute("""
+        CREATE TEMP TABLE tmp_daily_bars (
+            symbol VARCHAR(20),
+            date DATE,
+            open DOUBLE PRECISION,
+            high DOUBLE PRECISION,
+            low DOUBLE PRECISION,
+            close DOUBLE PRECISION,
+            volume NUMERIC
+        ) ON COMMIT DROP
+    """)
+    cursor.copy_expert(
+        "COPY tmp_daily_bars (symbol, date, open, high, low, close, volume) FROM STDIN WITH (FORMAT CSV)",
+        buf
+    )
+    cursor.execute("""
+        INSERT INTO daily_bars (symbol, date, open, high, low, close, volume)
+        SELECT symbol, date, open, high, low, close, volume FROM tmp_daily_bars
+    """ + _DAILY_BAR_UPSERT)
+
+
+# Closed-trade and open-position aggregates behind get_statistics(); each
+# yields one row, so they can be cross-joined into a single query
+_CLOSED_TRADE_STATS = """
+    SELECT
+        COUNT(*) as total_trades,
+        SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END) as wins,
+        SUM(CASE WHEN pnl < 0 THEN 1 ELSE 0 END) as losses,
+        COALESCE(SUM(pnl), 0) as total_pnl,
+        COALESCE(AVG(pnl), 0) as avg_pnl,
+        COALESCE(MAX(pnl), 0) as max_win,
+        COALESCE(MIN(pnl), 0) as max_loss
+    FROM trades
+    WHERE status = 'CLOSED'
+"""
+_OPEN_POSITION_STATS = """
+    SELECT
+        COUNT(*) as open_positions,
+        COALESCE(SUM(cost_basis), 0) as total_invested
+    FROM positions
+    WHERE status = 'OPEN'
+"""
+_STATS_COLUMNS = 9   # columns selected by the two queries above
+
+
+def _statistics(row: Tuple) -> Dict:
+    """Build the get_statistics() dict from a row starting with the columns above."""
+    total_trades = row[0] or 0
+    wins = row[1] or 0
+    return {
+        'total_trades': total_trades,
+        'wins': wins,
+        'losses': row[2] or 0,
+        'win_rate': (wins / total_trades * 100) if total_trades > 0 else 0,
+        'total_pnl': float(row[3] or 0),
+        'avg_pnl': float(row[4] or 0),
+        'max_win': float(row[5] or 0),
+        'max_loss': float(row[6] or 0),
+        'open_positions': row[7] or 0,
+        'total_invested': float(row[8] or 0)
+    }
+
+
+def _ensure_daily_bar_partitions(cursor, first_year: int, last_year: int) -> None:
+    """
+    Create the yearly daily_bars partitions for first_year..last_year (those
+    missing) plus a DEFAULT partition for bars outside every yearly range.
+    create_tables() runs this on each startup with last_year = next year, so
+    the partition for incoming bars always exists before they arrive.
+    """
+    for year in range(first_year, last_year + 1):
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS daily_bars_{year} PARTITION OF daily_bars
+            FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')
+        """)
+    cursor.execute("CREATE TABLE IF NOT EXISTS daily_bars_default PARTITION OF daily_bars DEFAULT")
+
+
+# Multi-row scan_results upsert for execute_values(); ab_group / eod_buy_pending
+# are only filled in once per (scan_date, symbol)
+_SCAN_RESULT_UPSERT = """
+    INSERT INTO scan_results (
+        scan_date, symbol, price, week_52_high, week_52_low,
+        ma_50, ma_150, ma_200, ma_200_1m_ago,
+        volume, avg_volume_50,
+        criteria_1_within_5pct_52w_high,
+        criteria_2_above_50ma,
+        criteria_3_50ma_above_150ma,
+        criteria_4_150ma_above_200ma,
+        criteria_5_200ma_trending_up,
+        criteria_6_above_30pct_52w_low,
+        criteria_7_breakout_volume,
+        criteria_8_spy_above_50ma,
+        qualified, action, in_portfolio,
+        ab_group, eod_buy_pending, sod_skip_reason
+    ) VALUES %s
+    ON CONFLICT (scan_date, symbol)
+    DO UPDATE SET
+        price = EXCLUDED.price,
+        week_52_high = EXCLUDED.week_52_high,
+        week_52_low = EXCLUDED.week_52_low,
+        ma_50 = EXCLUDED.ma_50,
+        ma_150 = EXCLUDED.ma_150,
+        ma_200 = EXCLUDED.ma_200,
+        ma_200_1m_ago = EXCLUDED.ma_200_1m_ago,
+        volume = EXCLUDED.volume,
+        avg_volume_50 = EXCLUDED.avg_volume_50,
+        criteria_1_within_5pct_52w_high = EXCLUDED.criteria_1_within_5pct_52w_high,
+        criteria_2_above_50ma = EXCLUDED.criteria_2_above_50ma,
+        criteria_3_50ma_above_150ma = EXCLUDED.criteria_3_50ma_above_150ma,
+        criteria_4_150ma_above_200ma = EXCLUDED.criteria_4_150ma_above_200ma,
+        criteria_5_200ma_trending_up = EXCLUDED.criteria_5_200ma_trending_up,
+        criteria_6_above_30pct_52w_low = EXCLUDED.criteria_6_above_30pct_52w_low,
+        criteria_7_breakout_volume = EXCLUDED.criteria_7_breakout_volume,
+        criteria_8_spy_above_50ma = EXCLUDED.criteria_8_spy_above_50ma,
+        qualified = EXCLUDED.qualified,
+        action = EXCLUDED.action,
+        in_portfolio = EXCLUDED.in_portfolio,
+        ab_group = CASE WHEN scan_results.ab_group IS NULL
+                        THEN EXCLUDED.ab_group
+                        ELSE scan_results.ab_group END,
+        eod_buy_pending = CASE WHEN scan_results.ab_group IS NULL
+                              THEN EXCLUDED.eod_buy_pending
+                              ELSE scan_results.eod_buy_pending END,
+        sod_skip_reason = EXCLUDED.sod_skip_reason,
+        created_at = CURRENT_TIMESTAMP
+"""
+
+
+def _scan_result_row(result: Dict) -> Tuple:
+    """Column tuple for one scan_results row, in save_scan_results_batch() order."""
+    return (
+        result['scan_date'], result['symbol'], result['price'],
+        result['week_52_high'], result['week_52_low'],
+        result['ma_50'], result['ma_150'], result['ma_200'], result['ma_200_1m_ago'],
+        result['volume'], result['avg_volume_50'],
+        result['criteria_1'], result['criteria_2'], result['criteria_3'],
+        result['criteria_4'], result['criteria_5'], result['criteria_6'],
+        result['criteria_7'], result['criteria_8'],
+        result['qualified'], result['action'],
+        result.get('in_portfolio', False),
+        result.get('ab_group'),
+        result.get('eod_buy_pending', False),
+        result.get('sod_skip_reason'),
+    )
+
 
 class Database:
     """Manages all database operations for the Minervini trading bot."""
@@ -37,28 +514,76 @@ class Database:
             'user': os.getenv('DB_USER', 'postgres'),
             'password': os.getenv('DB_PASSWORD', ''),
             'host': os.getenv('DB_HOST', 'localhost'),
-            'port': int(os.getenv('DB_PORT', '5432'))
+            'port': int(os.getenv('DB_PORT', '5432')),
+            # JIT compilation only pays off for long analytic queries; for these
+            # short indexed lookups it just adds planning time
+            'options': (
+                f"-c jit=off -c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"
+                f" -c lock_timeout={DB_LOCK_TIMEOUT_MS}"
+            ),
         }
         
+        # Bumped by every bot_config write in this process so callers can cache
+        # get_config() and only re-read it after a change
+        self.config_version = 0
+
+        # Repeated identical ticker / bar / config reads within DB_READ_CACHE_TTL
+        # seconds are served from memory; writes below invalidate the table they touch
+        self._read_cache = _ReadCache(DB_READ_CACHE_TTL)
+
         logger.info(f"Database config: {self.connection_params['host']}:{self.connection_params['port']}/{self.connection_params['dbname']}")
-        
+
+        # Connections are reused instead of paying connect/auth on every call.
+        # ThreadedConnectionPool raises when exhausted, so the semaphore makes
+        # callers beyond DB_POOL_MAX wait for a free connection instead.
+        try:
+            self._pool = pool.ThreadedConnectionPool(
+                DB_POOL_MIN, DB_POOL_MAX, connection_factory=_PooledConnection, **self.connection_params
+            )
+        except psycopg2.Error as e:
+            logger.error(f"❌ Failed to connect to PostgreSQL: {e}")
+            raise
+        self._pool_slots = threading.BoundedSemaphore(DB_POOL_MAX)
+
         # Test connection
         self.test_connection()
     
     def get_connection(self):
-        """Get a new database connection."""
+        """
+        Borrow a connection from the pool (blocks while all DB_POOL_MAX are
+        in use). Hand it back with release_connection(), never conn.close().
+        """
+        self._pool_slots.acquire()
         try:
-            conn = psycopg2.connect(**self.connection_params)
-            return conn
+            return self._pool.getconn()
         except psycopg2.Error as e:
+            self._pool_slots.release()
             logger.error(f"❌ Database connection error: {e}")
             raise
+        except Exception:
+            self._pool_slots.release()
+            raise
+
+    def release_connection(self, conn):
+        """
+        Return a connection to the pool. An open transaction is rolled back
+        by the pool; a broken connection is discarded rather than reused.
+        """
+        try:
+            self._pool.putconn(conn, close=bool(conn.closed))
+        finally:
+            self._pool_slots.release()
     
+    def _config_written(self):
+        """Record a committed bot_config write: bump config_version and drop cached config reads."""
+        self.config_version += 1
+        self._read_cache.invalidate('bot_config')
+
     def test_connection(self):
         """Test database connectivity."""
         try:
             conn = self.get_connection()
-            conn.close()
+            self.release_connection(conn)
             logger.info("✅ PostgreSQL connection successful")
         except Exception as e:
             logger.error(f"❌ Failed to connect to PostgreSQL: {e}")
@@ -70,6 +595,10 @@ class Database:
         cursor = conn.cursor()
         
         try:
+            # Migrations (e.g. moving daily_bars into partitions) can outlast
+            # DB_STATEMENT_TIMEOUT_MS; lift it for this transaction only
+            cursor.execute("SET LOCAL statement_timeout = 0")
+
             # Tickers table - monitored stock universe
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS tickers (
@@ -81,21 +610,39 @@ class Database:
                 )
             """)
             
-            # Daily bars - historical OHLCV data
+            # Daily bars - historical OHLCV data, range-partitioned by year so the
+            # scanner's recent-bars reads only touch the newest partitions
+            cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass('daily_bars')")
+            row = cursor.fetchone()
+            first_year = datetime.now(ET).year - 1   # bootstrap loads one year of history
+            if row and row[0] == 'r':
+                # Pre-partitioning table: move its rows into the partitioned one below
+                cursor.execute("ALTER TABLE daily_bars RENAME TO daily_bars_unpartitioned")
+                cursor.execute("ALTER INDEX IF EXISTS daily_bars_pkey RENAME TO daily_bars_unpartitioned_pkey")
+                cursor.execute("SELECT EXTRACT(YEAR FROM MIN(date))::int FROM daily_bars_unpartitioned")
+                first_year = min(first_year, cursor.fetchone()[0] or first_year)
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS daily_bars (
-                    id SERIAL PRIMARY KEY,
                     symbol VARCHAR(20) NOT NULL,
                     date DATE NOT NULL,
-                    open DECIMAL(12, 4),
-                    high DECIMAL(12, 4),
-                    low DECIMAL(12, 4),
-                    close DECIMAL(12, 4),
+                    open DOUBLE PRECISION,
+                    high DOUBLE PRECISION,
+                    low DOUBLE PRECISION,
+                    close DOUBLE PRECISION,
                     volume BIGINT,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(symbol, date)
-                )
+                    PRIMARY KEY (symbol, date)
+                ) PARTITION BY RANGE (date)
             """)
+            _ensure_daily_bar_partitions(cursor, first_year, datetime.now(ET).year + 1)
+            if row and row[0] == 'r':
+                cursor.execute("""
+                    INSERT INTO daily_bars (symbol, date, open, high, low, close, volume, created_at)
+                    SELECT symbol, date, open, high, low, close, volume, created_at
+                    FROM daily_bars_unpartitioned
+                """)
+                logger.info(f"✅ Moved {cursor.rowcount} bars into the partitioned daily_bars table")
+                cursor.execute("DROP TABLE daily_bars_unpartitioned")
             
             # Scanner results - daily qualification status
             cursor.execute("""
@@ -103,13 +650,13 @@ class Database:
                     id SERIAL PRIMARY KEY,
                     scan_date DATE NOT NULL,
                     symbol VARCHAR(20) NOT NULL,
-                    price DECIMAL(12, 4),
-                    week_52_high DECIMAL(12, 4),
-                    week_52_low DECIMAL(12, 4),
-                    ma_50 DECIMAL(12, 4),
-                    ma_150 DECIMAL(12, 4),
-                    ma_200 DECIMAL(12, 4),
-                    ma_200_1m_ago DECIMAL(12, 4),
+                    price DOUBLE PRECISION,
+                    week_52_high DOUBLE PRECISION,
+                    week_52_low DOUBLE PRECISION,
+                    ma_50 DOUBLE PRECISION,
+                    ma_150 DOUBLE PRECISION,
+                    ma_200 DOUBLE PRECISION,
+                    ma_200_1m_ago DOUBLE PRECISION,
                     volume BIGINT,
                     avg_volume_50 BIGINT,
                     criteria_1_within_5pct_52w_high BOOLEAN,
@@ -130,48 +677,6 @@ class Database:
                 )
             """)
             
-            # Add override column if it doesn't exist (migration)
-            cursor.execute("""
-                DO $$ 
-                BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns 
-                        WHERE table_name='scan_results' AND column_name='override'
-                    ) THEN
-                        ALTER TABLE scan_results ADD COLUMN override BOOLEAN DEFAULT false;
-                    END IF;
-                END $$;
-            """)
-            
-            # Add entry_method column if it doesn't exist (migration)
-            cursor.execute("""
-                DO $$
-                BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='scan_results' AND column_name='entry_method'
-                    ) THEN
-                        ALTER TABLE scan_results ADD COLUMN entry_method VARCHAR(50) DEFAULT NULL;
-                    ELSE
-                        -- Set existing 'prev_close' values to NULL (use default instead)
-                        UPDATE scan_results SET entry_method = NULL WHERE entry_method = 'prev_close';
-                    END IF;
-                END $$;
-            """)
-
-            # Add in_portfolio column if it doesn't exist (migration)
-            cursor.execute("""
-                DO $$
-                BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='scan_results' AND column_name='in_portfolio'
-                    ) THEN
-                        ALTER TABLE scan_results ADD COLUMN in_portfolio BOOLEAN DEFAULT false;
-                    END IF;
-                END $$;
-            """)
-            
             # Positions - open positions
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS positions (
@@ -244,354 +749,72 @@ class Database:
                 ON CONFLICT (id) DO NOTHING
             """)
             
-            # Add default_entry_method column if it doesn't exist (migration)
-            cursor.execute("""
-                DO $$
-                BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='bot_config' AND column_name='default_entry_method'
-                    ) THEN
-                        ALTER TABLE bot_config ADD COLUMN default_entry_method VARCHAR(50) DEFAULT 'prev_close';
-                    END IF;
-                END $$;
-            """)
-
-            # Add data update tracking columns if they don't exist (migration)
-            cursor.execute("""
-                DO $$
-                BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='bot_config' AND column_name='last_data_update'
-                    ) THEN
-                        ALTER TABLE bot_config
-                            ADD COLUMN last_data_update TIMESTAMP DEFAULT NULL,
-                            ADD COLUMN data_update_status VARCHAR(20) DEFAULT 'idle',
-                            ADD COLUMN data_update_error TEXT DEFAULT NULL;
-                    END IF;
-                END $$;
-            """)
-
-            # Add configurable update time column if it doesn't exist (migration)
-            cursor.execute("""
-                DO $$
-                BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='bot_config' AND column_name='data_update_time'
-                    ) THEN
-                        ALTER TABLE bot_config
-                            ADD COLUMN data_update_time VARCHAR(5) DEFAULT '17:00';
-                    END IF;
-                END $$;
-            """)
-
-            # Add order execution time column if it doesn't exist (migration)
-            cursor.execute("""
-                DO $$
-                BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='bot_config' AND column_name='order_execution_time'
-                    ) THEN
-                        ALTER TABLE bot_config
-                            ADD COLUMN order_execution_time VARCHAR(5) DEFAULT '09:30';
-                    END IF;
-                END $$;
-            """)
-
-            # Add buy qualification criteria thresholds if they don't exist (migration)
-            cursor.execute("""
-                DO $$
-                BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='bot_config' AND column_name='near_52wh_pct'
-                    ) THEN
-                        ALTER TABLE bot_config ADD COLUMN near_52wh_pct DECIMAL(5, 2) DEFAULT 5.0;
-                    END IF;
-                END $$;
-            """)
-            cursor.execute("""
-                DO $$
-                BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='bot_config' AND column_name='above_52wl_pct'
-                    ) THEN
-                        ALTER TABLE bot_config ADD COLUMN above_52wl_pct DECIMAL(5, 2) DEFAULT 30.0;
-                    END IF;
-                END $$;
-            """)
-            cursor.execute("""
-                DO $$
-                BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='bot_config' AND column_name='volume_multiplier'
-                    ) THEN
-                        ALTER TABLE bot_config ADD COLUMN volume_multiplier DECIMAL(5, 2) DEFAULT 1.5;
-                    END IF;
-                END $$;
-            """)
-            cursor.execute("""
-                DO $$
-                BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='bot_config' AND column_name='spy_filter_enabled'
-                    ) THEN
-                        ALTER TABLE bot_config ADD COLUMN spy_filter_enabled BOOLEAN DEFAULT true;
-                    END IF;
-                END $$;
-            """)
-            cursor.execute("""
-                DO $$
-                BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='bot_config' AND column_name='trend_break_exit_enabled'
-                    ) THEN
-                        ALTER TABLE bot_config ADD COLUMN trend_break_exit_enabled BOOLEAN DEFAULT true;
-                    END IF;
-                END $$;
-            """)
-            cursor.execute("""
-                DO $$
-                BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='bot_config' AND column_name='limit_order_premium_pct'
-                    ) THEN
-                        ALTER TABLE bot_config ADD COLUMN limit_order_premium_pct DECIMAL(5, 2) DEFAULT 1.0;
-                    END IF;
-                END $$;
-            """)
-            cursor.execute("""
-                DO $$
-                BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='bot_config' AND column_name='scanner_interval_seconds'
-                    ) THEN
-                        ALTER TABLE bot_config ADD COLUMN scanner_interval_seconds INTEGER DEFAULT 30;
-                    END IF;
-                END $$;
-            """)
-
-            # Add pending_exit and exit_reason columns to positions if they don't exist (migration)
-            cursor.execute("""
-                DO $$
-                BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='positions' AND column_name='pending_exit'
-                    ) THEN
-                        ALTER TABLE positions
-                            ADD COLUMN pending_exit BOOLEAN DEFAULT false,
-                            ADD COLUMN exit_reason VARCHAR(100) DEFAULT NULL;
-                    END IF;
-                END $$;
-            """)
-
-            # Add submitted_price to positions if it doesn't exist (migration)
-            # submitted_price = the limit/prev_close price we sent to IB
-            # entry_price     = the actual average fill price returned by IB
-            cursor.execute("""
-                DO $$
-                BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='positions' AND column_name='submitted_price'
-                    ) THEN
-                        ALTER TABLE positions
-                            ADD COLUMN submitted_price DECIMAL(12, 4) DEFAULT NULL;
-                    END IF;
-                END $$;
-            """)
-
-            # Add submitted_price to trades if it doesn't exist (migration)
-            cursor.execute("""
-                DO $$
-                BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='trades' AND column_name='submitted_price'
-                    ) THEN
-                        ALTER TABLE trades
-                            ADD COLUMN submitted_price DECIMAL(12, 4) DEFAULT NULL;
-                    END IF;
-                END $$;
-            """)
-
-            # Migration: add stop_loss to trades table (preserves original stop at entry time)
-            cursor.execute("""
-                DO $$ BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='trades' AND column_name='stop_loss'
-                    ) THEN
-                        ALTER TABLE trades
-                            ADD COLUMN stop_loss DECIMAL(12, 4) DEFAULT NULL;
-                    END IF;
-                END $$;
-            """)
-
-            # ── A/B test migrations ──────────────────────────────────────────────
-
-            # bot_config: EOD execution time
-            cursor.execute("""
-                DO $$ BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='bot_config' AND column_name='eod_order_execution_time'
-                    ) THEN
-                        ALTER TABLE bot_config ADD COLUMN eod_order_execution_time VARCHAR(5) DEFAULT '15:50';
-                    END IF;
-                END $$;
-            """)
-
-            # bot_config: A/B test enabled flag
-            cursor.execute("""
-                DO $$ BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='bot_config' AND column_name='ab_test_enabled'
-                    ) THEN
-                        ALTER TABLE bot_config ADD COLUMN ab_test_enabled BOOLEAN DEFAULT false;
-                    END IF;
-                END $$;
-            """)
-
-            # bot_config: global round-robin counter for A/B assignment
-            cursor.execute("""
-                DO $$ BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='bot_config' AND column_name='ab_counter'
-                    ) THEN
-                        ALTER TABLE bot_config ADD COLUMN ab_counter INTEGER DEFAULT 0;
-                    END IF;
-                END $$;
-            """)
-
-            # bot_config: last SOD execution date (persisted across restarts to prevent grace-window re-fire)
-            cursor.execute("""
-                DO $$ BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='bot_config' AND column_name='last_sod_execution_date'
-                    ) THEN
-                        ALTER TABLE bot_config ADD COLUMN last_sod_execution_date DATE DEFAULT NULL;
-                    END IF;
-                END $$;
-            """)
-
-            # bot_config: last SOD configured time at which it fired (used to detect time changes across restarts)
-            cursor.execute("""
-                DO $$ BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='bot_config' AND column_name='last_sod_exec_time'
-                    ) THEN
-                        ALTER TABLE bot_config ADD COLUMN last_sod_exec_time VARCHAR(5) DEFAULT NULL;
-                    END IF;
-                END $$;
-            """)
-
-            # bot_config: last EOD execution date (persisted across restarts to prevent grace-window re-fire)
-            cursor.execute("""
-                DO $$ BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='bot_config' AND column_name='last_eod_execution_date'
-                    ) THEN
-                        ALTER TABLE bot_config ADD COLUMN last_eod_execution_date DATE DEFAULT NULL;
-                    END IF;
-                END $$;
-            """)
-
-            # bot_config: last EOD configured time at which it fired (used to detect time changes across restarts)
-            cursor.execute("""
-                DO $$ BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='bot_config' AND column_name='last_eod_exec_time'
-                    ) THEN
-                        ALTER TABLE bot_config ADD COLUMN last_eod_exec_time VARCHAR(5) DEFAULT NULL;
-                    END IF;
-                END $$;
-            """)
-
-            # scan_results: which A/B group this candidate was assigned to
-            cursor.execute("""
-                DO $$ BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='scan_results' AND column_name='ab_group'
-                    ) THEN
-                        ALTER TABLE scan_results ADD COLUMN ab_group VARCHAR(1) DEFAULT NULL;
-                    END IF;
-                END $$;
-            """)
-
-            # scan_results: EOD buy pending flag for Group A candidates
-            cursor.execute("""
-                DO $$ BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='scan_results' AND column_name='eod_buy_pending'
-                    ) THEN
-                        ALTER TABLE scan_results ADD COLUMN eod_buy_pending BOOLEAN DEFAULT false;
-                    END IF;
-                END $$;
-            """)
-
-            # scan_results: why Group B was skipped at SOD re-verify
-            cursor.execute("""
-                DO $$ BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='scan_results' AND column_name='sod_skip_reason'
-                    ) THEN
-                        ALTER TABLE scan_results ADD COLUMN sod_skip_reason VARCHAR(100) DEFAULT NULL;
-                    END IF;
-                END $$;
-            """)
-
-            # positions: carry ab_group from scan_results when a buy is executed
-            cursor.execute("""
-                DO $$ BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='positions' AND column_name='ab_group'
-                    ) THEN
-                        ALTER TABLE positions ADD COLUMN ab_group VARCHAR(1) DEFAULT NULL;
-                    END IF;
-                END $$;
-            """)
-
-            # trades: carry ab_group from positions when a trade is closed
-            cursor.execute("""
-                DO $$ BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name='trades' AND column_name='ab_group'
-                    ) THEN
-                        ALTER TABLE trades ADD COLUMN ab_group VARCHAR(1) DEFAULT NULL;
-                    END IF;
-                END $$;
-            """)
+            # Column migrations for databases created by older versions: read
+            # the existing columns once, then add only the missing ones
+            cursor.execute("""
+                SELECT table_name, column_name, data_type FROM information_schema.columns
+                WHERE table_schema = current_schema() AND table_name = ANY(%s)
+            """, (sorted({table for table, _, _ in _COLUMN_MIGRATIONS} | set(_FLOAT_COLUMNS)),))
+            existing = {(table, column): data_type for table, column, data_type in cursor.fetchall()}
+            missing = [m for m in _COLUMN_MIGRATIONS if m[:2] not in existing]
+            if missing:
+                cursor.execute(";".join(
+                    f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {column} {definition}"
+                    for table, column, definition in missing
+                ))
+                logger.info(f"Added {len(missing)} missing column(s): "
+                            f"{', '.join(f'{t}.{c}' for t, c, _ in missing)}")
+
+            # Bar prices and scanner MAs used to be DECIMAL(12, 4); float8 avoids
+            # building a Decimal per value on every read. One-off table rewrite.
+            for table, columns in _FLOAT_COLUMNS.items():
+                numeric = [c for c in columns if existing.get((table, c)) == 'numeric']
+                if numeric:
+                    logger.info(f"Converting {table}.{', '.join(numeric)} to double precision...")
+                    cursor.execute(f"ALTER TABLE {table} " + ", ".join(
+                        f"ALTER COLUMN {c} TYPE DOUBLE PRECISION USING {c}::double precision"
+                        for c in numeric
+                    ))
+
+            # entry_method used to default to 'prev_close'; existing rows use NULL
+            # (i.e. the configured default) instead
+            if ('scan_results', 'entry_method') in existing:
+                cursor.execute("UPDATE scan_results SET entry_method = NULL WHERE entry_method = 'prev_close'")
 
             # Create indexes
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_daily_bars_symbol ON daily_bars(symbol)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_daily_bars_date ON daily_bars(date)")
+            # Partition pruning covers date-range filters; the global date index is dead weight
+            cursor.execute("DROP INDEX IF EXISTS idx_daily_bars_date")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_daily_bars_symbol_date ON daily_bars(symbol, date)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_scan_results_date ON scan_results(scan_date)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_scan_results_qualified ON scan_results(qualified)")
+            # Qualified rows of one scan date (EOD Group A / SOD Group B candidates)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_scan_results_qualified_partial
+                ON scan_results(scan_date DESC, symbol) WHERE qualified = true
+            """)
+            # Latest scan row per symbol (open positions view, ab_group lookups);
+            # UNIQUE(scan_date, symbol) leads with the date so it can't serve these.
+            # Matches get_positions()' full ORDER BY and carries its columns, so
+            # that lookup needs neither a sort nor a heap visit.
+            cursor.execute("DROP INDEX IF EXISTS idx_scan_results_symbol_date")   # superseded
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_scan_results_symbol_latest
+                ON scan_results(symbol, scan_date DESC, created_at DESC) INCLUDE (price, ma_50)
+            """)
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_symbol ON trades(symbol)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_status ON trades(status)")
+            # Partial indexes in the exact order the open/closed views read; they
+            # stay small as closed history accumulates
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_positions_open ON positions(entry_date) WHERE status = 'OPEN'")
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_positions_open_pending
+                ON positions(entry_date) WHERE status = 'OPEN' AND pending_exit = true
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_trades_closed_exit
+                ON trades(exit_date DESC, created_at DESC) WHERE status = 'CLOSED'
+            """)
             
             conn.commit()
             logger.info("✅ Database tables created/verified")
@@ -602,7 +825,7 @@ class Database:
             raise
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
     
     # ==================== TICKERS ====================
     
@@ -612,14 +835,10 @@ class Database:
         cursor = conn.cursor()
         
         try:
-            cursor.execute("""
-                INSERT INTO tickers (symbol, name, sector, active)
-                VALUES (%s, %s, %s, true)
-                ON CONFLICT (symbol) DO UPDATE 
-                SET active = true, name = EXCLUDED.name, sector = EXCLUDED.sector
-            """, (symbol.upper(), name, sector))
+            _execute_prepared(cursor, 'upsert_ticker', (symbol.upper(), name, sector))
             
             conn.commit()
+            self._read_cache.invalidate('tickers')
             logger.info(f"✅ Added ticker: {symbol}")
             return True
             
@@ -629,8 +848,46 @@ class Database:
             return False
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
     
+    def add_tickers(self, items: List[Tuple[str, Optional[str], Optional[str]]]) -> int:
+        """
+        Add many (symbol, name, sector) tickers in one multi-row upsert.
+
+        Same semantics as add_ticker() (re-activates and renames existing
+        symbols). Returns the number of tickers written (0 on failure).
+        """
+        # Last entry wins if a symbol is listed twice (one upsert can't touch a row twice)
+        rows = list({
+            symbol.upper(): (symbol.upper(), name, sector, True) for symbol, name, sector in items
+        }.values())
+        if not rows:
+            return 0
+
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        try:
+            extras.execute_values(cursor, """
+                INSERT INTO tickers (symbol, name, sector, active)
+                VALUES %s
+                ON CONFLICT (symbol) DO UPDATE
+                SET active = true, name = EXCLUDED.name, sector = EXCLUDED.sector
+            """, rows, page_size=1000)
+
+            conn.commit()
+            self._read_cache.invalidate('tickers')
+            logger.info(f"✅ Added {len(rows)} tickers")
+            return len(rows)
+
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"❌ Error adding {len(rows)} tickers: {e}")
+            return 0
+        finally:
+            cursor.close()
+            self.release_connection(conn)
+
     def remove_ticker(self, symbol: str) -> bool:
         """Remove a ticker (soft delete)."""
         conn = self.get_connection()
@@ -644,6 +901,7 @@ class Database:
             """, (symbol.upper(),))
             
             conn.commit()
+            self._read_cache.invalidate('tickers')
             logger.info(f"✅ Removed ticker: {symbol}")
             return True
             
@@ -653,10 +911,13 @@ class Database:
             return False
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
     
     def get_active_tickers(self) -> List[str]:
-        """Get list of active tickers."""
+        """Get list of active tickers (cached briefly, see _ReadCache)."""
+        return list(self._read_cache.get('tickers', 'active', self._load_active_tickers))
+
+    def _load_active_tickers(self) -> List[str]:
         conn = self.get_connection()
         cursor = conn.cursor()
         
@@ -672,12 +933,15 @@ class Database:
             
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
     
     def get_all_tickers(self) -> List[Dict]:
-        """Get all tickers with details."""
+        """Get all tickers with details (cached briefly, see _ReadCache)."""
+        return list(self._read_cache.get('tickers', 'all', self._load_all_tickers))
+
+    def _load_all_tickers(self) -> List[Dict]:
         conn = self.get_connection()
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
+        cursor = conn.cursor()
         
         try:
             cursor.execute("""
@@ -686,44 +950,32 @@ class Database:
                 ORDER BY symbol
             """)
             
-            return [dict(row) for row in cursor.fetchall()]
+            return _fetch_dicts(cursor)
             
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
     
     # ==================== DAILY BARS ====================
     
-    def save_daily_bars(self, symbol: str, bars: List[Dict]) -> int:
-        """Save multiple daily bars for a symbol."""
+    def save_daily_bars(self, symbol: str, bars) -> int:
+        """
+        Save multiple daily bars for a symbol.
+
+        `bars` is either a list of bar dicts or a BAR_DTYPE structured array
+        as returned by DataFetcher.fetch_historical_bars().
+        """
+        rows = _daily_bar_rows(symbol, bars)
+
         conn = self.get_connection()
         cursor = conn.cursor()
         
         try:
-            inserted = 0
-            for bar in bars:
-                cursor.execute("""
-                    INSERT INTO daily_bars (symbol, date, open, high, low, close, volume)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (symbol, date) 
-                    DO UPDATE SET 
-                        open = EXCLUDED.open,
-                        high = EXCLUDED.high,
-                        low = EXCLUDED.low,
-                        close = EXCLUDED.close,
-                        volume = EXCLUDED.volume
-                """, (
-                    symbol.upper(),
-                    bar['date'],
-                    bar['open'],
-                    bar['high'],
-                    bar['low'],
-                    bar['close'],
-                    bar['volume']
-                ))
-                inserted += 1
-            
+            _upsert_daily_bar_rows(cursor, rows)
+            inserted = len(rows)
+
             conn.commit()
+            self._read_cache.invalidate('daily_bars')
             logger.info(f"✅ Saved {inserted} bars for {symbol}")
             return inserted
             
@@ -733,211 +985,243 @@ class Database:
             return 0
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
     
+    def save_daily_bars_bulk(self, bars_by_symbol: Dict[str, object]) -> int:
+        """
+        Save daily bars for many symbols in a single transaction.
+
+        `bars_by_symbol` maps symbol -> bars in any form accepted by
+        save_daily_bars(). Large batches are loaded with COPY (see
+        _upsert_daily_bar_rows), so a whole batch of symbols costs a handful
+        of round trips instead of one per bar.
+        Returns the number of rows written (0 on failure).
+        """
+        rows = [
+            row
+            for symbol, bars in bars_by_symbol.items()
+            for row in _daily_bar_rows(symbol, bars)
+        ]
+        if not rows:
+            return 0
+
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        try:
+            _upsert_daily_bar_rows(cursor, rows)
+
+            conn.commit()
+            self._read_cache.invalidate('daily_bars')
+            logger.info(f"✅ Saved {len(rows)} bars for {len(bars_by_symbol)} symbols")
+            return len(rows)
+
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"❌ Error saving bars for {len(bars_by_symbol)} symbols: {e}")
+            return 0
+        finally:
+            cursor.close()
+            self.release_connection(conn)
+
     def get_daily_bars(self, symbol: str, limit: int = 300) -> List[Dict]:
-        """Get recent daily bars for a symbol."""
+        """
+        Get recent daily bars for a symbol (newest first; cached briefly, see
+        _ReadCache). The list is the caller's to reorder.
+        """
+        symbol = symbol.upper()
+        return list(self._read_cache.get(
+            'daily_bars', ('bars', symbol, limit), lambda: self._load_daily_bars(symbol, limit)
+        ))
+
+    def _load_daily_bars(self, symbol: str, limit: int) -> List[Dict]:
+        # `symbol` arrives uppercased from get_daily_bars()
         conn = self.get_connection()
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
+        cursor = conn.cursor()   # plain tuples: no RealDictRow built and then copied per bar
         
         try:
-            cursor.execute("""
-                SELECT date, open, high, low, close, volume
-                FROM daily_bars
-                WHERE symbol = %s
-                ORDER BY date DESC
-                LIMIT %s
-            """, (symbol.upper(), limit))
+            _execute_prepared(cursor, 'recent_daily_bars', (symbol, limit))
             
-            return [dict(row) for row in cursor.fetchall()]
+            return [dict(zip(_BAR_COLUMNS, row)) for row in cursor.fetchall()]
             
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
     
-    def get_all_daily_bars_batch(self, symbols: List[str], limit: int = 300) -> Dict[str, List[Dict]]:
+    def get_all_daily_bars_batch(self, symbols: List[str], limit: int = 300) -> Dict[str, np.ndarray]:
         """
         Fetch recent daily bars for ALL given symbols in a single SQL query.
-        Returns a dict mapping symbol -> list of bars (descending date order,
-        same layout as get_daily_bars so existing callers need no changes).
+        Returns a dict mapping symbol -> BAR_DTYPE structured array (most
+        recent last, the same layout DataFetcher.fetch_historical_bars()
+        returns), so the scanner can work on whole columns with NumPy.
+        Symbols with no stored bars map to an empty array.
 
         This replaces N individual get_daily_bars() calls in the scanner loop
         with one round-trip, cutting scan time significantly.
         """
+        from data_fetcher import BAR_DTYPE   # deferred: keeps ib_insync out of plain DB use
+
         if not symbols:
             return {}
 
+        unique = list(dict.fromkeys(symbols))   # each symbol joins once
+
         conn = self.get_connection()
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
+        cursor = conn.cursor()
 
         try:
-            # Use a window function to pick the most-recent `limit` rows per symbol
-            cursor.execute("""
-                SELECT symbol, date, open, high, low, close, volume
-                FROM (
-                    SELECT symbol, date, open, high, low, close, volume,
-                           ROW_NUMBER() OVER (PARTITION BY symbol ORDER BY date DESC) AS rn
+            # LATERAL + LIMIT reads each symbol's newest `limit` rows straight off
+            # the (symbol, date) index instead of ranking every stored bar.
+            # Streamed as binary COPY: no per-value Python objects, and because
+            # the symbol goes out as its position in `unique` and NULLs are
+            # coalesced (price -> NaN, volume -> 0), every row has the same
+            # width and the whole payload decodes with one np.frombuffer().
+            query = cursor.mogrify("""
+                SELECT s.ord::int4, b.date,
+                       COALESCE(b.open, 'NaN')::float8, COALESCE(b.high, 'NaN')::float8,
+                       COALESCE(b.low, 'NaN')::float8, COALESCE(b.close, 'NaN')::float8,
+                       COALESCE(b.volume, 0)::int8
+                FROM unnest(%s::text[]) WITH ORDINALITY AS s(symbol, ord)
+                CROSS JOIN LATERAL (
+                    SELECT date, open, high, low, close, volume
                     FROM daily_bars
-                    WHERE symbol = ANY(%s)
-                ) ranked
-                WHERE rn <= %s
-                ORDER BY symbol, date DESC
-            """, (list(symbols), limit))
-
-            rows = cursor.fetchall()
-
-            # Group into per-symbol lists (already DESC ordered)
-            result: Dict[str, List[Dict]] = {s: [] for s in symbols}
-            for row in rows:
-                sym = row['symbol']
-                if sym in result:
-                    result[sym].append({
-                        'date':   row['date'],
-                        'open':   row['open'],
-                        'high':   row['high'],
-                        'low':    row['low'],
-                        'close':  row['close'],
-                        'volume': row['volume'],
-                    })
+                    WHERE daily_bars.symbol = s.symbol
+                    ORDER BY date DESC
+                    LIMIT %s
+                ) b
+                ORDER BY s.ord, b.date
+            """, (unique, limit)).decode()
+            buf = io.BytesIO()
+            cursor.copy_expert(f"COPY ({query}) TO STDOUT WITH (FORMAT BINARY)", buf)
+            rows = np.frombuffer(
+                buf.getbuffer()[_PGCOPY_HEADER_SIZE:-_PGCOPY_TRAILER_SIZE], dtype=_PGCOPY_BAR_ROW
+            )
+
+            result: Dict[str, np.ndarray] = {s: np.empty(0, dtype=BAR_DTYPE) for s in symbols}
+            if len(rows) == 0:
+                return result
+
+            bars = np.empty(len(rows), dtype=BAR_DTYPE)
+            bars['date'] = _PG_EPOCH + rows['date'].astype('timedelta64[D]')
+            for field in ('open', 'high', 'low', 'close', 'volume'):
+                bars[field] = rows[field]
+
+            # Rows arrive grouped by symbol position in date order: split on changes
+            ords = rows['ord']
+            starts = np.flatnonzero(np.diff(ords)) + 1
+            for chunk, ord_ in zip(np.split(bars, starts), ords[np.r_[0, starts]]):
+                result[unique[ord_ - 1]] = chunk
             return result
 
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
 
     def get_latest_bar_date(self, symbol: str) -> Optional[date]:
-        """Get the date of the most recent bar for a symbol."""
+        """Get the date of the most recent bar for a symbol (cached briefly, see _ReadCache)."""
+        symbol = symbol.upper()
+        return self._read_cache.get(
+            'daily_bars', ('latest', symbol), lambda: self._load_latest_bar_date(symbol)
+        )
+
+    def _load_latest_bar_date(self, symbol: str) -> Optional[date]:
+        # `symbol` arrives uppercased from get_latest_bar_date()
         conn = self.get_connection()
         cursor = conn.cursor()
         
         try:
-            cursor.execute("""
-                SELECT MAX(date) FROM daily_bars WHERE symbol = %s
-            """, (symbol.upper(),))
+            _execute_prepared(cursor, 'latest_bar_date', (symbol,))
             
             result = cursor.fetchone()
             return result[0] if result and result[0] else None
             
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
+    
+    def get_latest_bar_dates(self, symbols: List[str]) -> Dict[str, date]:
+        """
+        Get the most recent bar date for many symbols in a single grouped query.
+
+        Returns a dict keyed by the symbols as passed in; symbols with no
+        stored bars are absent.
+        """
+        if not symbols:
+            return {}
+
+        by_upper = {s.upper(): s for s in symbols}
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("""
+                SELECT symbol, MAX(date)
+                FROM daily_bars
+                WHERE symbol = ANY(%s)
+                GROUP BY symbol
+            """, (list(by_upper),))
+
+            return {by_upper[symbol]: latest for symbol, latest in cursor.fetchall()}
+
+        finally:
+            cursor.close()
+            self.release_connection(conn)
     
     # ==================== SCAN RESULTS ====================
     
     def save_scan_result(self, result: Dict) -> bool:
         """Save a scan result."""
+        return self.save_scan_results_batch([result])
+
+    def save_scan_results_batch(self, results: List[Dict]) -> bool:
+        """
+        Save many scan results in one transaction.
+
+        All rows go out in a single multi-row upsert per page (execute_values),
+        so a full scan costs one round trip instead of one per symbol. If the
+        batch fails it is retried one row per transaction, so a single bad
+        result only loses its own row. Returns True when every row was saved.
+        """
+        if not results:
+            return True
+
         conn = self.get_connection()
         cursor = conn.cursor()
 
         try:
-            cursor.execute("""
-                INSERT INTO scan_results (
-                    scan_date, symbol, price, week_52_high, week_52_low,
-                    ma_50, ma_150, ma_200, ma_200_1m_ago,
-                    volume, avg_volume_50,
-                    criteria_1_within_5pct_52w_high,
-                    criteria_2_above_50ma,
-                    criteria_3_50ma_above_150ma,
-                    criteria_4_150ma_above_200ma,
-                    criteria_5_200ma_trending_up,
-                    criteria_6_above_30pct_52w_low,
-                    criteria_7_breakout_volume,
-                    criteria_8_spy_above_50ma,
-                    qualified, action, in_portfolio,
-                    ab_group, eod_buy_pending, sod_skip_reason
-                ) VALUES (
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                    %s, %s, %s
-                )
-                ON CONFLICT (scan_date, symbol)
-                DO UPDATE SET
-                    price = EXCLUDED.price,
-                    week_52_high = EXCLUDED.week_52_high,
-                    week_52_low = EXCLUDED.week_52_low,
-                    ma_50 = EXCLUDED.ma_50,
-                    ma_150 = EXCLUDED.ma_150,
-                    ma_200 = EXCLUDED.ma_200,
-                    ma_200_1m_ago = EXCLUDED.ma_200_1m_ago,
-                    volume = EXCLUDED.volume,
-                    avg_volume_50 = EXCLUDED.avg_volume_50,
-                    criteria_1_within_5pct_52w_high = EXCLUDED.criteria_1_within_5pct_52w_high,
-                    criteria_2_above_50ma = EXCLUDED.criteria_2_above_50ma,
-                    criteria_3_50ma_above_150ma = EXCLUDED.criteria_3_50ma_above_150ma,
-                    criteria_4_150ma_above_200ma = EXCLUDED.criteria_4_150ma_above_200ma,
-                    criteria_5_200ma_trending_up = EXCLUDED.criteria_5_200ma_trending_up,
-                    criteria_6_above_30pct_52w_low = EXCLUDED.criteria_6_above_30pct_52w_low,
-                    criteria_7_breakout_volume = EXCLUDED.criteria_7_breakout_volume,
-                    criteria_8_spy_above_50ma = EXCLUDED.criteria_8_spy_above_50ma,
-                    qualified = EXCLUDED.qualified,
-                    action = EXCLUDED.action,
-                    in_portfolio = EXCLUDED.in_portfolio,
-                    ab_group = CASE WHEN scan_results.ab_group IS NULL
-                                    THEN EXCLUDED.ab_group
-                                    ELSE scan_results.ab_group END,
-                    eod_buy_pending = CASE WHEN scan_results.ab_group IS NULL
-                                          THEN EXCLUDED.eod_buy_pending
-                                          ELSE scan_results.eod_buy_pending END,
-                    sod_skip_reason = EXCLUDED.sod_skip_reason,
-                    created_at = CURRENT_TIMESTAMP
-            """, (
-                result['scan_date'], result['symbol'], result['price'],
-                result['week_52_high'], result['week_52_low'],
-                result['ma_50'], result['ma_150'], result['ma_200'], result['ma_200_1m_ago'],
-                result['volume'], result['avg_volume_50'],
-                result['criteria_1'], result['criteria_2'], result['criteria_3'],
-                result['criteria_4'], result['criteria_5'], result['criteria_6'],
-                result['criteria_7'], result['criteria_8'],
-                result['qualified'], result['action'],
-                result.get('in_portfolio', False),
-                result.get('ab_group'),
-                result.get('eod_buy_pending', False),
-                result.get('sod_skip_reason'),
-            ))
-            
-            conn.commit()
-            return True
-            
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"❌ Error saving scan result for {result.get('symbol')}: {e}")
-            return False
+            try:
+                rows = [_scan_result_row(result) for result in results]
+                extras.execute_values(cursor, _SCAN_RESULT_UPSERT, rows, page_size=500)
+                conn.commit()
+                return True
+            except Exception as e:
+                conn.rollback()
+                logger.warning(f"⚠️ Batch save of {len(results)} scan results failed ({e}) — retrying row by row")
+
+            saved = 0
+            for result in results:
+                try:
+                    extras.execute_values(cursor, _SCAN_RESULT_UPSERT, [_scan_result_row(result)])
+                    conn.commit()
+                    saved += 1
+                except Exception as e:
+                    conn.rollback()
+                    logger.error(f"❌ Error saving scan result for {result.get('symbol')}: {e}")
+            return saved == len(results)
+
         finally:
             cursor.close()
-            conn.close()
-    
+            self.release_connection(conn)
+
     def get_latest_scan_results(self) -> List[Dict]:
         """Get the most recent scan results for all symbols."""
         conn = self.get_connection()
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
+        cursor = conn.cursor()
 
         try:
-            cursor.execute("""
-                SELECT
-                    sr.*,
-                    sr.criteria_1_within_5pct_52w_high   AS criteria_1,
-                    sr.criteria_2_above_50ma              AS criteria_2,
-                    sr.criteria_3_50ma_above_150ma        AS criteria_3,
-                    sr.criteria_4_150ma_above_200ma       AS criteria_4,
-                    sr.criteria_5_200ma_trending_up       AS criteria_5,
-                    sr.criteria_6_above_30pct_52w_low     AS criteria_6,
-                    sr.criteria_7_breakout_volume         AS criteria_7,
-                    sr.criteria_8_spy_above_50ma          AS criteria_8,
-                    COALESCE(sr.entry_method, bc.default_entry_method, 'prev_close') as effective_entry_method,
-                    bc.default_entry_method,
-                    -- Always derive in_portfolio live from positions table so the flag
-                    -- is accurate even across restarts / edge cases
-                    (EXISTS (
-                        SELECT 1 FROM positions p
-                        WHERE p.symbol = sr.symbol AND p.status = 'OPEN'
-                    )) AS in_portfolio
-                FROM scan_results sr
-                CROSS JOIN bot_config bc
-                WHERE sr.scan_date = (SELECT MAX(scan_date) FROM scan_results)
-                ORDER BY sr.qualified DESC, sr.symbol
-            """)
+            _execute_prepared(cursor, 'latest_scan_results')
             
-            results = [dict(row) for row in cursor.fetchall()]
+            results = _fetch_dicts(cursor)
             
             # Clean up - replace entry_method with effective_entry_method
             for result in results:
@@ -954,7 +1238,7 @@ class Database:
             
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
     
     def update_scan_override(self, symbol: str, override: bool) -> bool:
         """Update override status for a symbol in today's scan results."""
@@ -963,11 +1247,7 @@ class Database:
         
         try:
             today = datetime.now(ET).date()
-            cursor.execute("""
-                UPDATE scan_results 
-                SET override = %s
-                WHERE symbol = %s AND scan_date = %s
-            """, (override, symbol, today))
+            _execute_prepared(cursor, 'update_scan_override', (override, symbol, today))
             
             if cursor.rowcount > 0:
                 conn.commit()
@@ -983,7 +1263,7 @@ class Database:
             return False
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
     
     def update_scan_entry_method(self, symbol: str, entry_method: str) -> bool:
         """Update entry method for a symbol in today's scan results."""
@@ -992,11 +1272,7 @@ class Database:
         
         try:
             today = datetime.now(ET).date()
-            cursor.execute("""
-                UPDATE scan_results 
-                SET entry_method = %s
-                WHERE symbol = %s AND scan_date = %s
-            """, (entry_method, symbol, today))
+            _execute_prepared(cursor, 'update_scan_entry_method', (entry_method, symbol, today))
             
             if cursor.rowcount > 0:
                 conn.commit()
@@ -1012,7 +1288,7 @@ class Database:
             return False
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
     
     def update_scan_result_portfolio_flag(self, symbol: str, in_portfolio: bool) -> bool:
         """Set or clear the in_portfolio flag on the most recent scan result for a symbol."""
@@ -1038,7 +1314,7 @@ class Database:
             return False
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
 
     # ==================== POSITIONS ====================
 
@@ -1048,25 +1324,7 @@ class Database:
         cursor = conn.cursor()
 
         try:
-            cursor.execute("""
-                INSERT INTO positions (
-                    symbol, entry_date, entry_price, submitted_price, quantity, stop_loss,
-                    cost_basis, max_price, max_gain_pct, status, trade_id, notes, ab_group
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (symbol) DO UPDATE SET
-                    entry_price = EXCLUDED.entry_price,
-                    submitted_price = EXCLUDED.submitted_price,
-                    quantity = EXCLUDED.quantity,
-                    stop_loss = EXCLUDED.stop_loss,
-                    cost_basis = EXCLUDED.cost_basis,
-                    max_price = EXCLUDED.max_price,
-                    max_gain_pct = EXCLUDED.max_gain_pct,
-                    status = EXCLUDED.status,
-                    trade_id = EXCLUDED.trade_id,
-                    notes = EXCLUDED.notes,
-                    ab_group = EXCLUDED.ab_group,
-                    last_updated = CURRENT_TIMESTAMP
-            """, (
+            _execute_prepared(cursor, 'save_position', (
                 position['symbol'], position['entry_date'], position['entry_price'],
                 position.get('submitted_price'),
                 position['quantity'], position['stop_loss'], position['cost_basis'],
@@ -1085,7 +1343,7 @@ class Database:
             return False
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
     
     def get_positions(self) -> List[Dict]:
         """Get all open positions enriched with last known price from scan_results.
@@ -1101,44 +1359,28 @@ class Database:
         No live IB call is made — returns instantly.
         """
         conn = self.get_connection()
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
+        cursor = conn.cursor()
         try:
-            cursor.execute("""
-                SELECT
-                    p.*,
-                    sr.price                        AS last_price,
-                    sr.ma_50                        AS ma_50,
-                    sr.scan_date                    AS price_scan_date,
-                    sr.created_at                   AS price_scan_time,
-                    CASE WHEN sr.price IS NOT NULL
-                         THEN ROUND(sr.price * p.quantity, 2) END  AS current_value,
-                    CASE WHEN sr.price IS NOT NULL
-                         THEN ROUND(sr.price * p.quantity - p.cost_basis, 2) END AS pnl,
-                    CASE WHEN sr.price IS NOT NULL AND p.cost_basis > 0
-                         THEN ROUND(
-                             (sr.price * p.quantity - p.cost_basis) / p.cost_basis * 100,
-                             4
-                         ) END AS pnl_pct
-                FROM positions p
-                LEFT JOIN LATERAL (
-                    SELECT price, ma_50, scan_date, created_at
-                    FROM scan_results
-                    WHERE symbol = p.symbol
-                    ORDER BY scan_date DESC, created_at DESC
-                    LIMIT 1
-                ) sr ON true
-                WHERE p.status = 'OPEN'
-                ORDER BY p.entry_date
-            """)
-            return [dict(row) for row in cursor.fetchall()]
+            _execute_prepared(cursor, 'open_positions')
+            return _fetch_dicts(cursor)
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
     
     def get_closed_positions(self) -> List[Dict]:
         """Get all closed trades with full entry/exit details, ordered most-recent first."""
+        return list(self.iter_closed_positions())
+
+    def iter_closed_positions(self) -> Iterator[Dict]:
+        """
+        Yield closed trades like get_closed_positions(), streamed from a
+        server-side cursor TRADES_FETCH_CHUNK rows at a time, so memory stays
+        bounded however long the history grows. The pooled connection is held
+        until the generator is exhausted or closed.
+        """
         conn = self.get_connection()
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
+        cursor = conn.cursor('closed_trades')   # named => server-side
+        cursor.itersize = TRADES_FETCH_CHUNK
         try:
             cursor.execute("""
                 SELECT
@@ -1163,10 +1405,14 @@ class Database:
                 WHERE status = 'CLOSED'
                 ORDER BY exit_date DESC, created_at DESC
             """)
-            return [dict(row) for row in cursor.fetchall()]
+            columns = None
+            for row in cursor:
+                if columns is None:   # a named cursor's description arrives with the first batch
+                    columns = tuple(d.name for d in cursor.description)
+                yield dict(zip(columns, row))
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
 
     def reopen_position(self, trade_id: int, stop_loss: float) -> Dict:
         """Revert a mistakenly-closed trade back to OPEN status.
@@ -1182,60 +1428,56 @@ class Database:
         conn = self.get_connection()
         cursor = conn.cursor(cursor_factory=RealDictCursor)
         try:
-            # 1. Fetch the closed trade to get entry details
-            cursor.execute("SELECT * FROM trades WHERE id = %s AND status = 'CLOSED'", (trade_id,))
+            # One round trip: `old` locks and reads the closed trade as it was
+            # (data-modifying CTEs all see the pre-statement snapshot), then the
+            # trade is reset to OPEN and its position row re-inserted from it.
+            # The trade's stored stop_loss wins; the caller's value only fills in
+            # for trades that predate the stop_loss persistence migration (NULL).
+            cursor.execute("""
+                WITH old AS (
+                    SELECT * FROM trades WHERE id = %s AND status = 'CLOSED' FOR UPDATE
+                ),
+                reset AS (
+                    UPDATE trades
+                    SET exit_date   = NULL,
+                        exit_price  = NULL,
+                        proceeds    = NULL,
+                        pnl         = NULL,
+                        pnl_pct     = NULL,
+                        exit_reason = NULL,
+                        stop_loss   = NULL,
+                        status      = 'OPEN'
+                    FROM old
+                    WHERE trades.id = old.id
+                ),
+                -- ON CONFLICT handles the rare case where the position row still exists
+                pos AS (
+                    INSERT INTO positions
+                        (symbol, entry_date, entry_price, submitted_price,
+                         quantity, stop_loss, cost_basis, trade_id, status)
+                    SELECT symbol, entry_date, entry_price, submitted_price,
+                           quantity, COALESCE(NULLIF(stop_loss, 0), %s), cost_basis, id, 'OPEN'
+                    FROM old
+                    ON CONFLICT (symbol) DO UPDATE
+                        SET entry_date      = EXCLUDED.entry_date,
+                            entry_price     = EXCLUDED.entry_price,
+                            submitted_price = EXCLUDED.submitted_price,
+                            quantity        = EXCLUDED.quantity,
+                            stop_loss       = EXCLUDED.stop_loss,
+                            cost_basis      = EXCLUDED.cost_basis,
+                            trade_id        = EXCLUDED.trade_id,
+                            status          = 'OPEN',
+                            pending_exit    = false,
+                            exit_reason     = NULL,
+                            last_updated    = CURRENT_TIMESTAMP
+                )
+                SELECT * FROM old
+            """, (trade_id, stop_loss))
             trade = cursor.fetchone()
             if not trade:
                 return {}
             trade = dict(trade)
 
-            # Prefer the stop_loss stored on the trade row; fall back to caller value
-            # for trades that predate the stop_loss persistence migration (NULL in DB).
-            restored_stop_loss = float(trade['stop_loss']) if trade.get('stop_loss') else stop_loss
-
-            # 2. Clear exit fields on the trade row; set status back to OPEN
-            cursor.execute("""
-                UPDATE trades
-                SET exit_date   = NULL,
-                    exit_price  = NULL,
-                    proceeds    = NULL,
-                    pnl         = NULL,
-                    pnl_pct     = NULL,
-                    exit_reason = NULL,
-                    stop_loss   = NULL,
-                    status      = 'OPEN'
-                WHERE id = %s
-            """, (trade_id,))
-
-            # 3. Re-insert position row (ON CONFLICT handles the rare case where it still exists)
-            cursor.execute("""
-                INSERT INTO positions
-                    (symbol, entry_date, entry_price, submitted_price,
-                     quantity, stop_loss, cost_basis, trade_id, status)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, 'OPEN')
-                ON CONFLICT (symbol) DO UPDATE
-                    SET entry_date      = EXCLUDED.entry_date,
-                        entry_price     = EXCLUDED.entry_price,
-                        submitted_price = EXCLUDED.submitted_price,
-                        quantity        = EXCLUDED.quantity,
-                        stop_loss       = EXCLUDED.stop_loss,
-                        cost_basis      = EXCLUDED.cost_basis,
-                        trade_id        = EXCLUDED.trade_id,
-                        status          = 'OPEN',
-                        pending_exit    = false,
-                        exit_reason     = NULL,
-                        last_updated    = CURRENT_TIMESTAMP
-            """, (
-                trade['symbol'],
-                trade['entry_date'],
-                trade['entry_price'],
-                trade.get('submitted_price'),
-                trade['quantity'],
-                restored_stop_loss,
-                trade['cost_basis'],
-                trade_id,
-            ))
-
             conn.commit()
             logger.info(f"✅ Reopened trade #{trade_id} ({trade['symbol']})")
             return trade
@@ -1245,7 +1487,7 @@ class Database:
             raise
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
 
     def close_position(self, symbol: str) -> bool:
         """Mark a position as closed."""
@@ -1269,45 +1511,61 @@ class Database:
             return False
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
     
     def flag_pending_exit(self, symbol: str, exit_reason: str) -> bool:
         """Flag a position as pending exit at next market open."""
+        return self.flag_pending_exits([(symbol, exit_reason)]) > 0
+
+    def flag_pending_exits(self, flags: List[Tuple[str, str]]) -> int:
+        """
+        Flag many open positions as pending exit in one statement.
+
+        `flags` holds (symbol, exit_reason) pairs; returns how many open
+        positions were flagged.
+        """
+        if not flags:
+            return 0
+
         conn = self.get_connection()
         cursor = conn.cursor()
         try:
-            cursor.execute("""
+            flagged = extras.execute_values(cursor, """
                 UPDATE positions
                 SET pending_exit = true,
-                    exit_reason = %s,
+                    exit_reason = v.exit_reason,
                     last_updated = CURRENT_TIMESTAMP
-                WHERE symbol = %s AND status = 'OPEN'
-            """, (exit_reason, symbol.upper()))
+                FROM (VALUES %s) AS v(symbol, exit_reason)
+                WHERE positions.symbol = v.symbol AND positions.status = 'OPEN'
+                RETURNING positions.symbol, positions.exit_reason
+            """, [(symbol.upper(), reason) for symbol, reason in flags], fetch=True)
             conn.commit()
-            logger.info(f"✅ Flagged {symbol} for exit: {exit_reason}")
-            return cursor.rowcount > 0
+            for symbol, reason in flagged:
+                logger.info(f"✅ Flagged {symbol} for exit: {reason}")
+            return len(flagged)
         except Exception as e:
             conn.rollback()
-            logger.error(f"❌ Error flagging pending exit for {symbol}: {e}")
-            return False
+            symbols = ', '.join(symbol for symbol, _ in flags)
+            logger.error(f"❌ Error flagging pending exit for {symbols}: {e}")
+            return 0
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
 
     def get_pending_exit_positions(self) -> List[Dict]:
         """Get all open positions flagged for exit at next market open."""
         conn = self.get_connection()
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
+        cursor = conn.cursor()
         try:
             cursor.execute("""
                 SELECT * FROM positions
                 WHERE status = 'OPEN' AND pending_exit = true
                 ORDER BY entry_date
             """)
-            return [dict(row) for row in cursor.fetchall()]
+            return _fetch_dicts(cursor)
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
 
     # ==================== TRADES ====================
     
@@ -1340,7 +1598,7 @@ class Database:
             return None
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
     
     def close_trade(self, trade_id: int, exit_date: date, exit_price: float,
                     proceeds: float, pnl: float, pnl_pct: float, reason: str,
@@ -1370,12 +1628,54 @@ class Database:
             return False
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
     
+    def close_trade_and_position(self, symbol: str, trade_id: Optional[int], exit_date: date,
+                                 exit_price: float, proceeds: float, pnl: float, pnl_pct: float,
+                                 reason: str, stop_loss: float = None) -> bool:
+        """
+        close_trade() plus close_position() in one statement and transaction,
+        so a trade is never left CLOSED while its position stays OPEN (or the
+        reverse). With trade_id None only the position is closed.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("""
+                WITH closed_trade AS (
+                    UPDATE trades
+                    SET exit_date   = %s,
+                        exit_price  = %s,
+                        proceeds    = %s,
+                        pnl         = %s,
+                        pnl_pct     = %s,
+                        exit_reason = %s,
+                        stop_loss   = COALESCE(%s, stop_loss),
+                        status      = 'CLOSED'
+                    WHERE id = %s
+                )
+                UPDATE positions
+                SET status = 'CLOSED', last_updated = CURRENT_TIMESTAMP
+                WHERE symbol = %s
+            """, (exit_date, exit_price, proceeds, pnl, pnl_pct, reason, stop_loss, trade_id,
+                  symbol.upper()))
+            conn.commit()
+            if trade_id is not None:
+                logger.info(f"✅ Closed trade #{trade_id}")
+            logger.info(f"✅ Closed position: {symbol}")
+            return True
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"❌ Error closing trade #{trade_id} / position {symbol}: {e}")
+            return False
+        finally:
+            cursor.close()
+            self.release_connection(conn)
+
     def get_trades(self, status: str = None, limit: int = 100) -> List[Dict]:
         """Get trade history."""
         conn = self.get_connection()
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
+        cursor = conn.cursor()
         
         try:
             if status:
@@ -1392,16 +1692,19 @@ class Database:
                     LIMIT %s
                 """, (limit,))
             
-            return [dict(row) for row in cursor.fetchall()]
+            return _fetch_dicts(cursor)
             
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
     
     # ==================== CONFIG ====================
     
     def get_config(self) -> Dict:
-        """Get bot configuration."""
+        """Get bot configuration (cached briefly, see _ReadCache). The dict is the caller's to modify."""
+        return dict(self._read_cache.get('bot_config', 'config', self._load_config))
+
+    def _load_config(self) -> Dict:
         conn = self.get_connection()
         cursor = conn.cursor(cursor_factory=RealDictCursor)
         
@@ -1412,7 +1715,7 @@ class Database:
             
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
     
     def update_config(self, config: Dict) -> bool:
         """Update bot configuration."""
@@ -1462,6 +1765,7 @@ class Database:
             ))
             
             conn.commit()
+            self._config_written()
             logger.info("✅ Updated bot configuration")
             return True
             
@@ -1471,7 +1775,7 @@ class Database:
             return False
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
     
     # ==================== A/B TEST HELPERS ====================
 
@@ -1488,6 +1792,7 @@ class Database:
             """)
             row = cursor.fetchone()
             conn.commit()
+            self._config_written()
             return row[0] if row else 1
         except Exception as e:
             conn.rollback()
@@ -1495,13 +1800,13 @@ class Database:
             return 1
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
 
     def get_eod_buy_candidates(self, scan_date) -> List[Dict]:
         """Return scan_results rows for a given ET trading date flagged for EOD buy (Group A, pending execution).
         scan_date must be passed from Python using datetime.now(ET).date() to avoid server timezone mismatch."""
         conn = self.get_connection()
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
+        cursor = conn.cursor()
         try:
             cursor.execute("""
                 SELECT * FROM scan_results
@@ -1509,10 +1814,10 @@ class Database:
                   AND scan_date = %s
                 ORDER BY created_at
             """, (scan_date,))
-            return [dict(row) for row in cursor.fetchall()]
+            return _fetch_dicts(cursor)
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
 
     def get_last_sod_execution_date(self):
         """Return the last date SOD execution ran (DATE or None). Used to prevent grace-window re-fire on restart."""
@@ -1524,7 +1829,7 @@ class Database:
             return row[0] if row else None
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
 
     def set_last_sod_execution_date(self, date) -> None:
         """Persist the date SOD execution last ran so restarts won't re-fire within the grace window."""
@@ -1536,9 +1841,10 @@ class Database:
                 (date,)
             )
             conn.commit()
+            self._config_written()
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
 
     def get_last_eod_execution_date(self):
         """Return the last date EOD execution ran (DATE or None). Used to prevent grace-window re-fire on restart."""
@@ -1550,7 +1856,7 @@ class Database:
             return row[0] if row else None
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
 
     def set_last_eod_execution_date(self, date) -> None:
         """Persist the date EOD execution last ran so restarts won't re-fire within the grace window."""
@@ -1562,9 +1868,10 @@ class Database:
                 (date,)
             )
             conn.commit()
+            self._config_written()
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
 
     def get_last_sod_exec_time(self) -> Optional[str]:
         """Return the configured SOD time that was active when SOD last ran (VARCHAR(5) or None)."""
@@ -1576,7 +1883,7 @@ class Database:
             return row[0] if row else None
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
 
     def set_last_sod_exec_time(self, exec_time: Optional[str]) -> None:
         """Persist the SOD configured time that was active when SOD last ran."""
@@ -1588,9 +1895,10 @@ class Database:
                 (exec_time,)
             )
             conn.commit()
+            self._config_written()
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
 
     def get_last_eod_exec_time(self) -> Optional[str]:
         """Return the configured EOD time that was active when EOD last ran (VARCHAR(5) or None)."""
@@ -1602,7 +1910,7 @@ class Database:
             return row[0] if row else None
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
 
     def set_last_eod_exec_time(self, exec_time: Optional[str]) -> None:
         """Persist the EOD configured time that was active when EOD last ran."""
@@ -1614,14 +1922,15 @@ class Database:
                 (exec_time,)
             )
             conn.commit()
+            self._config_written()
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
 
     def get_sod_group_b_candidates(self, scan_date) -> List[Dict]:
         """Return Group B candidates from a given scan_date for SOD re-verification."""
         conn = self.get_connection()
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
+        cursor = conn.cursor()
         try:
             cursor.execute("""
                 SELECT * FROM scan_results
@@ -1631,10 +1940,10 @@ class Database:
                   AND sod_skip_reason IS NULL
                 ORDER BY created_at
             """, (scan_date,))
-            return [dict(row) for row in cursor.fetchall()]
+            return _fetch_dicts(cursor)
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
 
     def mark_eod_buy_pending(self, symbol: str, scan_date, ab_group: str) -> bool:
         """Flag a scan_results row as pending EOD buy and set its A/B group."""
@@ -1654,7 +1963,7 @@ class Database:
             return False
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
 
     def clear_eod_buy_pending(self, symbol: str, scan_date) -> bool:
         """Clear the eod_buy_pending flag after a Group A buy has been executed."""
@@ -1674,7 +1983,7 @@ class Database:
             return False
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
 
     def mark_sod_skip(self, symbol: str, scan_date, reason: str) -> bool:
         """Record why a Group B candidate was skipped at SOD re-verification."""
@@ -1694,7 +2003,7 @@ class Database:
             return False
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
 
     def set_ab_group(self, symbol: str, scan_date, ab_group: str) -> bool:
         """Set the A/B group on a scan_results row (used by scanner after group assignment)."""
@@ -1714,7 +2023,7 @@ class Database:
             return False
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
 
     def get_scan_ab_group(self, scan_date, symbol: str) -> Optional[Dict]:
         """Return the ab_group and eod_buy_pending for a (scan_date, symbol) if already assigned, else None.
@@ -1735,7 +2044,7 @@ class Database:
             return dict(row) if row else None
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
 
     def set_scanner_status(self, running: bool) -> bool:
         """Update scanner running status."""
@@ -1750,6 +2059,7 @@ class Database:
             """, (running,))
 
             conn.commit()
+            self._config_written()
             return True
 
         except Exception as e:
@@ -1758,10 +2068,13 @@ class Database:
             return False
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
 
     def get_data_update_status(self) -> Dict:
-        """Get last data update time, status, error, and configured update time."""
+        """Get last data update time, status, error, and configured update time (cached briefly)."""
+        return dict(self._read_cache.get('bot_config', 'data_update_status', self._load_data_update_status))
+
+    def _load_data_update_status(self) -> Dict:
         conn = self.get_connection()
         cursor = conn.cursor(cursor_factory=RealDictCursor)
         try:
@@ -1778,7 +2091,7 @@ class Database:
             }
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
 
     def set_data_update_status(self, status: str, error: str = None) -> bool:
         """Update data update status, optionally clearing or setting error and timestamp."""
@@ -1803,6 +2116,7 @@ class Database:
                     WHERE id = 1
                 """, (status, error))
             conn.commit()
+            self._config_written()
             return True
         except Exception as e:
             conn.rollback()
@@ -1810,7 +2124,7 @@ class Database:
             return False
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
 
     # ==================== STATISTICS ====================
     
@@ -1820,49 +2134,40 @@ class Database:
         cursor = conn.cursor()
         
         try:
-            # Closed trades stats
-            cursor.execute("""
-                SELECT 
-                    COUNT(*) as total_trades,
-                    SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END) as wins,
-                    SUM(CASE WHEN pnl < 0 THEN 1 ELSE 0 END) as losses,
-                    COALESCE(SUM(pnl), 0) as total_pnl,
-                    COALESCE(AVG(pnl), 0) as avg_pnl,
-                    COALESCE(MAX(pnl), 0) as max_win,
-                    COALESCE(MIN(pnl), 0) as max_loss
-                FROM trades
-                WHERE status = 'CLOSED'
-            """)
-            
-            closed_stats = cursor.fetchone()
+            cursor.execute(f"SELECT * FROM ({_CLOSED_TRADE_STATS}) t CROSS JOIN ({_OPEN_POSITION_STATS}) o")
+            return _statistics(cursor.fetchone())
             
-            # Open positions stats
-            cursor.execute("""
-                SELECT 
-                    COUNT(*) as open_positions,
-                    COALESCE(SUM(cost_basis), 0) as total_invested
-                FROM positions
-                WHERE status = 'OPEN'
+        finally:
+            cursor.close()
+            self.release_connection(conn)
+
+    def get_status_snapshot(self) -> Dict:
+        """
+        Get everything the status view shows in one round trip:
+        {'config': <get_config()>, 'statistics': <get_statistics()>,
+         'active_tickers': <count of active tickers>}.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        try:
+            # Statistics columns first, then the bot_config row (all NULL if absent)
+            cursor.execute(f"""
+                SELECT t.*, o.*, a.active_tickers, c.*
+                FROM ({_CLOSED_TRADE_STATS}) t
+                CROSS JOIN ({_OPEN_POSITION_STATS}) o
+                CROSS JOIN (SELECT COUNT(*) AS active_tickers FROM tickers WHERE active = true) a
+                LEFT JOIN bot_config c ON c.id = 1
             """)
-            
-            open_stats = cursor.fetchone()
-            
-            total_trades = closed_stats[0] or 0
-            wins = closed_stats[1] or 0
-            
+            row = cursor.fetchone()
+            columns = [d.name for d in cursor.description]
+            config = dict(zip(columns[_STATS_COLUMNS + 1:], row[_STATS_COLUMNS + 1:]))
             return {
-                'total_trades': total_trades,
-                'wins': wins,
-                'losses': closed_stats[2] or 0,
-                'win_rate': (wins / total_trades * 100) if total_trades > 0 else 0,
-                'total_pnl': float(closed_stats[3] or 0),
-                'avg_pnl': float(closed_stats[4] or 0),
-                'max_win': float(closed_stats[5] or 0),
-                'max_loss': float(closed_stats[6] or 0),
-                'open_positions': open_stats[0] or 0,
-                'total_invested': float(open_stats[1] or 0)
+                'config': config if config.get('id') is not None else {},
+                'statistics': _statistics(row),
+                'active_tickers': row[_STATS_COLUMNS],
             }
-            
+
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
@@ -18,9 +18,11 @@ from pydantic import BaseModel
 from typing import List, Optional, Dict
 from datetime import datetime, date
 from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
 import asyncio
 import logging
 import json
+import os
 
 try:
     from uvicorn.protocols.utils import ClientDisconnected as _UvicornClientDisconnected
@@ -30,7 +32,8 @@ except ImportError:
 from database import Database
 from data_fetcher import DataFetcher, AsyncDataFetcher
 from scanner import MinerviniScanner, PositionMonitor
-from data_updater import data_update_scheduler_loop, run_data_update, market_open_scheduler_loop, eod_scheduler_loop
+from data_updater import scheduler_loop, run_data_update, parse_trigger_time, IB_MAX_INFLIGHT
+from ws_broadcast import broadcast
 from zoneinfo import ZoneInfo
 
 ET = ZoneInfo("America/New_York")  # all date logic uses ET, not machine local
@@ -129,6 +132,12 @@ class PositionCreate(BaseModel):
 # GLOBAL STATE
 # ============================================================================
 
+# Blocking IB / DB work offloaded with run_in_executor gets its own sized pool
+# (installed as the loop's default executor at startup) instead of sharing
+# asyncio's min(32, cpu_count + 4) default with everything else.
+IB_THREAD_POOL_SIZE = int(os.getenv("IB_THREAD_POOL_SIZE", "16"))
+
+
 class BotState:
     """Global bot state."""
     def __init__(self):
@@ -142,15 +151,23 @@ class BotState:
         self.monitor = PositionMonitor(self.db, self.fetcher)
         self.scanner_running = False
         self.scanner_task = None
-        self.data_updater_task = None
-        self.market_open_task = None
+        self.scheduler_task = None            # data update + SOD/EOD order execution jobs
         self.latest_results = []
         self.websocket_clients = set()
+        self.progress_buffer: list = []       # data-update progress events awaiting the next batched frame
+        self.progress_flush_handle = None     # pending call_later handle for that flush
+        self.progress_flush_task = None       # in-flight flush task (strong ref — the loop holds tasks weakly)
         self.ib_connected = False
         self.sod_running = False              # True while SOD (market-open) execution is in progress
         self.eod_running = False              # True while EOD execution is in progress
         self.last_execution: dict | None = None      # Summary of the most recent SOD execution run
         self.last_eod_execution: dict | None = None  # Summary of the most recent EOD execution run
+        self.ib_executor: ThreadPoolExecutor | None = None  # created at startup
+        self.fetcher_pool: ThreadPoolExecutor | None = None  # data-update IB fetches only; created at startup
+        self.data_update_lock = asyncio.Lock()          # held for the duration of a data update run
+        self.config_changed = asyncio.Event()           # set by the Settings API; wakes the scheduler
+        self.next_data_update_at: datetime | None = None  # next scheduled data update (ET)
+        self.fetch_decision_cache: Dict[str, date] = {}  # symbol -> last completed bar date it is known current for
 
 bot_state = BotState()
 
@@ -179,7 +196,9 @@ def _seconds_until_market_open() -> float:
     while candidate.weekday() >= 5:          # skip Saturday (5) and Sunday (6)
         candidate += timedelta(days=1)
 
-    return (candidate - now).total_seconds()
+    # Timestamps, not aware-datetime subtraction: both share the ET tzinfo, so
+    # `candidate - now` would ignore a DST change over the weekend
+    return candidate.timestamp() - now.timestamp()
 
 
 def _is_market_open() -> bool:
@@ -287,16 +306,7 @@ async def broadcast_scan_results(results: List[Dict]):
         'results': results_clean
     }
     
-    # Remove disconnected clients
-    disconnected = []
-    for client in bot_state.websocket_clients:
-        try:
-            await client.send_json(message)
-        except Exception:
-            disconnected.append(client)
-
-    for client in disconnected:
-        bot_state.websocket_clients.discard(client)
+    await broadcast_message(message)
 
 async def broadcast_exit_triggers(exits: List[Dict]):
     """Broadcast exit triggers to all WebSocket clients."""
@@ -311,29 +321,18 @@ async def broadcast_exit_triggers(exits: List[Dict]):
         'timestamp': datetime.now().isoformat(),
         'exits': exits_clean
     }
-    
-    disconnected = []
-    for client in bot_state.websocket_clients:
-        try:
-            await client.send_json(message)
-        except Exception:
-            disconnected.append(client)
 
-    for client in disconnected:
-        bot_state.websocket_clients.discard(client)
+    await broadcast_message(message)
 
 async def broadcast_message(message: dict):
-    """Broadcast an arbitrary message to all WebSocket clients."""
-    if not bot_state.websocket_clients:
-        return
-    disconnected = []
-    for client in bot_state.websocket_clients:
-        try:
-            await client.send_json(message)
-        except Exception:
-            disconnected.append(client)
-    for client in disconnected:
-        bot_state.websocket_clients.discard(client)
+    """
+    Broadcast an arbitrary message to all WebSocket clients.
+
+    The message is serialised once and the same string is sent to every
+    client concurrently (send_json would re-encode it per client).
+    """
+    await broadcast(bot_state.websocket_clients, message)
+
 
 # ============================================================================
 # FASTAPI APP
@@ -362,32 +361,35 @@ app.add_middleware(
 async def startup():
     """Initialize on startup."""
     logger.info("🚀 Starting Minervini Trading Bot API...")
+
+    # Dedicated thread pool for blocking IB / DB calls
+    bot_state.ib_executor = ThreadPoolExecutor(
+        max_workers=IB_THREAD_POOL_SIZE, thread_name_prefix="ib-io"
+    )
+    asyncio.get_running_loop().set_default_executor(bot_state.ib_executor)
+    # Data-update history fetches get their own small pool, sized to the update's
+    # in-flight limit, so they never queue behind (or crowd out) other executor work
+    bot_state.fetcher_pool = ThreadPoolExecutor(
+        max_workers=IB_MAX_INFLIGHT, thread_name_prefix="ib-fetch"
+    )
     
-    # Create tables
-    bot_state.db.create_tables()
-    
-    # Connect to IB
-    connected = await bot_state.async_fetcher.connect()
+    # Create tables (on the executor) while the IB connection handshake runs —
+    # neither depends on the other, so startup waits only for the slower one
+    loop = asyncio.get_running_loop()
+    _, connected = await asyncio.gather(
+        loop.run_in_executor(None, bot_state.db.create_tables),
+        bot_state.async_fetcher.connect(),
+    )
     if connected:
         bot_state.ib_connected = True
         logger.info("✅ Connected to Interactive Brokers")
     else:
         logger.warning("⚠️ Could not connect to IB - some features may be limited")
 
-    # Start the scheduled data-update background task
-    bot_state.data_updater_task = asyncio.create_task(
-        data_update_scheduler_loop(bot_state)
-    )
-
-    # Start the SOD (market-open) order execution scheduler
-    bot_state.market_open_task = asyncio.create_task(
-        market_open_scheduler_loop(bot_state)
-    )
-
-    # Start the EOD buy scheduler (Group A in A/B test — no-ops when ab_test_enabled=false)
-    bot_state.eod_task = asyncio.create_task(
-        eod_scheduler_loop(bot_state)
-    )
+    # Start the scheduler driving the data update, the SOD (market-open) order
+    # execution and the EOD buy (Group A in A/B test — no-ops when
+    # ab_test_enabled=false) jobs
+    bot_state.scheduler_task = asyncio.create_task(scheduler_loop(bot_state))
 
     # Auto-start the scanner — always runs unless manually stopped via Settings
     bot_state.scanner_running = True
@@ -408,13 +410,9 @@ async def shutdown():
         if bot_state.scanner_task:
             bot_state.scanner_task.cancel()
 
-    # Stop data updater scheduler
-    if bot_state.data_updater_task:
-        bot_state.data_updater_task.cancel()
-
-    # Stop market-open order execution scheduler
-    if bot_state.market_open_task:
-        bot_state.market_open_task.cancel()
+    # Stop the data update / order execution scheduler
+    if bot_state.scheduler_task:
+        bot_state.scheduler_task.cancel()
 
     # Disconnect from IB — ignore socket errors that occur when the OS has already
     # closed the connection (e.g. Ctrl+C sends SIGINT before disconnect() runs).
@@ -423,6 +421,12 @@ async def shutdown():
     except (ConnectionResetError, OSError):
         pass  # Socket already closed by OS — not an error
 
+    # Drop queued executor work; calls already running finish on their own
+    if bot_state.ib_executor:
+        bot_state.ib_executor.shutdown(wait=False, cancel_futures=True)
+    if bot_state.fetcher_pool:
+        bot_state.fetcher_pool.shutdown(wait=False, cancel_futures=True)
+
     logger.info("✅ Shutdown complete")
 
 # ============================================================================
@@ -455,15 +459,14 @@ async def _get_status_dict() -> dict:
     """Return current bot status as a plain dict (used by both the REST endpoint
     and the WebSocket loop — avoids calling the FastAPI route handler directly,
     which would return a Response object instead of a dict)."""
-    config = bot_state.db.get_config()
-    positions = bot_state.db.get_positions()
-    stats = bot_state.db.get_statistics()
+    snapshot = bot_state.db.get_status_snapshot()   # config + statistics in one round trip
+    stats = snapshot["statistics"]
     return convert_decimals({
         "scanner_running": bot_state.scanner_running,
-        "ib_connected": bot_state.fetcher.connected,
-        "active_tickers": len(bot_state.db.get_active_tickers()),
-        "open_positions": len(positions),
-        "config": config,
+        "ib_connected": bot_state.fetcher.verify_connection(),
+        "active_tickers": snapshot["active_tickers"],
+        "open_positions": stats["open_positions"],
+        "config": snapshot["config"],
         "statistics": stats,
         "last_scan": len(bot_state.latest_results)
     })
@@ -602,7 +605,7 @@ async def run_scanner_once():
             raise HTTPException(status_code=503, detail="Could not connect to IB")
     
     # Run scanner
-    results = await asyncio.get_event_loop().run_in_executor(
+    results = await asyncio.get_running_loop().run_in_executor(
         None,
         bot_state.scanner.scan_all_tickers
     )
@@ -792,7 +795,8 @@ async def close_position(symbol: str):
     actual_pnl_pct  = round((actual_pnl / cost_basis) * 100, 4) if cost_basis else 0
 
     # ── Close in DB ───────────────────────────────────────────────────────────
-    bot_state.db.close_trade(
+    bot_state.db.close_trade_and_position(
+        symbol,
         position['trade_id'],
         datetime.now(ET).date(),
         filled_exit_price,
@@ -802,7 +806,6 @@ async def close_position(symbol: str):
         'MANUAL_CLOSE',
         stop_loss=float(position['stop_loss'])  # preserve original stop for safe reopen
     )
-    bot_state.db.close_position(symbol)
 
     # ── Clear in_portfolio flag so Scanner tab badge updates immediately ──────
     bot_state.db.update_scan_result_portfolio_flag(symbol, False)
@@ -870,7 +873,8 @@ async def mark_position_closed(symbol: str, exit_price: float, exit_date: Option
     pnl        = round(proceeds - cost_basis, 2)
     pnl_pct    = round((pnl / cost_basis) * 100, 4) if cost_basis else 0
 
-    bot_state.db.close_trade(
+    bot_state.db.close_trade_and_position(
+        symbol,
         position['trade_id'],
         parsed_exit_date,
         exit_price,
@@ -880,7 +884,6 @@ async def mark_position_closed(symbol: str, exit_price: float, exit_date: Option
         'MANUAL_MARK_CLOSED',
         stop_loss=float(position['stop_loss'])  # preserve original stop for safe reopen
     )
-    bot_state.db.close_position(symbol)
     bot_state.db.update_scan_result_portfolio_flag(symbol, False)
 
     config = bot_state.db.get_config()
@@ -985,6 +988,15 @@ async def get_config():
 @app.put("/api/config")
 async def update_config(config: ConfigUpdate):
     """Update bot configuration."""
+    # Parse trigger times once here (memoized) so the schedulers never see a bad value
+    for field in ('data_update_time', 'order_execution_time', 'eod_order_execution_time'):
+        value = getattr(config, field)
+        if value:   # '' leaves the job unscheduled, as before
+            try:
+                parse_trigger_time(value)
+            except ValueError:
+                raise HTTPException(status_code=400, detail=f"{field} must be HH:MM (24-hour), got '{value}'")
+
     current_config = bot_state.db.get_config()
     
     # Update only provided fields
@@ -1014,6 +1026,7 @@ async def update_config(config: ConfigUpdate):
         raise HTTPException(status_code=500, detail="Failed to update configuration")
 
     logger.info("✅ Configuration updated")
+    bot_state.config_changed.set()   # reschedule data update / order execution jobs now
 
     return {"success": True, "config": updated_config}
 
@@ -1024,8 +1037,7 @@ async def update_config(config: ConfigUpdate):
 @app.post("/api/data/update")
 async def trigger_data_update():
     """Manually trigger a data update (fire-and-forget)."""
-    status = bot_state.db.get_data_update_status()
-    if status.get('data_update_status') == 'running':
+    if bot_state.data_update_lock.locked():
         raise HTTPException(status_code=409, detail="Data update already in progress")
 
     asyncio.create_task(run_data_update(bot_state))
@@ -1035,7 +1047,10 @@ async def trigger_data_update():
 @app.get("/api/data/status")
 async def get_data_update_status():
     """Get current data update status."""
-    return convert_decimals(bot_state.db.get_data_update_status())
+    status = convert_decimals(bot_state.db.get_data_update_status())
+    status['next_data_update_at'] = (bot_state.next_data_update_at.isoformat()
+                                     if bot_state.next_data_update_at else None)
+    return status
 
 
 @app.post("/api/orders/execute-now")
@@ -1113,7 +1128,9 @@ async def websocket_endpoint(websocket: WebSocket):
                     message["data"]["data_update"] = {
                         "last_update": du.get('last_data_update'),
                         "status": du.get('data_update_status', 'idle'),
-                        "error": du.get('data_update_error')
+                        "error": du.get('data_update_error'),
+                        "next_update_at": (bot_state.next_data_update_at.isoformat()
+                                           if bot_state.next_data_update_at else None)
                     }
                 except Exception:
                     pass  # non-critical — don't break the WS loop
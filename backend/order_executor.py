@@ -25,35 +25,29 @@ Both buy and sell broadcast WebSocket messages when executed.
 """
 
 import asyncio
-import json
 import logging
 import math
 from datetime import datetime, date as date_type
 from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
+from ws_broadcast import broadcast
+
 if TYPE_CHECKING:
     pass  # BotState imported at runtime inside functions to avoid circular import
 
 ET = ZoneInfo("America/New_York")
+
 logger = logging.getLogger(__name__)
 
 
 # ---------------------------------------------------------------------------
-# WebSocket broadcast helper (mirrors data_updater._broadcast_update)
+# WebSocket broadcast helper
 # ---------------------------------------------------------------------------
 
 async def _broadcast(bot_state, message: dict) -> None:
-    """Send a JSON message to all connected WebSocket clients."""
-    payload = json.dumps(message)
-    dead = []
-    for ws in list(getattr(bot_state, "websocket_clients", set())):
-        try:
-            await ws.send_text(payload)
-        except Exception:
-            dead.append(ws)
-    for ws in dead:
-        bot_state.websocket_clients.discard(ws)
+    """Send a JSON message to all connected WebSocket clients (concurrently)."""
+    await broadcast(getattr(bot_state, "websocket_clients", set()), message)
 
 
 # ---------------------------------------------------------------------------
@@ -182,7 +176,7 @@ async def execute_pending_buys(bot_state) -> list:
     live_prices: dict = {}
     if fetcher.connected:
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             live_prices = await loop.run_in_executor(
                 None,
                 lambda: fetcher.fetch_multiple_prices(candidate_symbols)
@@ -224,7 +218,7 @@ async def execute_pending_buys(bot_state) -> list:
                 logger.warning(f"{symbol}: scanner not available for Group B re-verify — skipping")
                 db.mark_sod_skip(symbol, scan_date, "NO_SCANNER")
                 continue
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             still_qualifies = await loop.run_in_executor(None, lambda s=symbol: scanner.rescan_single(s))
             if not still_qualifies:
                 logger.info(f"🅱️ {symbol}: Group B re-verify FAILED — skipping (CRITERIA_FAILED)")
@@ -261,7 +255,7 @@ async def execute_pending_buys(bot_state) -> list:
             # ----------------------------------------------------------------
             ib_order = None
             if fetcher.connected:
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 if entry_method == "market_open":
                     ib_order = await loop.run_in_executor(
                         None,
@@ -419,7 +413,7 @@ async def execute_eod_buys(bot_state) -> list:
     live_prices: dict = {}
     if fetcher.connected:
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             live_prices = await asyncio.wait_for(
                 loop.run_in_executor(None, lambda: fetcher.fetch_multiple_prices(candidate_symbols)),
                 timeout=30.0
@@ -466,7 +460,7 @@ async def execute_eod_buys(bot_state) -> list:
         try:
             ib_order = None
             if fetcher.connected:
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 try:
                     ib_order = await asyncio.wait_for(
                         loop.run_in_executor(None, lambda s=symbol, q=quantity: fetcher.place_market_order(s, q, "BUY")),
@@ -579,7 +573,7 @@ async def execute_pending_exits(bot_state) -> list:
     live_prices: dict = {}
     if fetcher.connected:
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             live_prices = await loop.run_in_executor(
                 None,
                 lambda: fetcher.fetch_multiple_prices(exit_symbols)
@@ -626,7 +620,7 @@ async def execute_pending_exits(bot_state) -> list:
             # ----------------------------------------------------------------
             ib_order = None
             if fetcher.connected:
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 ib_order = await loop.run_in_executor(
                     None,
                     lambda s=symbol, q=quantity: fetcher.place_market_order(s, q, "SELL")
@@ -661,11 +655,11 @@ async def execute_pending_exits(bot_state) -> list:
             actual_pnl = round(actual_proceeds - cost_basis, 2)
             actual_pnl_pct = round((actual_pnl / cost_basis) * 100, 4) if cost_basis else 0
 
-            if trade_id:
-                db.close_trade(trade_id, exit_date, filled_exit_price,
-                               actual_proceeds, actual_pnl, actual_pnl_pct, exit_reason,
-                               stop_loss=float(pos['stop_loss']) if pos.get('stop_loss') else None)
-            db.close_position(symbol)
+            db.close_trade_and_position(
+                symbol, trade_id or None, exit_date, filled_exit_price,
+                actual_proceeds, actual_pnl, actual_pnl_pct, exit_reason,
+                stop_loss=float(pos['stop_loss']) if pos.get('stop_loss') else None
+            )
 
             # Clear in_portfolio flag so the scanner tab reflects the exit immediately
             db.update_scan_result_portfolio_flag(symbol, False)
@@ -770,7 +764,7 @@ async def run_order_execution(bot_state) -> None:
 async def run_eod_execution(bot_state) -> None:
     """
     EOD buy execution for Group A candidates.
-    Called by the eod_scheduler_loop in data_updater.py.
+    Called by the EodJob scheduled in data_updater.py.
     Only runs when ab_test_enabled = true.
     """
     config = bot_state.db.get_config()
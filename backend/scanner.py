@@ -18,14 +18,20 @@ from datetime import date, datetime, time as dtime
 from typing import List, Dict, Optional
 from zoneinfo import ZoneInfo
 import logging
+import numpy as np
 from database import Database
-from data_fetcher import DataFetcher
+from data_fetcher import DataFetcher, bars_to_array
 
 ET = ZoneInfo("America/New_York")  # all date logic uses ET, not machine local
 
 logger = logging.getLogger(__name__)
 
 
+def _present(values: np.ndarray) -> np.ndarray:
+    """Drop missing (NaN) and zero entries — the vector form of `if bar[field]`."""
+    return values[(values != 0) & ~np.isnan(values)]
+
+
 class MinerviniScanner:
     """Scans stocks using 8-criteria SEPA methodology."""
     
@@ -34,7 +40,7 @@ class MinerviniScanner:
         self.fetcher = fetcher
         self.spy_qualified = False  # Criterion #8 - market health
     
-    def calculate_criteria(self, symbol: str, bars: List[Dict],
+    def calculate_criteria(self, symbol: str, bars,
                           current_price: float, current_volume: int,
                           config: Dict = None) -> Dict:
         """
@@ -42,7 +48,8 @@ class MinerviniScanner:
 
         Args:
             symbol: Stock ticker
-            bars: Historical daily bars (most recent last)
+            bars: Historical daily bars (most recent last) — a BAR_DTYPE
+                  array, or a list of bar dicts (converted once on entry)
             current_price: Current/latest price
             current_volume: Current/latest volume
             config: Bot config dict (fetched from DB if not provided)
@@ -56,14 +63,15 @@ class MinerviniScanner:
             logger.warning(f"⚠️ {symbol}: Insufficient data ({len(bars)} bars, need 250)")
             return self._failed_result(symbol, "Insufficient data")
         
-        # Extract closes and volumes - convert Decimals to floats
-        closes = [float(bar['close']) for bar in bars if bar['close']]
-        volumes = [int(bar['volume']) for bar in bars if bar['volume']]
+        # Work on whole columns; missing/zero entries are skipped as before
+        bars = bars_to_array(bars)
+        closes = _present(bars['close'])
+        volumes = bars['volume'][bars['volume'] != 0]
         
-        # Calculate 52-week high/low (last 250 trading days) - convert to float
+        # Calculate 52-week high/low (last 250 trading days)
         recent_250 = bars[-250:]
-        week_52_high = float(max([bar['high'] for bar in recent_250 if bar['high']]))
-        week_52_low = float(min([bar['low'] for bar in recent_250 if bar['low']]))
+        week_52_high = float(_present(recent_250['high']).max())
+        week_52_low = float(_present(recent_250['low']).min())
         
         # Calculate moving averages
         ma_50 = self._calculate_sma(closes, 50)
@@ -78,7 +86,7 @@ class MinerviniScanner:
             ma_200_1m_ago = None
         
         # Average volume (last 50 days)
-        avg_volume_50 = int(sum(volumes[-50:]) / len(volumes[-50:])) if len(volumes) >= 50 else 0
+        avg_volume_50 = int(volumes[-50:].mean()) if len(volumes) >= 50 else 0
         
         # Check for None values
         if None in [ma_50, ma_150, ma_200, ma_200_1m_ago]:
@@ -285,19 +293,19 @@ class MinerviniScanner:
         open_symbols = {p["symbol"] for p in open_positions}
 
         results = []
+        to_save = []   # written in one batch after the loop
 
         for i, symbol in enumerate(tickers, 1):
             try:
-                # Use pre-fetched batch bars (no per-ticker DB call)
-                bars = all_bars.get(symbol, [])
+                # Use pre-fetched batch bars (no per-ticker DB call); a BAR_DTYPE
+                # array, already chronological
+                bars = all_bars.get(symbol)
 
-                if not bars or len(bars) < 250:
-                    logger.warning(f"⚠️ {symbol}: Insufficient data ({len(bars)} bars, need 250)")
+                if bars is None or len(bars) < 250:
+                    logger.warning(f"⚠️ {symbol}: Insufficient data ({0 if bars is None else len(bars)} bars, need 250)")
                     results.append(self._failed_result(symbol, "No data"))
                     continue
 
-                # Bars come back DESC from batch query — reverse to chronological
-                bars = list(reversed(bars))
                 latest_bar = bars[-1]
 
                 # Resolve current price: IB live → DB close fallback
@@ -306,7 +314,8 @@ class MinerviniScanner:
                     current_price = float(ib_price)
                     price_source = "IB-live"
                 else:
-                    current_price = float(latest_bar['close']) if latest_bar['close'] else 0.0
+                    db_close = float(latest_bar['close'])   # NaN when the stored close is NULL
+                    current_price = 0.0 if math.isnan(db_close) else db_close
                     price_source = "DB-close"
 
                 # Volume from latest DB bar (intraday IB volume is not valid for daily criterion)
@@ -353,7 +362,7 @@ class MinerviniScanner:
                     result['eod_buy_pending'] = False
 
                 results.append(result)
-                self.db.save_scan_result(result)
+                to_save.append(result)
 
                 if result['qualified']:
                     ab_label = f" | Group={result.get('ab_group', 'N/A')}" if ab_test_enabled else ""
@@ -363,6 +372,8 @@ class MinerviniScanner:
                 logger.error(f"❌ Error scanning {symbol}: {e}")
                 results.append(self._failed_result(symbol, str(e)))
 
+        self.db.save_scan_results_batch(to_save)
+
         qualified_count = sum(1 for r in results if r['qualified'])
         elapsed = (datetime.now(ET) - scan_start).total_seconds()
         logger.info(f"✅ Scan complete: {qualified_count}/{len(results)} qualified | {elapsed:.1f}s total | market={'open' if market_open else 'closed'}")
@@ -421,11 +432,11 @@ class MinerviniScanner:
         """Get list of symbols that qualified."""
         return [r['symbol'] for r in results if r['qualified']]
     
-    def _calculate_sma(self, values: List[float], period: int) -> Optional[float]:
-        """Calculate Simple Moving Average."""
+    def _calculate_sma(self, values, period: int) -> Optional[float]:
+        """Calculate Simple Moving Average (list or NumPy array)."""
         if len(values) < period:
             return None
-        return sum(values[-period:]) / period
+        return float(np.mean(values[-period:]))
     
     def _failed_result(self, symbol: str, reason: str) -> Dict:
         """Create a failed scan result."""
@@ -511,6 +522,7 @@ class PositionMonitor:
             live_prices = {}  # will use DB path below
 
         exits_needed = []
+        to_flag = []   # (symbol, reason) newly triggered — flagged in one batch after the loop
 
         for pos in positions:
             symbol = pos['symbol']
@@ -548,9 +560,9 @@ class PositionMonitor:
                         'trigger_price': stop_loss
                     }
                     exits_needed.append(exit_entry)
-                    # Flag in DB so the morning executor picks it up
+                    # Queue the pending-exit flag (written after the loop)
                     if not pos.get('pending_exit'):
-                        self.db.flag_pending_exit(symbol, 'STOP_LOSS')
+                        to_flag.append((symbol, 'STOP_LOSS'))
                     logger.warning(f"🛑 {symbol} hit STOP LOSS: ${current_price:.2f} <= ${stop_loss:.2f}")
                     continue
 
@@ -575,12 +587,15 @@ class PositionMonitor:
                             'trigger_price': ma_50
                         }
                         exits_needed.append(exit_entry)
-                        # Flag in DB so the morning executor picks it up
+                        # Queue the pending-exit flag (written after the loop)
                         if not pos.get('pending_exit'):
-                            self.db.flag_pending_exit(symbol, 'TREND_BREAK')
+                            to_flag.append((symbol, 'TREND_BREAK'))
                         logger.warning(f"🛑 {symbol} TREND BREAK: ${current_price:.2f} < 50-day MA ${ma_50:.2f}")
 
             except Exception as e:
                 logger.error(f"❌ Error checking exits for {symbol}: {e}")
 
+        # Flag in DB so the morning executor picks them up
+        self.db.flag_pending_exits(to_flag)
+
         return exits_needed
@@ -15,7 +15,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from database import Database
-from data_fetcher import DataFetcher
+from data_fetcher import DataFetcher, IBConnectionPool
 import logging
 import argparse
 from datetime import datetime
@@ -26,20 +26,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+SAVE_BATCH_SIZE = 25  # tickers per bulk bar insert
 
-def bootstrap_data(force=False):
+
+def bootstrap_data(force=False, connections=1):
     """
     Bootstrap historical data for all tickers.
     
     Args:
         force: If True, re-fetch all data even if it exists
+        connections: IB client connections to shard the historical requests
+                     across (>1 uses IBConnectionPool; IB paces per client)
     """
     logger.info("="*60)
     logger.info("BOOTSTRAP: Historical Data Fetch")
     logger.info("="*60)
     
     db = Database()
-    fetcher = DataFetcher()
+    fetcher = IBConnectionPool(size=connections) if connections > 1 else DataFetcher()
     
     # Connect to IB
     if not fetcher.connect():
@@ -62,45 +66,64 @@ def bootstrap_data(force=False):
     skip_count = 0
     error_count = 0
     
+    # Fetch every ticker that needs data up front as one bounded, rate-limited
+    # concurrent batch (sharded across the pool's clients when there is one)
+    latest_dates = {} if force else db.get_latest_bar_dates(tickers)
+    pending = [s for s in tickers if s not in latest_dates]
+    if isinstance(fetcher, IBConnectionPool):
+        logger.info(f"Fetching {len(pending)} tickers across {connections} IB connections...")
+        fetched = fetcher.fetch_historical_bars_sharded(pending, duration='1 Y', bar_size='1 day')
+    else:
+        logger.info(f"Fetching {len(pending)} tickers...")
+        fetched = fetcher.fetch_historical_bars_batch(pending, duration='1 Y', bar_size='1 day')
+    
+    # Bars are written SAVE_BATCH_SIZE symbols at a time in one transaction
+    to_save = {}
+
+    def save_batch():
+        """Flush `to_save`; returns (symbols saved, symbols failed)."""
+        if not to_save:
+            return 0, 0
+        batch = dict(to_save)
+        to_save.clear()
+        if db.save_daily_bars_bulk(batch) > 0:
+            logger.info(f"  ✅ Saved bars for {len(batch)} tickers")
+            return len(batch), 0
+        logger.warning(f"  ⚠️ Failed to save data for {', '.join(batch)}")
+        return 0, len(batch)
+    
     for i, symbol in enumerate(tickers, 1):
         try:
             logger.info(f"[{i}/{len(tickers)}] Processing {symbol}...")
             
             # Check if data already exists (unless force=True)
-            if not force:
-                latest_date = db.get_latest_bar_date(symbol)
-                if latest_date:
-                    logger.info(f"  ✓ Data exists (latest: {latest_date}) - skipping")
-                    skip_count += 1
-                    continue
-            
-            # Fetch 1 year of data
-            logger.info(f"  Fetching 1 year of historical data...")
-            bars = fetcher.fetch_historical_bars(symbol, duration='1 Y', bar_size='1 day')
+            latest_date = latest_dates.get(symbol)
+            if latest_date:
+                logger.info(f"  ✓ Data exists (latest: {latest_date}) - skipping")
+                skip_count += 1
+                continue
             
-            if not bars:
+            bars = fetched.get(symbol, [])
+            if len(bars) == 0:
                 logger.warning(f"  ⚠️ No data returned for {symbol}")
                 error_count += 1
                 continue
             
-            # Save to database
-            saved = db.save_daily_bars(symbol, bars)
-            
-            if saved > 0:
-                logger.info(f"  ✅ Saved {saved} bars for {symbol}")
-                success_count += 1
-            else:
-                logger.warning(f"  ⚠️ Failed to save data for {symbol}")
-                error_count += 1
-            
-            # Rate limiting - don't hammer IB API
-            import time
-            time.sleep(0.5)
+            logger.info(f"  ✓ Fetched {len(bars)} bars")
+            to_save[symbol] = bars
+            if len(to_save) >= SAVE_BATCH_SIZE:
+                saved_ok, saved_failed = save_batch()
+                success_count += saved_ok
+                error_count += saved_failed
             
         except Exception as e:
             logger.error(f"  ❌ Error processing {symbol}: {e}")
             error_count += 1
     
+    saved_ok, saved_failed = save_batch()
+    success_count += saved_ok
+    error_count += saved_failed
+    
     # Disconnect
     fetcher.disconnect()
     
@@ -243,10 +266,7 @@ def add_default_tickers():
         ('ZS', 'Zscaler Inc', 'Technology'),
     ]
     
-    added = 0
-    for symbol, name, sector in default_tickers:
-        if db.add_ticker(symbol, name, sector):
-            added += 1
+    added = db.add_tickers(default_tickers)
     
     logger.info(f"✅ Added {added} default tickers")
     return True
@@ -257,6 +277,8 @@ def main():
     parser = argparse.ArgumentParser(description='Bootstrap historical data')
     parser.add_argument('--force', action='store_true', help='Re-fetch all data even if exists')
     parser.add_argument('--add-tickers', action='store_true', help='Add default ticker list')
+    parser.add_argument('--connections', type=int, default=1,
+                        help='IB client connections to shard historical requests across')
     args = parser.parse_args()
     
     if args.add_tickers:
@@ -265,7 +287,7 @@ def main():
         logger.info("Now run the script again without --add-tickers to fetch data")
         return
     
-    bootstrap_data(force=args.force)
+    bootstrap_data(force=args.force, connections=args.connections)
 
 
 if __name__ == "__main__":
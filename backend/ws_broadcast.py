@@ -0,0 +1,53 @@
+"""
+WebSocket Broadcast for Minervini Trading Bot
+=============================================
+
+One implementation of "send this JSON message to every connected client",
+shared by main, data_updater and order_executor:
+- Serialises each message once (orjson when installed, stdlib json otherwise)
+- Drops sockets that already closed before sending
+- Sends to all clients concurrently, each send bounded by WS_SEND_TIMEOUT
+- Removes clients whose send fails or times out
+"""
+
+import asyncio
+import json
+
+from fastapi.websockets import WebSocketState
+
+try:
+    import orjson
+
+    def dumps(message: dict) -> str:
+        """Serialise a message for a text frame."""
+        try:
+            return orjson.dumps(message).decode()
+        except TypeError:   # e.g. numpy scalars — let the stdlib encoder handle them
+            return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+except ImportError:  # optional speed-up — fall back to the stdlib encoder
+    def dumps(message: dict) -> str:
+        """Serialise a message for a text frame."""
+        return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+WS_SEND_TIMEOUT = 5.0   # seconds before a stalled client is dropped from a broadcast
+
+
+async def broadcast(clients: set, message: dict) -> None:
+    """Send `message` to every socket in `clients` (concurrently), pruning dead ones in place."""
+    if not clients:   # headless (no browser open) — nothing to filter or serialise
+        return
+    # Drop sockets that already closed before sending; a failed send below
+    # still drops a client that disconnects mid-broadcast
+    live = [ws for ws in clients if ws.application_state == WebSocketState.CONNECTED]
+    if len(live) != len(clients):
+        clients.intersection_update(live)
+    if not live:
+        return
+    payload = dumps(message)
+    results = await asyncio.gather(
+        *(asyncio.wait_for(ws.send_text(payload), WS_SEND_TIMEOUT) for ws in live),
+        return_exceptions=True
+    )
+    for ws, result in zip(live, results):
+        if isinstance(result, Exception):
+            clients.discard(ws)
@@ -292,13 +292,19 @@ function App() {
       } else if (data.type === 'data_update_started') {
         setDataUpdateStatus({ status: 'running', total: data.data?.total || 0, done: 0 });
       } else if (data.type === 'data_update_progress') {
+        // Progress arrives batched (data is an array, oldest first); only the latest matters
+        const progress = Array.isArray(data.data) ? data.data[data.data.length - 1] : data.data;
         setDataUpdateStatus(prev => ({
           ...(prev || {}),
           status: 'running',
-          done: data.data?.done || 0,
-          total: data.data?.total || 0,
-          current_symbol: data.data?.current_symbol
+          done: progress?.done || 0,
+          total: progress?.total || 0,
+          current_symbol: progress?.current_symbol
         }));
+      } else if (data.type === 'next_trigger') {
+        if (data.data?.job === 'data_update') {
+          setDataUpdateStatus(prev => ({ ...(prev || {}), next_update_at: data.data.at }));
+        }
       } else if (data.type === 'data_update_complete') {
         setDataUpdateStatus(prev => ({
           ...(prev || {}),